@@ -8,8 +8,11 @@ from textwrap import dedent
 
 from .utils import show_lesson
 from .logger import log_result
+from .spaced_repetition import load_deck
+from .spelling import check_spelling
 
 GREEN = "\033[92m"
+YELLOW = "\033[93m"
 RED = "\033[91m"
 CYAN = "\033[96m"
 BOLD = "\033[1m"
@@ -44,6 +47,9 @@ ALPHABET_CLUES: list[tuple[str, str]] = [
     ("Z", "en anglais britannique 'zed', en américain 'zee'"),
 ]
 
+# Révisions espacées : les mots ratés ou anciens reviennent en premier.
+DECK = load_deck("anglais_alphabet_couleurs")
+
 COLORS_FR_EN: dict[str, list[str]] = {
     "rouge": ["red"],
     "bleu": ["blue"],
@@ -118,10 +124,14 @@ def alphabet_quiz(num_questions: int = 8) -> tuple[int, int]:
     """Quiz that asks for letters based on oral-style clues."""
 
     print(f"{BOLD}🅰️ Exercice 1 : devine la lettre à partir de la description orale{RESET}")
-    questions = random.sample(ALPHABET_CLUES, k=min(num_questions, len(ALPHABET_CLUES)))
+    clues = dict(ALPHABET_CLUES)
+    DECK.introduce(random.sample(list(clues), k=len(clues)))
+    questions = DECK.next_items(num_questions, within=clues)
     score = 0
-    for letter, clue in questions:
+    for letter in questions:
+        clue = clues[letter]
         answer = input(f"Quelle lettre correspond à cette description → {clue} ? ").strip().upper()
+        DECK.record(letter, answer == letter)
         if answer == letter:
             print(f"{GREEN}Yes! C'était bien la lettre {letter}.{RESET}")
             score += 1
@@ -141,9 +151,12 @@ def colors_quiz() -> tuple[int, int]:
     score = 0
     for french, answers in items:
         reply = input(f"Comment écrit-on la couleur « {french} » en anglais ? ").strip().lower()
-        if reply in answers:
+        check = check_spelling(reply, answers)
+        if check.exact:
             print(f"{GREEN}Parfait, {reply} est correct !{RESET}")
             score += 1
+        elif check.near_miss:
+            print(f"{YELLOW}Presque ! Vérifie l'orthographe : on écrit {check.closest}.{RESET}")
         else:
             solutions = ", ".join(answers)
             print(f"{RED}Attention, on écrit {solutions}.{RESET}")
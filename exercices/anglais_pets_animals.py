@@ -10,8 +10,10 @@ from textwrap import dedent
 
 from .utils import show_lesson
 from .logger import log_result
+from .spelling import check_spelling
 
 GREEN = "\033[92m"
+YELLOW = "\033[93m"
 RED = "\033[91m"
 CYAN = "\033[96m"
 BOLD = "\033[1m"
@@ -161,11 +163,15 @@ def spelling_practice(words: list[str] | None = None) -> tuple[int, int]:
         ).strip().lower()
         normalized = answer.replace(" ", "").replace("-", "")
         expected = word.replace(" ", "")
-        if normalized == expected:
+        check = check_spelling(normalized, [expected])
+        spelled = "-".join(list(expected))
+        if check.exact:
             print(f"{GREEN}Excellent! {word} is spelled correctly.{RESET}")
             score += 1
+        elif check.near_miss:
+            typos = "one letter" if check.distance == 1 else f"{check.distance} letters"
+            print(f"{YELLOW}So close! Only {typos} to fix: {word} spells {spelled}.{RESET}")
         else:
-            spelled = "-".join(list(word.replace(" ", "")))
             print(f"{RED}Check again. {word} spells {spelled}.{RESET}")
     total = len(words)
     print(f"\nSpelling score: {score}/{total}.\n")
@@ -5,12 +5,15 @@ from __future__ import annotations
 import random
 from textwrap import dedent
 
+from .distractors import DistractorPool
 from .logger import log_result
+from .spelling import check_spelling
 from .utils import ask_choice_with_navigation, show_lesson
 
 DISPLAY_NAME = "Anglais : School uniform vocabulary"
 
 GREEN = "\033[92m"
+YELLOW = "\033[93m"
 RED = "\033[91m"
 CYAN = "\033[96m"
 BOLD = "\033[1m"
@@ -50,14 +53,19 @@ THINGS: list[dict[str, str]] = [
 ]
 
 
+# Index de similarité : les distracteurs ressemblent à la bonne réponse
+# (mots en commun, orthographe proche) au lieu d'être tirés au hasard.
+EN_POOL = DistractorPool([thing["en"] for thing in THINGS])
+FR_POOL = DistractorPool([thing["fr"] for thing in THINGS])
+
+
 def _mask_word(text: str) -> str:
     return "".join("_" if char.isalpha() else char for char in text)
 
 
-def _quiz_en_from_fr(item: dict[str, str], pool: list[dict[str, str]]) -> bool:
+def _quiz_en_from_fr(item: dict[str, str], pool: DistractorPool = EN_POOL) -> bool:
     prompt = f"Choisis l'expression anglaise pour : {item['fr']}"
-    distractors = [candidate["en"] for candidate in pool if candidate["en"] != item["en"]]
-    options = random.sample(distractors, k=3) + [item["en"]]
+    options = pool.pick(item["en"], 3) + [item["en"]]
     random.shuffle(options)
 
     print(f"\n{BOLD}Quiz 1/2{RESET} — {prompt}")
@@ -76,10 +84,9 @@ def _quiz_en_from_fr(item: dict[str, str], pool: list[dict[str, str]]) -> bool:
     return ok
 
 
-def _quiz_fr_from_en(item: dict[str, str], pool: list[dict[str, str]]) -> bool:
+def _quiz_fr_from_en(item: dict[str, str], pool: DistractorPool = FR_POOL) -> bool:
     prompt = f"Choisis la description française de : {item['en']}"
-    distractors = [candidate["fr"] for candidate in pool if candidate["fr"] != item["fr"]]
-    options = random.sample(distractors, k=3) + [item["fr"]]
+    options = pool.pick(item["fr"], 3) + [item["fr"]]
     random.shuffle(options)
 
     print(f"\n{BOLD}Quiz 2/2{RESET} — {prompt}")
@@ -105,12 +112,15 @@ def _copy_word(item: dict[str, str]) -> bool:
     print(f"Modèle à compléter : {CYAN}{mask}{RESET}")
     typed = input("Ta réponse : ").strip().lower()
 
-    ok = typed == item["en"].lower()
-    if ok:
+    check = check_spelling(typed, [item["en"]])
+    if check.exact:
         print(f"{GREEN}Parfait, orthographe correcte !{RESET}")
+    elif check.near_miss:
+        fautes = "une faute de frappe" if check.distance == 1 else f"{check.distance} fautes de frappe"
+        print(f"{YELLOW}Presque, {fautes}.{RESET} Il fallait écrire : {item['en']}")
     else:
-        print(f"{RED}Presque.{RESET} Il fallait écrire : {item['en']}")
-    return ok
+        print(f"{RED}Raté.{RESET} Il fallait écrire : {item['en']}")
+    return check.exact
 
 
 def main() -> None:
@@ -139,9 +149,9 @@ def main() -> None:
             print(f"\n{CYAN}{BOLD}Élément {index}/30{RESET}")
             print(f"À apprendre : {BOLD}{item['en']}{RESET} → {item['fr']}")
 
-            if _quiz_en_from_fr(item, THINGS):
+            if _quiz_en_from_fr(item):
                 score += 1
-            if _quiz_fr_from_en(item, THINGS):
+            if _quiz_fr_from_en(item):
                 score += 1
             if _copy_word(item):
                 score += 1
@@ -6,6 +6,7 @@ import random
 from textwrap import dedent
 
 from .logger import log_result
+from .spaced_repetition import load_deck
 from .utils import show_lesson
 
 DISPLAY_NAME = "Anglais : Sports and arts actions"
@@ -71,6 +72,9 @@ TRANSLATION_ITEMS: list[tuple[str, str]] = [
     ("jouer de la batterie", "play the drums"),
 ]
 
+# Spaced repetition: missed or long-unseen words come back first.
+DECK = load_deck("anglais_sports_arts_actions")
+
 SOUND_GROUPS: dict[str, set[str]] = {
     "[ɪ]": {"swim", "sing"},
     "[iː]": {"ski", "guitar"},
@@ -110,10 +114,14 @@ def _show_lesson() -> None:
 def _translation_quiz(num_questions: int = 8) -> tuple[int, int]:
     print(f"{BOLD}Part 1 - Translate into English{RESET}")
     score = 0
-    sample = random.sample(TRANSLATION_ITEMS, k=min(num_questions, len(TRANSLATION_ITEMS)))
+    translations = dict(TRANSLATION_ITEMS)
+    DECK.introduce(random.sample(list(translations), k=len(translations)))
+    sample = DECK.next_items(num_questions, within=translations)
 
-    for index, (french, english) in enumerate(sample, start=1):
+    for index, french in enumerate(sample, start=1):
+        english = translations[french]
         answer = input(f"{index}. Comment dit-on '{french}' ? ").strip().lower()
+        DECK.record(french, answer == english)
         if answer == english:
             print(f"{GREEN}Correct!{RESET}")
             score += 1
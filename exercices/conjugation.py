@@ -0,0 +1,506 @@
+"""Rule-based French conjugation.
+
+Regular verbs are conjugated from their group rules (1st group in ``-er``
+with its spelling changes — *lancer*, *manger*, *lever*, *espérer*,
+*appeler*, *acheter*, *nettoyer* — and 2nd group in ``-ir`` / ``-issons``).
+Irregular verbs come from a small lexicon of *models*: each model gives the
+principal parts of one verb (present, first person of the passé simple,
+past participle, future stem) and also conjugates every verb that ends like
+it, so ``prendre`` covers *apprendre* and *comprendre*, ``crire`` covers
+*écrire* and *décrire*.  The other tenses are derived from the principal
+parts as in a grammar book: the imparfait from the ``nous`` form of the
+present, the imperative from the present, the passé composé from the
+auxiliary and the participle.
+
+:func:`conjugate` returns a :data:`Paradigm` (one form per person) and is
+memoised per verb and tense; :func:`paradigm_table` precomputes every tense
+of the whole lexicon into a lookup table.  Forms have no subject pronoun;
+:func:`with_subject` adds one, with the elision of *je*.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+PERSONS = ("je", "tu", "il", "nous", "vous", "ils")
+TENSES = ("present", "imparfait", "futur", "passe_simple", "imperatif", "passe_compose")
+TENSE_LABELS = {
+    "present": "présent",
+    "imparfait": "imparfait",
+    "futur": "futur simple",
+    "passe_simple": "passé simple",
+    "imperatif": "impératif présent",
+    "passe_compose": "passé composé",
+}
+GROUP_LABELS = {1: "1er groupe", 2: "2ᵉ groupe", 3: "3ᵉ groupe"}
+
+# One form per person, in the order of PERSONS; "" where the tense has no
+# form (the imperative only has tu, nous and vous).
+Paradigm = tuple[str, str, str, str, str, str]
+
+PRESENT_ENDINGS_ER = ("e", "es", "e", "ons", "ez", "ent")
+PRESENT_ENDINGS_IR = ("is", "is", "it", "issons", "issez", "issent")
+IMPARFAIT_ENDINGS = ("ais", "ais", "ait", "ions", "iez", "aient")
+FUTUR_ENDINGS = ("ai", "as", "a", "ons", "ez", "ont")
+PASSE_SIMPLE_ENDINGS = {
+    "a": ("ai", "as", "a", "âmes", "âtes", "èrent"),
+    "i": ("is", "is", "it", "îmes", "îtes", "irent"),
+    "u": ("us", "us", "ut", "ûmes", "ûtes", "urent"),
+    "in": ("ins", "ins", "int", "înmes", "întes", "inrent"),
+}
+
+
+class ConjugationError(ValueError):
+    """Raised for a verb the engine cannot conjugate."""
+
+
+@dataclass(frozen=True)
+class _Model:
+    present: tuple[str, ...]  # six forms
+    passe_simple: str         # first person singular
+    participle: str
+    futur: str                # future stem
+    imparfait: str = ""       # stem, when it does not come from "nous"
+
+
+def _model(present: str, passe_simple: str, participle: str, futur: str, imparfait: str = "") -> _Model:
+    return _Model(tuple(present.split()), passe_simple, participle, futur, imparfait)
+
+
+# Irregular models.  A key that is not a whole verb ("crire", "aindre", …)
+# is a common ending; the longest matching key wins.
+_MODELS: dict[str, _Model] = {
+    "être": _model("suis es est sommes êtes sont", "fus", "été", "ser", imparfait="ét"),
+    "avoir": _model("ai as a avons avez ont", "eus", "eu", "aur"),
+    "aller": _model("vais vas va allons allez vont", "allai", "allé", "ir"),
+    "envoyer": _model("envoie envoies envoie envoyons envoyez envoient", "envoyai", "envoyé", "enverr"),
+    # -ir verbs of the 3rd group
+    "venir": _model("viens viens vient venons venez viennent", "vins", "venu", "viendr"),
+    "tenir": _model("tiens tiens tient tenons tenez tiennent", "tins", "tenu", "tiendr"),
+    "partir": _model("pars pars part partons partez partent", "partis", "parti", "partir"),
+    "sortir": _model("sors sors sort sortons sortez sortent", "sortis", "sorti", "sortir"),
+    "dormir": _model("dors dors dort dormons dormez dorment", "dormis", "dormi", "dormir"),
+    "servir": _model("sers sers sert servons servez servent", "servis", "servi", "servir"),
+    "sentir": _model("sens sens sent sentons sentez sentent", "sentis", "senti", "sentir"),
+    "mentir": _model("mens mens ment mentons mentez mentent", "mentis", "menti", "mentir"),
+    "courir": _model("cours cours court courons courez courent", "courus", "couru", "courr"),
+    "mourir": _model("meurs meurs meurt mourons mourez meurent", "mourus", "mort", "mourr"),
+    "vrir": _model("vre vres vre vrons vrez vrent", "vris", "vert", "vrir"),
+    "frir": _model("fre fres fre frons frez frent", "fris", "fert", "frir"),
+    "cueillir": _model("cueille cueilles cueille cueillons cueillez cueillent", "cueillis", "cueilli", "cueiller"),
+    "fuir": _model("fuis fuis fuit fuyons fuyez fuient", "fuis", "fui", "fuir"),
+    "quérir": _model("quiers quiers quiert quérons quérez quièrent", "quis", "quis", "querr"),
+    "vêtir": _model("vêts vêts vêt vêtons vêtez vêtent", "vêtis", "vêtu", "vêtir"),
+    "bouillir": _model("bous bous bout bouillons bouillez bouillent", "bouillis", "bouilli", "bouillir"),
+    # -oir verbs
+    "voir": _model("vois vois voit voyons voyez voient", "vis", "vu", "verr"),
+    "prévoir": _model("prévois prévois prévoit prévoyons prévoyez prévoient", "prévis", "prévu", "prévoir"),
+    "pouvoir": _model("peux peux peut pouvons pouvez peuvent", "pus", "pu", "pourr"),
+    "vouloir": _model("veux veux veut voulons voulez veulent", "voulus", "voulu", "voudr"),
+    "savoir": _model("sais sais sait savons savez savent", "sus", "su", "saur"),
+    "devoir": _model("dois dois doit devons devez doivent", "dus", "dû", "devr"),
+    "cevoir": _model("çois çois çoit cevons cevez çoivent", "çus", "çu", "cevr"),
+    "valoir": _model("vaux vaux vaut valons valez valent", "valus", "valu", "vaudr"),
+    # -re verbs
+    "dre": _model("ds ds d dons dez dent", "dis", "du", "dr"),
+    "prendre": _model("prends prends prend prenons prenez prennent", "pris", "pris", "prendr"),
+    "aindre": _model("ains ains aint aignons aignez aignent", "aignis", "aint", "aindr"),
+    "eindre": _model("eins eins eint eignons eignez eignent", "eignis", "eint", "eindr"),
+    "oindre": _model("oins oins oint oignons oignez oignent", "oignis", "oint", "oindr"),
+    "coudre": _model("couds couds coud cousons cousez cousent", "cousis", "cousu", "coudr"),
+    "soudre": _model("sous sous sout solvons solvez solvent", "solus", "solu", "soudr"),
+    "mettre": _model("mets mets met mettons mettez mettent", "mis", "mis", "mettr"),
+    "battre": _model("bats bats bat battons battez battent", "battis", "battu", "battr"),
+    "rompre": _model("romps romps rompt rompons rompez rompent", "rompis", "rompu", "rompr"),
+    "vaincre": _model("vaincs vaincs vainc vainquons vainquez vainquent", "vainquis", "vaincu", "vaincr"),
+    "faire": _model("fais fais fait faisons faites font", "fis", "fait", "fer"),
+    "dire": _model("dis dis dit disons dites disent", "dis", "dit", "dir"),
+    "disez": _model("dis dis dit disons disez disent", "dis", "dit", "dir"),
+    "crire": _model("cris cris crit crivons crivez crivent", "crivis", "crit", "crir"),
+    "lire": _model("lis lis lit lisons lisez lisent", "lus", "lu", "lir"),
+    "rire": _model("ris ris rit rions riez rient", "ris", "ri", "rir"),
+    "uire": _model("uis uis uit uisons uisez uisent", "uisis", "uit", "uir"),
+    "nuire": _model("nuis nuis nuit nuisons nuisez nuisent", "nuisis", "nui", "nuir"),
+    "aître": _model("ais ais aît aissons aissez aissent", "us", "u", "aîtr"),
+    "connaître": _model("connais connais connaît connaissons connaissez connaissent", "connus", "connu", "connaîtr"),
+    "naître": _model("nais nais naît naissons naissez naissent", "naquis", "né", "naîtr"),
+    "plaire": _model("plais plais plaît plaisons plaisez plaisent", "plus", "plu", "plair"),
+    "taire": _model("tais tais tait taisons taisez taisent", "tus", "tu", "tair"),
+    "boire": _model("bois bois boit buvons buvez boivent", "bus", "bu", "boir"),
+    "croire": _model("crois crois croit croyons croyez croient", "crus", "cru", "croir"),
+    "suivre": _model("suis suis suit suivons suivez suivent", "suivis", "suivi", "suivr"),
+    "vivre": _model("vis vis vit vivons vivez vivent", "vécus", "vécu", "vivr"),
+    "clure": _model("clus clus clut cluons cluez cluent", "clus", "clu", "clur"),
+}
+# Verbs of the "dire" family that say "vous …disez".
+_DISEZ = {"contredire", "interdire", "médire", "prédire"}
+# -ir verbs ending like a 3rd-group model but conjugated like "finir".
+_SECOND_GROUP = {"assortir", "asservir", "répartir"}
+
+_IMPERATIF_IRREGULAR = {
+    "être": ("sois", "soyons", "soyez"),
+    "avoir": ("aie", "ayons", "ayez"),
+    "savoir": ("sache", "sachons", "sachez"),
+    "vouloir": ("veuille", "veuillons", "veuillez"),
+}
+
+# Auxiliary "être" (the verb or any verb ending like it with a prefix that
+# keeps the meaning: revenir, devenir, repartir…).
+_ETRE_VERBS = {
+    "aller", "venir", "devenir", "revenir", "parvenir", "survenir", "intervenir",
+    "arriver", "partir", "repartir", "sortir", "entrer", "rentrer", "rester",
+    "tomber", "retomber", "monter", "remonter", "descendre", "redescendre",
+    "naître", "renaître", "mourir", "retourner", "décéder",
+}
+
+# 1st group: -eler / -eter verbs that take "è" instead of doubling.
+_E_GRAVE_ELER = {
+    "acheter", "racheter", "geler", "congeler", "dégeler", "surgeler", "peler",
+    "modeler", "harceler", "ciseler", "démanteler", "écarteler", "marteler",
+    "crocheter", "fureter", "haleter", "celer",
+}
+# "e" or "é" before the last consonant (or ch, gn, consonant + r/l) of a stem.
+_CONSONANT_CLUSTER = re.compile(r"([eé])(ch|gn|[bcdfgkptv][rl]|[^aâàeéèêëiîïoôuûùüy])$")
+_VOWELS = "aâàeéèêëiîïoôuûùüyœæ"
+# Forms of verbs with an aspirated h keep "je" whole: je hais, je hurle.
+_ASPIRATED_H = ("hai", "haï", "hurl", "hach", "heurt", "hiss", "hauss", "hant", "harc", "hât")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _join(stem: str, ending: str, soft: bool) -> str:
+    """``stem + ending``, keeping the soft c/g of -cer/-ger verbs before a/o."""
+
+    if soft and ending[:1] in ("a", "â", "o"):
+        if stem.endswith("c"):
+            return stem[:-1] + "ç" + ending
+        if stem.endswith("g"):
+            return stem + "e" + ending
+    return stem + ending
+
+
+def _model_for(verb: str) -> Optional[tuple[str, _Model]]:
+    """``(prefix, model)`` of the longest model key ``verb`` ends with."""
+
+    if verb in _DISEZ:
+        return verb[: -len("dire")], _MODELS["disez"]
+    for start in range(len(verb)):
+        model = _MODELS.get(verb[start:])
+        if model is not None:
+            return verb[:start], model
+    return None
+
+
+def group(verb: str) -> int:
+    """Group of ``verb`` (1, 2 or 3; être, avoir and aller count as 3)."""
+
+    if verb.endswith("er") and verb != "aller":
+        return 1
+    if verb == "haïr" or verb.endswith("ir") and not verb.endswith("oir") and (
+        verb in _SECOND_GROUP or _model_for(verb) is None
+    ):
+        return 2
+    return 3
+
+
+def auxiliary(verb: str) -> str:
+    return "être" if verb in _ETRE_VERBS else "avoir"
+
+
+def _e_change(stem: str, verb: str) -> str:
+    """Kind of stem change of a 1st-group verb before a silent ending."""
+
+    if verb.endswith(("oyer", "uyer", "ayer")):
+        return "y"
+    if verb.endswith(("eler", "eter")):
+        return "e" if verb in _E_GRAVE_ELER else "double"
+    match = _CONSONANT_CLUSTER.search(stem)
+    if match and len(stem) > len(match.group(0)):
+        return "e" if match.group(1) == "e" else "é"
+    return ""
+
+
+def _strong_stem(stem: str, change: str) -> str:
+    """Stem used before a silent ``e`` (je lève, j'appelle, je nettoie)."""
+
+    if change == "y":
+        return stem[:-1] + "i"
+    if change == "double":
+        return stem + stem[-1]
+    if change in ("e", "é"):
+        match = _CONSONANT_CLUSTER.search(stem)
+        assert match is not None
+        return stem[: match.start()] + "è" + match.group(2)
+    return stem
+
+
+@dataclass(frozen=True)
+class _Parts:
+    present: tuple[str, ...]
+    passe_simple: tuple[str, ...]
+    participle: str
+    futur: str
+    imparfait: str
+    soft: bool
+
+
+@lru_cache(maxsize=None)
+def _parts(verb: str) -> _Parts:
+    """Principal parts of ``verb``, from its group rules or its model."""
+
+    if verb.endswith("er"):
+        # Only these -er verbs are irregular ("installer" is not "aller").
+        found = _model_for(verb) if verb in ("aller", "envoyer", "renvoyer") else None
+    elif verb.endswith(("re", "ir")) and verb not in _SECOND_GROUP:
+        found = _model_for(verb)
+        if found is None and verb.endswith(("re", "oir")):
+            raise ConjugationError(f"verbe non pris en charge : « {verb} »")
+    elif verb.endswith("ir") or verb == "haïr":
+        found = None  # 2nd group, including the -tir / -vir verbs of _SECOND_GROUP
+    else:
+        raise ConjugationError(f"« {verb} » n'est pas un infinitif")
+
+    if found is not None:
+        prefix, model = found
+        present = tuple(prefix + form for form in model.present)
+        first = prefix + model.passe_simple
+        kind = next(k for k in ("in", "a", "i", "u") if first.endswith(PASSE_SIMPLE_ENDINGS[k][0]))
+        ps_stem = first[: -len(PASSE_SIMPLE_ENDINGS[kind][0])]
+        passe_simple = tuple(ps_stem + ending for ending in PASSE_SIMPLE_ENDINGS[kind])
+        imparfait = prefix + model.imparfait if model.imparfait else present[3][:-3]
+        return _Parts(present, passe_simple, prefix + model.participle, prefix + model.futur, imparfait, False)
+
+    if verb.endswith("er"):
+        stem = verb[:-2]
+        soft = verb.endswith(("cer", "ger"))
+        change = _e_change(stem, verb)
+        strong = _strong_stem(stem, change)
+        present = tuple(
+            _join(strong if person in (0, 1, 2, 5) else stem, ending, soft)
+            for person, ending in enumerate(PRESENT_ENDINGS_ER)
+        )
+        passe_simple = tuple(_join(stem, ending, soft) for ending in PASSE_SIMPLE_ENDINGS["a"])
+        futur = (strong if change in ("y", "double", "e") else stem) + "er"
+        return _Parts(present, passe_simple, stem + "é", futur, stem, soft)
+
+    if verb.endswith("ir") or verb == "haïr":
+        stem = verb[:-2]
+        if verb == "haïr":
+            present = ("hais", "hais", "hait", "haïssons", "haïssez", "haïssent")
+            passe_simple = ("haïs", "haïs", "haït", "haïmes", "haïtes", "haïrent")
+            return _Parts(present, passe_simple, "haï", "haïr", "haïss", False)
+        present = tuple(stem + ending for ending in PRESENT_ENDINGS_IR)
+        passe_simple = tuple(stem + ending for ending in PASSE_SIMPLE_ENDINGS["i"])
+        return _Parts(present, passe_simple, stem + "i", verb, stem + "iss", False)
+
+    raise ConjugationError(f"verbe non pris en charge : « {verb} »")
+
+
+# ---------------------------------------------------------------------------
+# Paradigms
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def conjugate(verb: str, tense: str) -> Paradigm:
+    """All persons of ``verb`` at ``tense`` (one of :data:`TENSES`)."""
+
+    parts = _parts(verb)
+    if tense == "present":
+        return parts.present  # type: ignore[return-value]
+    if tense == "imparfait":
+        return tuple(_join(parts.imparfait, ending, parts.soft) for ending in IMPARFAIT_ENDINGS)  # type: ignore[return-value]
+    if tense == "futur":
+        return tuple(parts.futur + ending for ending in FUTUR_ENDINGS)  # type: ignore[return-value]
+    if tense == "passe_simple":
+        return parts.passe_simple  # type: ignore[return-value]
+    if tense == "imperatif":
+        forms = _IMPERATIF_IRREGULAR.get(verb)
+        if forms is None:
+            tu = parts.present[1]
+            if tu.endswith("es") or tu == "vas":
+                tu = tu[:-1]
+            forms = (tu, parts.present[3], parts.present[4])
+        return ("", forms[0], "", forms[1], forms[2], "")
+    if tense == "passe_compose":
+        aux = auxiliary(verb)
+        helper = conjugate(aux, "present")
+        agree = aux == "être"
+        return tuple(  # type: ignore[return-value]
+            f"{helper[person]} {parts.participle}{'s' if agree and person >= 3 else ''}"
+            for person in range(6)
+        )
+    raise ConjugationError(f"temps inconnu : {tense}")
+
+
+def participle(verb: str) -> str:
+    return _parts(verb).participle
+
+
+def form(verb: str, tense: str, person: int) -> str:
+    """One form; ``person`` indexes :data:`PERSONS`."""
+
+    return conjugate(verb, tense)[person]
+
+
+def ending(verb: str, tense: str, person: int) -> str:
+    """The tense ending of a form, as the terminaison quizzes ask for it.
+
+    Futur and imparfait endings are the same for every verb; for the passé
+    simple and the present of the first two groups the ending is the one
+    of the verb's series (``-âmes``, ``-issons``…).
+    """
+
+    value = form(verb, tense, person)
+    if tense == "futur":
+        candidates: Iterable[str] = (FUTUR_ENDINGS[person],)
+    elif tense == "imparfait":
+        candidates = (IMPARFAIT_ENDINGS[person],)
+    elif tense == "passe_simple":
+        candidates = (series[person] for series in PASSE_SIMPLE_ENDINGS.values())
+    elif tense == "present" and group(verb) in (1, 2):
+        candidates = (PRESENT_ENDINGS_ER[person] if group(verb) == 1 else PRESENT_ENDINGS_IR[person],)
+    else:
+        raise ConjugationError(f"pas de terminaison régulière pour « {verb} » au {TENSE_LABELS.get(tense, tense)}")
+    matching = [candidate for candidate in candidates if value.endswith(candidate)]
+    if not matching:
+        raise ConjugationError(f"terminaison introuvable dans « {value} »")
+    return max(matching, key=len)
+
+
+def with_subject(pronoun: str, value: str) -> str:
+    """``pronoun`` + ``value`` with elision: ``je`` + ``aime`` → ``j'aime``."""
+
+    if pronoun == "je" and (value[:1] in _VOWELS or value[:1] == "h" and not value.startswith(_ASPIRATED_H)):
+        return f"j'{value}"
+    return f"{pronoun} {value}"
+
+
+# ---------------------------------------------------------------------------
+# Lexicon
+# ---------------------------------------------------------------------------
+
+FIRST_GROUP = (
+    "parler", "chanter", "jouer", "regarder", "aimer", "danser", "marcher", "travailler",
+    "arriver", "visiter", "écouter", "dessiner", "habiter", "porter", "demander", "donner",
+    "trouver", "penser", "rester", "tomber", "monter", "entrer", "oublier", "crier",
+    "remercier", "étudier", "lancer", "placer", "commencer", "avancer", "manger", "nager",
+    "plonger", "ranger", "voyager", "partager", "lever", "acheter", "mener", "promener",
+    "peser", "semer", "appeler", "jeter", "épeler", "geler", "espérer", "préférer",
+    "répéter", "céder", "compléter", "nettoyer", "employer", "essuyer", "payer", "essayer",
+    "envoyer", "créer", "continuer", "raconter", "préparer", "fermer", "cacher", "sauter",
+)
+SECOND_GROUP = (
+    "finir", "choisir", "grandir", "réussir", "rougir", "obéir", "applaudir", "maigrir",
+    "remplir", "punir", "bâtir", "salir", "réfléchir", "agir", "nourrir", "guérir",
+    "ralentir", "atterrir", "avertir", "établir", "fournir", "jaillir", "vieillir",
+)
+THIRD_GROUP = (
+    "être", "avoir", "aller", "faire", "dire", "prendre", "apprendre", "comprendre",
+    "surprendre", "mettre", "promettre", "permettre", "venir", "devenir", "revenir",
+    "tenir", "obtenir", "retenir", "partir", "sortir", "dormir", "servir", "sentir",
+    "mentir", "courir", "mourir", "ouvrir", "couvrir", "découvrir", "offrir", "souffrir",
+    "cueillir", "accueillir", "fuir", "acquérir", "voir", "revoir", "prévoir", "pouvoir",
+    "vouloir", "savoir", "devoir", "recevoir", "apercevoir", "décevoir", "valoir",
+    "attendre", "entendre", "répondre", "rendre", "vendre", "perdre", "descendre",
+    "mordre", "peindre", "éteindre", "craindre", "plaindre", "rejoindre", "coudre",
+    "résoudre", "battre", "combattre", "rompre", "interrompre", "vaincre", "écrire",
+    "décrire", "lire", "relire", "rire", "sourire", "conduire", "construire", "détruire",
+    "produire", "traduire", "cuire", "nuire", "connaître", "reconnaître", "paraître",
+    "disparaître", "naître", "plaire", "taire", "boire", "croire", "suivre", "poursuivre",
+    "vivre", "conclure", "interdire", "prédire",
+)
+LEXICON = FIRST_GROUP + SECOND_GROUP + THIRD_GROUP
+
+
+@lru_cache(maxsize=None)
+def paradigm_table() -> dict[tuple[str, str], Paradigm]:
+    """Every tense of every verb of :data:`LEXICON`, computed once."""
+
+    return conjugate_all(LEXICON)
+
+
+def conjugate_all(verbs: Iterable[str], tenses: Iterable[str] = TENSES) -> dict[tuple[str, str], Paradigm]:
+    """``{(verb, tense): paradigm}`` for many verbs at once."""
+
+    tenses = tuple(tenses)
+    return {(verb, tense): conjugate(verb, tense) for verb in verbs for tense in tenses}
+
+
+def check_lexicon() -> list[str]:
+    """Conjugate every tense of :data:`LEXICON` and of the special 2nd-group
+    verbs; return one message per verb that fails or is in the wrong group."""
+
+    errors = []
+    for verb in LEXICON + tuple(sorted(_SECOND_GROUP)):
+        try:
+            conjugate_all((verb,))
+        except ConjugationError as exc:
+            errors.append(f"{verb} : {exc}")
+    errors += [f"{verb} : pas du 2ᵉ groupe" for verb in sorted(_SECOND_GROUP) if group(verb) != 2]
+    return errors
+
+
+def verbs_of_group(number: int) -> tuple[str, ...]:
+    return {1: FIRST_GROUP, 2: SECOND_GROUP, 3: THIRD_GROUP}[number]
+
+
+@dataclass(frozen=True)
+class EndingItem:
+    """One generated "find the ending" question."""
+
+    verb: str
+    group: int
+    person: int
+    stem: str      # the form without its ending
+    ending: str
+
+    @property
+    def form(self) -> str:
+        return self.stem + self.ending
+
+    def blank(self, gap: str = "___") -> str:
+        """Subject and stem with a gap: ``Je viendr___``."""
+
+        return with_subject(PERSONS[self.person], self.stem + gap)
+
+
+def ending_items(
+    tense: str, rng: Optional[random.Random] = None, groups: Iterable[int] = (1, 2, 3)
+) -> Iterator[EndingItem]:
+    """Endless random :class:`EndingItem` of ``tense`` for verbs of ``groups``.
+
+    Each group is drawn as often whatever its size; forms are read from
+    :func:`paradigm_table`.
+    """
+
+    rng = rng or random.Random()
+    groups = tuple(groups)
+    table = paradigm_table()
+    while True:
+        number = groups[rng.randrange(len(groups))]
+        verb = rng.choice(verbs_of_group(number))
+        person = rng.randrange(len(PERSONS))
+        value = table[verb, tense][person]
+        suffix = ending(verb, tense, person)
+        yield EndingItem(verb, number, person, value[: len(value) - len(suffix)], suffix)
+
+
+def main() -> int:
+    """``python -m exercices.conjugation`` : vérifie que tout le lexique se conjugue."""
+
+    errors = check_lexicon()
+    for error in errors:
+        print(f"ÉCHEC    {error}")
+    print(f"{len(LEXICON) + len(_SECOND_GROUP)} verbe(s) vérifié(s), {len(errors)} échec(s).")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Adaptive difficulty shared by the generated exercises.
+
+Each exercise keeps, per skill (``"table de 7"``, ``"chiffre du quotient"``,
+…), a running :class:`SkillEstimate`: an exponential moving average of the
+success rate and a difficulty level between 0 (easiest) and 1 (hardest).
+Every answer moves the level a fixed step towards the difficulty at which
+the learner succeeds :data:`TARGET_SUCCESS` of the time — up a little after
+a success, down more after a mistake — so an update is O(1) and the
+difficulty follows the learner within a session.  Generators ask
+:meth:`Difficulty.level` (or :meth:`Difficulty.hard`) for every question
+instead of rereading past scores from the log.
+
+Estimates are saved to a small JSON file next to the results log, so the
+next session starts where the previous one stopped.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+DIFFICULTY_FILE = Path(__file__).with_name("difficulty.json")
+
+# Success rate the level converges to (the old "hard mode" threshold).
+TARGET_SUCCESS = 0.75
+# Level change per answer: +STEP × 0.25 after a success, −STEP × 0.75 after a mistake.
+STEP = 0.2
+# Weight of the latest answer in the success-rate average.
+SMOOTHING = 0.2
+# Level from which the exercises switch to their hard variants.
+HARD_LEVEL = 0.5
+
+
+@dataclass
+class SkillEstimate:
+    level: float = 0.0               # 0 = easiest, 1 = hardest
+    success: float = TARGET_SUCCESS  # moving average of the success rate
+    answers: int = 0
+
+    def update(self, correct: bool) -> None:
+        outcome = 1.0 if correct else 0.0
+        self.success += SMOOTHING * (outcome - self.success)
+        self.level = round(min(1.0, max(0.0, self.level + STEP * (outcome - TARGET_SUCCESS))), 6)
+        self.answers += 1
+
+
+_estimates: Optional[dict[str, dict[str, SkillEstimate]]] = None
+
+
+def _load() -> dict[str, dict[str, SkillEstimate]]:
+    global _estimates
+    if _estimates is None:
+        _estimates = {}
+        try:
+            with DIFFICULTY_FILE.open(encoding="utf-8") as fh:
+                data = json.load(fh)
+            for exercise, skills in data.items():
+                _estimates[exercise] = {skill: SkillEstimate(**values) for skill, values in skills.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+    return _estimates
+
+
+class Difficulty:
+    """Running skill estimates of one exercise."""
+
+    def __init__(self, exercise: str) -> None:
+        self.exercise = exercise
+
+    def estimate(self, skill: str = "") -> SkillEstimate:
+        skills = _load().setdefault(self.exercise, {})
+        estimate = skills.get(skill)
+        if estimate is None:
+            estimate = skills[skill] = SkillEstimate()
+        return estimate
+
+    def seed(self, skill: str, level: float) -> None:
+        """Start ``skill`` at ``level`` if it has never been practised."""
+
+        estimate = self.estimate(skill)
+        if not estimate.answers:
+            estimate.level = min(1.0, max(0.0, level))
+
+    def level(self, skill: str = "") -> float:
+        return self.estimate(skill).level
+
+    def hard(self, skill: str = "") -> bool:
+        return self.estimate(skill).level >= HARD_LEVEL
+
+    def scaled(self, skill: str, easiest: int, hardest: int) -> int:
+        """Interpolate between ``easiest`` and ``hardest`` at the current level."""
+
+        return round(easiest + (hardest - easiest) * self.level(skill))
+
+    def record(self, skill: str, correct: bool) -> SkillEstimate:
+        """Update ``skill`` after one answer (constant time)."""
+
+        estimate = self.estimate(skill)
+        estimate.update(correct)
+        return estimate
+
+    def save(self) -> None:
+        """Write every estimate to :data:`DIFFICULTY_FILE`."""
+
+        data = {
+            exercise: {skill: asdict(estimate) for skill, estimate in skills.items()}
+            for exercise, skills in _load().items()
+        }
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=".difficulty-", suffix=".json", dir=DIFFICULTY_FILE.parent)
+        except OSError:
+            # Read-only installation: the estimates only last for this session.
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=1)
+            os.replace(tmp_name, DIFFICULTY_FILE)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def load_difficulty(exercise: str) -> Difficulty:
+    """:class:`Difficulty` for ``exercise`` (the file is read on first use)."""
+
+    return Difficulty(exercise)
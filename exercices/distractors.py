@@ -0,0 +1,135 @@
+"""Plausible wrong answers for the multiple-choice quizzes.
+
+A random wrong answer is usually easy to rule out ("a skirt" for "un col
+blanc"); a good distractor looks like the right answer.  This module ranks
+candidates once and then only draws from the best of them:
+
+* :class:`DistractorPool` indexes a vocabulary pool.  The candidates of an
+  item are the items sharing a word with it (found through an inverted
+  index, articles excluded) or its category; they are ranked by shared
+  words, category and edit distance the first time the item is asked,
+  and the ranking is kept for the rest of the session.
+* :func:`product_distractors` does the same for the multiplication tables:
+  neighbouring products, swapped digits and off-by-one-row results, ranked
+  and cached per product.
+
+Drawing ``k`` distractors is then a sample among the ``2k`` best candidates,
+so each call is O(k) and the options still vary from one round to the next.
+"""
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from .spelling import edit_distance, fold
+
+# Words too common to make two answers look alike.
+STOP_WORDS = frozenset({"a", "an", "the", "of", "un", "une", "des", "le", "la", "les", "de", "d'", "du"})
+
+
+def _words(text: str) -> frozenset[str]:
+    return frozenset(word for word in fold(text).replace("'", "' ").split() if word not in STOP_WORDS)
+
+
+def _draw(ranked: Sequence, count: int, rng: Optional[random.Random]) -> list:
+    """``count`` items among the ``2 × count`` best of ``ranked``."""
+
+    best = ranked[: 2 * count]
+    return (rng or random).sample(best, min(count, len(best)))
+
+
+class DistractorPool:
+    """Similarity index over the answers of one quiz.
+
+    ``categories``, if given, holds the category of each item (same order);
+    items of the same category rank above unrelated ones.
+    """
+
+    def __init__(self, items: Sequence[str], categories: Optional[Sequence[str]] = None) -> None:
+        self.items = tuple(dict.fromkeys(items))
+        self._words = {item: _words(item) for item in self.items}
+        self._category = dict(zip(items, categories)) if categories is not None else {}
+        self._by_word: dict[str, list[str]] = {}
+        for item, words in self._words.items():
+            for word in words:
+                self._by_word.setdefault(word, []).append(item)
+        self._by_category: dict[str, list[str]] = {}
+        for item, category in self._category.items():
+            self._by_category.setdefault(category, []).append(item)
+        self._ranked: dict[str, tuple[str, ...]] = {}
+
+    def _score(self, item: str, other: str) -> tuple[int, int, int]:
+        shared = len(self._words[item] & self._words[other])
+        same_category = int(item in self._category and self._category[item] == self._category.get(other))
+        return (-shared, -same_category, edit_distance(fold(item), fold(other)))
+
+    def ranked(self, item: str) -> tuple[str, ...]:
+        """Related items, most similar first (computed once per item)."""
+
+        ranked = self._ranked.get(item)
+        if ranked is None:
+            related = {other for word in self._words.get(item, ()) for other in self._by_word[word]}
+            related.update(self._by_category.get(self._category.get(item, ""), ()))
+            related.discard(item)
+            ranked = self._ranked[item] = tuple(sorted(related, key=lambda other: self._score(item, other)))
+        return ranked
+
+    def pick(self, item: str, count: int, rng: Optional[random.Random] = None) -> list[str]:
+        """``count`` distractors for ``item``, the right answer excluded.
+
+        Items unrelated to ``item`` only fill in when it has too few
+        related ones.
+        """
+
+        picked = _draw(self.ranked(item), count, rng)
+        if len(picked) < count:
+            chosen = set(picked)
+            chosen.add(item)
+            rest = [other for other in self.items if other not in chosen]
+            picked += (rng or random).sample(rest, min(count - len(picked), len(rest)))
+        return picked
+
+
+def _swapped_digits(number: int) -> Optional[int]:
+    digits = str(number)
+    if len(digits) < 2 or digits[-1] == digits[-2] or (len(digits) == 2 and digits[-1] == "0"):
+        return None
+    return int(digits[:-2] + digits[-1] + digits[-2])
+
+
+@lru_cache(maxsize=None)
+def _close_products(n: int, m: int) -> tuple[int, ...]:
+    correct = n * m
+    candidates = [
+        (n - 1) * m, (n + 1) * m, n * (m - 1), n * (m + 1),  # one row or column off
+        (n - 1) * (m + 1), (n + 1) * (m - 1),
+        _swapped_digits(correct),
+        correct - 1, correct + 1, correct - 2, correct + 2,
+        correct - 10, correct + 10, correct - 3, correct + 3,
+    ]
+    return tuple(dict.fromkeys(value for value in candidates if value is not None and value > 0 and value != correct))
+
+
+@lru_cache(maxsize=None)
+def _far_products(n: int, m: int) -> tuple[int, ...]:
+    correct = n * m
+    candidates = ((n + a) * (m + b) for a in range(1, 6) for b in range(1, 6) if a + b > 3)
+    return tuple(dict.fromkeys(value for value in candidates if value != correct))
+
+
+def product_distractors(
+    n: int, m: int, count: int, *, close: bool = True, rng: Optional[random.Random] = None
+) -> list[int]:
+    """``count`` wrong results for ``n × m``.
+
+    Close distractors are the learner's likely mistakes (a neighbouring
+    product, swapped digits); with ``close=False`` they are clearly too
+    big, for beginners, and drawn from all of them.
+    """
+
+    if close:
+        return _draw(_close_products(n, m), count, rng)
+    far = _far_products(n, m)
+    return (rng or random).sample(far, min(count, len(far)))
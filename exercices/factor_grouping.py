@@ -0,0 +1,312 @@
+"""Headless solver for "associate the factors cleverly" products.
+
+A product such as ``2,5 × 17 × 4 × 10`` is easiest to compute by grouping
+first the factors whose product is round (``2,5 × 4 = 10``).  The solver
+enumerates every grouping of two or more factors (not all of them), as the
+bit masks of their positions, and ranks them:
+
+1. how round the group product is: a power of ten (1, 10, 100…) first,
+   then one significant digit (20, 8, 300…), then any whole number, then
+   decimals;
+2. the effort of the whole computation, the group first and then the
+   other factors in order: multiplying by a power of ten is free,
+   otherwise a step costs the product of the numbers of significant
+   digits, plus one when a decimal is involved;
+3. the smaller group.
+
+Factors are parsed once from their French spelling (``"0,25"``) into exact
+decimals, kept as a mantissa and a power of ten so that multiplying them
+stays in integers; results are reported as :class:`~fractions.Fraction`.
+The sub-product and the effort of every group are computed once per mask
+from the mask without its last factor, so solving 8 factors (246
+groupings) takes a few milliseconds, and solutions are memoised per
+factor list.
+
+:func:`generate_problem` builds problems the way the sheet does: one
+"hard" factor (sometimes a second, small one) among round groups and
+powers of ten.  It keeps a problem only if the solver finds a single best
+grouping and the total can still be computed mentally, so the expected
+answers are never ambiguous nor out of reach.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from typing import Optional, Sequence
+
+# Groups with a round product, used to plant the answer of new problems.
+ROUND_GROUPS: tuple[tuple[str, ...], ...] = (
+    ("2", "5"), ("4", "25"), ("2", "50"), ("5", "20"), ("4", "250"), ("8", "125"),
+    ("0,25", "4"), ("2,5", "4"), ("0,5", "2"), ("0,2", "5"), ("1,25", "8"), ("0,4", "25"),
+    ("4", "5", "5"), ("2", "2", "25"), ("2,5", "2", "2"),
+)
+# The one factor of a problem that no round group absorbs.
+HARD_FACTORS: tuple[str, ...] = (
+    "13", "17", "19", "23", "37", "43", "61", "87", "1,3", "3,7", "7,9", "12,3", "4,21", "71,38", "6,3",
+)
+# A possible second non-round factor, small enough to keep the total mental.
+SMALL_FACTORS: tuple[str, ...] = ("3", "7", "9", "11", "12")
+POWERS_OF_TEN: tuple[str, ...] = ("10", "100", "1000", "0,1", "0,01")
+# Totals with more significant digits than this are not mental arithmetic.
+MAX_TOTAL_DIGITS = 4
+
+
+@lru_cache(maxsize=None)
+def parse_number(text: str) -> Fraction:
+    """``"71,38"`` → ``Fraction(3569, 50)``."""
+
+    return Fraction(text.replace(",", ".").replace(" ", ""))
+
+
+def format_number(value: Fraction) -> str:
+    """French decimal spelling of a terminating fraction: ``Fraction(7, 2)`` → ``"3,5"``."""
+
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    whole, rest = divmod(value.numerator, value.denominator)
+    digits = ""
+    while rest:
+        rest *= 10
+        digit, rest = divmod(rest, value.denominator)
+        digits += str(digit)
+        if len(digits) > 12:
+            raise ValueError(f"{value} has no short decimal spelling")
+    return f"{sign}{whole},{digits}" if digits else f"{sign}{whole}"
+
+
+# Exact decimals as (mantissa without trailing zeros, power of ten):
+# 2,5 → (25, -1), 300 → (3, 2).  Multiplying them is two integer operations.
+_Exact = tuple[int, int]
+
+
+def _exact(value: Fraction) -> _Exact:
+    shift = 0
+    while (value.numerator * 10**shift) % value.denominator:
+        shift += 1
+        if shift > 30:
+            raise ValueError(f"{value} is not a decimal number")
+    return _normal(value.numerator * 10**shift // value.denominator, -shift)
+
+
+def _normal(mantissa: int, exponent: int) -> _Exact:
+    while mantissa and mantissa % 10 == 0:
+        mantissa //= 10
+        exponent += 1
+    return mantissa, exponent
+
+
+def _times(left: _Exact, right: _Exact) -> _Exact:
+    return _normal(left[0] * right[0], left[1] + right[1])
+
+
+def _fraction(value: _Exact) -> Fraction:
+    mantissa, exponent = value
+    return Fraction(mantissa * 10**exponent) if exponent >= 0 else Fraction(mantissa, 10**-exponent)
+
+
+def _roundness(value: _Exact) -> int:
+    mantissa, exponent = value
+    if mantissa == 1:
+        return 0
+    if exponent >= 0:
+        return 1 if mantissa < 10 else 2
+    return 3
+
+
+def _step_cost(left: _Exact, right: _Exact) -> int:
+    if left[0] == 1 or right[0] == 1:
+        return 0
+    decimals = left[1] < 0 or right[1] < 0
+    return len(str(left[0])) * len(str(right[0])) + decimals
+
+
+def roundness(value: Fraction) -> int:
+    """0 for a power of ten, 1 for one significant digit, 2 for a whole number, 3 otherwise."""
+
+    return _roundness(_exact(value))
+
+
+def step_cost(left: Fraction, right: Fraction) -> int:
+    """Mental effort of ``left × right``: free by a power of ten, else the
+    product of the numbers of significant digits, plus one with a decimal."""
+
+    return _step_cost(_exact(left), _exact(right))
+
+
+@dataclass(frozen=True)
+class Grouping:
+    """One way to start: compute ``group`` first, then the ``rest``."""
+
+    positions: tuple[int, ...]  # indices of the grouped factors
+    group: tuple[str, ...]
+    rest: tuple[str, ...]
+    product: Fraction           # value of the group
+    total: Fraction             # value of the whole product
+    roundness: int
+    cost: int
+
+    @property
+    def rank(self) -> tuple[int, int, int]:
+        return (self.roundness, self.cost, len(self.group))
+
+    @property
+    def signature(self) -> tuple[str, ...]:
+        """The grouped factors regardless of which copy of a repeated factor is used."""
+
+        return tuple(sorted(self.group))
+
+
+@lru_cache(maxsize=1024)
+def solve(factors: tuple[str, ...]) -> tuple[Grouping, ...]:
+    """Every grouping of ``factors``, best first (ties keep the position order)."""
+
+    values = [_exact(parse_number(factor)) for factor in factors]
+    count = len(values)
+    if count < 3:
+        raise ValueError("at least three factors are needed to group some of them")
+    full = (1 << count) - 1
+    product: list[_Exact] = [(1, 0)] * (1 << count)
+    effort = [0] * (1 << count)
+    for mask in range(1, 1 << count):
+        last = mask.bit_length() - 1
+        previous = mask & ~(1 << last)
+        product[mask] = _times(product[previous], values[last])
+        effort[mask] = effort[previous] + _step_cost(product[previous], values[last]) if previous else 0
+
+    groupings = []
+    total = _fraction(product[full])
+    for mask in range(1, full):
+        if mask & (mask - 1) == 0:
+            continue  # a single factor is not a group
+        cost, running = effort[mask], product[mask]
+        for index in range(count):
+            if not mask >> index & 1:
+                cost += _step_cost(running, values[index])
+                running = _times(running, values[index])
+        positions = tuple(index for index in range(count) if mask >> index & 1)
+        groupings.append(
+            Grouping(
+                positions,
+                tuple(factors[index] for index in positions),
+                tuple(factors[index] for index in range(count) if not mask >> index & 1),
+                _fraction(product[mask]),
+                total,
+                _roundness(product[mask]),
+                cost,
+            )
+        )
+    groupings.sort(key=lambda grouping: grouping.rank)
+    return tuple(groupings)
+
+
+def best_grouping(factors: Sequence[str]) -> Grouping:
+    return solve(tuple(factors))[0]
+
+
+def has_unique_best(factors: Sequence[str]) -> bool:
+    """Whether one grouping is strictly better than every different one,
+    and the total has at most :data:`MAX_TOTAL_DIGITS` significant digits."""
+
+    ranked = solve(tuple(factors))
+    best = ranked[0]
+    if len(str(_exact(best.total)[0])) > MAX_TOTAL_DIGITS:
+        return False
+    return all(
+        other.rank > best.rank for other in ranked[1:] if other.signature != best.signature
+    )
+
+
+def generate_problem(
+    count: int, rng: Optional[random.Random] = None, attempts: int = 200
+) -> tuple[str, ...]:
+    """``count`` factors (3 to 8) with a single, round best grouping.
+
+    One hard factor, a second small one in half of the longer problems,
+    and round groups or powers of ten for the rest.
+    """
+
+    rng = rng or random.Random()
+    for _ in range(attempts):
+        factors = [rng.choice(HARD_FACTORS)]
+        if count >= 5 and rng.random() < 0.5:
+            factors.append(rng.choice(SMALL_FACTORS))
+        while len(factors) < count:
+            groups = [group for group in ROUND_GROUPS if len(group) <= count - len(factors)]
+            if groups and rng.random() < 0.75:
+                factors += rng.choice(groups)
+            else:
+                factors.append(rng.choice(POWERS_OF_TEN))
+        rng.shuffle(factors)
+        if has_unique_best(factors) and best_grouping(factors).roundness <= 1:
+            return tuple(factors)
+    raise RuntimeError(f"no unambiguous problem with {count} factors found")
+
+
+def group_distractors(factors: Sequence[str], count: int = 3) -> list[tuple[str, ...]]:
+    """The next best groupings, as factor tuples different from the best one."""
+
+    ranked = solve(tuple(factors))
+    seen = {ranked[0].signature}
+    picked = []
+    for grouping in ranked[1:]:
+        if grouping.signature not in seen:
+            seen.add(grouping.signature)
+            picked.append(grouping.group)
+            if len(picked) == count:
+                break
+    return picked
+
+
+def wrong_rewrites(
+    factors: Sequence[str], count: int = 2, rng: Optional[random.Random] = None
+) -> list[tuple[tuple[str, ...], tuple[str, ...]]]:
+    """``(group, rest)`` rewrites that look like the best one but change the product.
+
+    Half forget one of the other factors, half write one of them twice in
+    place of a grouped factor; every one of them has a different value.
+    """
+
+    rng = rng or random.Random()
+    best = best_grouping(factors)
+    forgotten = [(best.group, best.rest[:index] + best.rest[index + 1:]) for index in range(len(best.rest))]
+    if not best.rest:
+        forgotten = [(best.group[:index] + best.group[index + 1:], ()) for index in range(len(best.group))]
+    swapped = [
+        (best.group[:index] + (other,) + best.group[index + 1:], best.rest)
+        for index in range(len(best.group))
+        for other in best.rest
+    ]
+    picked: list[tuple[tuple[str, ...], tuple[str, ...]]] = []
+    values = {best.total}
+    for kind in rng.sample([forgotten, swapped], 2) * count:
+        for group, rest in rng.sample(kind, len(kind)):
+            value = _fraction(_product(group + rest))
+            if value not in values:
+                values.add(value)
+                picked.append((group, rest))
+                break
+        if len(picked) == count:
+            break
+    return picked
+
+
+def wrong_results(factors: Sequence[str]) -> list[Fraction]:
+    """Likely wrong totals: the comma moved either way, or a factor forgotten."""
+
+    best = best_grouping(factors)
+    candidates = [best.total * 10, best.total / 10]
+    candidates += [
+        _fraction(_product(best.group + best.rest[:index] + best.rest[index + 1:])) for index in range(len(best.rest))
+    ]
+    candidates.append(best.total + 10)
+    return list(dict.fromkeys(value for value in candidates if value != best.total))[:3]
+
+
+def _product(factors: Sequence[str]) -> _Exact:
+    value: _Exact = (1, 0)
+    for factor in factors:
+        value = _times(value, _exact(parse_number(factor)))
+    return value
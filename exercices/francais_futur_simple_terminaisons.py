@@ -4,7 +4,10 @@ from __future__ import annotations
 
 DISPLAY_NAME = "Français : Futur simple (terminaisons)"
 
-from .logger import log_result
+from dataclasses import replace
+
+from .conjugation import GROUP_LABELS, PERSONS, EndingItem, ending_items, with_subject
+from .quiz_engine import FRENCH_TEXTS, AnswerSet, Question, QuizResult, log_results, run_quiz
 from .utils import show_lesson
 
 LESSON = """
@@ -29,8 +32,16 @@ Au futur simple, les terminaisons sont les mêmes pour tous les groupes :
 
 🎯 Dans ce quiz, tu dois écrire **uniquement la terminaison** qui manque.
 Exemple : "je parler___" → réponse : **ai**
+
+🔁 En **entraînement libre**, les phrases sont tirées au hasard parmi plus de
+cent verbes, par séries de 20 : tu t'arrêtes quand tu veux.
 """
 
+# Nombre de questions par série d'entraînement libre.
+PRACTICE_SERIES = 20
+
+TEXTS = replace(FRENCH_TEXTS, header="", answer_prompt="Terminaison : ")
+
 QUESTIONS = [
     {
         "prompt": "1. 1er groupe (chanter) — Je chanter___ ce soir.",
@@ -245,30 +256,59 @@ QUESTIONS = [
 ]
 
 
+def _question(question: dict) -> Question:
+    return Question(
+        question["prompt"],
+        answers=AnswerSet.build(question["answers"], keep_accents=True),
+        feedback=(
+            "❌ Ce n'est pas la bonne terminaison. "
+            f"Pour '{question['verb']}', la réponse attendue est : {question['answers'][0]}.",
+            f"ℹ️ {question['explanation']}",
+        ),
+    )
+
+
+def _generated_question(item: EndingItem) -> Question:
+    """Question d'entraînement libre construite par le moteur de conjugaison."""
+
+    return _question(
+        {
+            "prompt": f"{GROUP_LABELS[item.group]} ({item.verb}) — {item.blank().capitalize()}",
+            "answers": [item.ending],
+            "verb": item.verb,
+            "explanation": f"{with_subject(PERSONS[item.person], item.form).capitalize()} : terminaison -{item.ending}.",
+        }
+    )
+
+
+def _free_practice() -> list[QuizResult]:
+    """Séries de questions générées, tant que l'élève en redemande."""
+
+    items = ending_items("futur")
+    results: list[QuizResult] = []
+    while True:
+        result = run_quiz(
+            "francais_futur_simple_terminaisons",
+            (_generated_question(next(items)) for _ in range(PRACTICE_SERIES)),
+            total=PRACTICE_SERIES,
+            texts=TEXTS,
+            log=False,
+        )
+        results.append(result)
+        if input("Une autre série ? (o/n) : ").strip().lower() not in ("o", "oui"):
+            return results
+
+
 def main() -> None:
     """Affiche la leçon puis lance le quiz sur les terminaisons du futur simple."""
 
     show_lesson(LESSON)
     print("Tape uniquement la terminaison manquante (exemple : ai, as, a, ons, ez, ont).")
-    score = 0
-    total = len(QUESTIONS)
-    for question in QUESTIONS:
-        print(f"\n{question['prompt']}")
-        answer = input("Terminaison : ").strip().lower().replace("-", "")
-        valid_answers = [option.lower() for option in question["answers"]]
-        if answer in valid_answers:
-            print("✅ Bravo !")
-            score += 1
-        else:
-            correct = question["answers"][0]
-            print(
-                "❌ Ce n'est pas la bonne terminaison. "
-                f"Pour '{question['verb']}', la réponse attendue est : {correct}."
-            )
-            print(f"ℹ️ {question['explanation']}")
-    print(f"\nScore final : {score}/{total}")
-    percentage = score / total * 100 if total else 0.0
-    log_result("francais_futur_simple_terminaisons", percentage)
+    mode = input("Choisis : (Q)uiz de la leçon ou (E)ntraînement libre : ").strip().lower()
+    if mode.startswith("e"):
+        log_results("francais_futur_simple_terminaisons", _free_practice())
+        return
+    run_quiz("francais_futur_simple_terminaisons", map(_question, QUESTIONS), texts=TEXTS)
 
 
 if __name__ == "__main__":
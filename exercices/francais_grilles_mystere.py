@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
 import random
 import string
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 from prompt_toolkit import Application
 from prompt_toolkit.formatted_text import FormattedText
@@ -26,6 +37,10 @@ class Orientation(Enum):
     TOP_TO_BOTTOM = (1, 0)
     RIGHT_TO_LEFT = (0, -1)  # prévu pour de futurs thèmes
     BOTTOM_TO_TOP = (-1, 0)  # prévu pour de futurs thèmes
+    DOWN_RIGHT = (1, 1)  # diagonales, prévues pour de futurs thèmes
+    DOWN_LEFT = (1, -1)
+    UP_RIGHT = (-1, 1)
+    UP_LEFT = (-1, -1)
 
     @property
     def delta(self) -> Tuple[int, int]:
@@ -82,13 +97,58 @@ class GridGenerationError(RuntimeError):
     """Erreur levée quand un placement de mots échoue."""
 
 
+class _OccupancyGrid:
+    """Grille de lettres doublée de masques de bits d'occupation.
+
+    Chaque ligne, colonne et diagonale possède un entier dont les bits
+    indiquent les cases déjà prises.  Savoir si une suite de cases est libre,
+    quelle que soit l'orientation, revient alors à un seul ``&`` entre un
+    masque et une plage de bits, au lieu de parcourir les cases une à une.
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.cells: List[List[Optional[str]]] = [[None for _ in range(cols)] for _ in range(rows)]
+        self.row_masks = [0] * rows
+        self.col_masks = [0] * cols
+        # Diagonales « descendantes » indexées par ``col - row + rows - 1`` et
+        # « montantes » indexées par ``row + col`` ; le bit est la ligne.
+        self.diag_masks = [0] * (rows + cols - 1)
+        self.anti_diag_masks = [0] * (rows + cols - 1)
+
+    def is_free_run(self, row: int, col: int, delta_row: int, delta_col: int, length: int) -> bool:
+        """Indique si ``length`` cases depuis ``(row, col)`` sont toutes libres."""
+
+        run = (1 << length) - 1
+        if delta_row == 0:
+            low = min(col, col + (length - 1) * delta_col)
+            return not self.row_masks[row] & (run << low)
+        low = min(row, row + (length - 1) * delta_row)
+        if delta_col == 0:
+            mask = self.col_masks[col]
+        elif delta_row == delta_col:
+            mask = self.diag_masks[col - row + self.rows - 1]
+        else:
+            mask = self.anti_diag_masks[row + col]
+        return not mask & (run << low)
+
+    def place(self, coords: Sequence[Tuple[int, int]], letters: str) -> None:
+        for (row, col), letter in zip(coords, letters):
+            self.cells[row][col] = letter
+            self.row_masks[row] |= 1 << col
+            self.col_masks[col] |= 1 << row
+            self.diag_masks[col - row + self.rows - 1] |= 1 << row
+            self.anti_diag_masks[row + col] |= 1 << row
+
+
 def _generate_grid(theme: MysteryTheme, *, rng: random.Random) -> Tuple[List[List[str]], Tuple[WordPlacement, ...]]:
     rows, cols = theme.grid_size
     attempts = 0
     max_attempts = 200
     while attempts < max_attempts:
         attempts += 1
-        grid: List[List[Optional[str]]] = [[None for _ in range(cols)] for _ in range(rows)]
+        grid = _OccupancyGrid(rows, cols)
         placements: List[WordPlacement] = []
         word_specs = list(enumerate(theme.words))
         rng.shuffle(word_specs)
@@ -100,8 +160,8 @@ def _generate_grid(theme: MysteryTheme, *, rng: random.Random) -> Tuple[List[Lis
                 break
             placements.append(placement)
         if success:
-            _fill_grid(grid, theme.filler_alphabet, rng)
-            return [[cell or "X" for cell in row] for row in grid], tuple(placements)
+            _fill_grid(grid.cells, theme.filler_alphabet, rng)
+            return [[cell or "X" for cell in row] for row in grid.cells], tuple(placements)
     raise GridGenerationError(
         f"Impossible de générer une grille pour le thème '{theme.name}' après {max_attempts} essais."
     )
@@ -110,52 +170,46 @@ def _generate_grid(theme: MysteryTheme, *, rng: random.Random) -> Tuple[List[Lis
 def _place_word(
     word: MysteryWord,
     sentence_index: int,
-    grid: List[List[Optional[str]]],
+    grid: _OccupancyGrid,
     rng: random.Random,
+    orientations: Sequence[Orientation] = ACTIVE_ORIENTATIONS,
 ) -> Optional[WordPlacement]:
-    rows = len(grid)
-    cols = len(grid[0]) if rows else 0
-    orientation_options = list(ACTIVE_ORIENTATIONS)
+    length = len(word.grid)
+    orientation_options = list(orientations)
     rng.shuffle(orientation_options)
     for orientation in orientation_options:
         delta_row, delta_col = orientation.delta
-        candidate_starts = _candidate_starts(word.grid, rows, cols, delta_row, delta_col)
+        candidate_starts = list(_candidate_starts(length, grid.rows, grid.cols, delta_row, delta_col))
         rng.shuffle(candidate_starts)
         for start_row, start_col in candidate_starts:
-            coords: List[Tuple[int, int]] = []
-            valid = True
-            row, col = start_row, start_col
-            for letter in word.grid:
-                cell = grid[row][col]
-                if cell is not None:
-                    valid = False
-                    break
-                coords.append((row, col))
-                row += delta_row
-                col += delta_col
-            if valid:
-                for (r, c), letter in zip(coords, word.grid):
-                    grid[r][c] = letter
-                return WordPlacement(word=word, coordinates=tuple(coords), sentence_index=sentence_index)
+            if grid.is_free_run(start_row, start_col, delta_row, delta_col, length):
+                coords = tuple(
+                    (start_row + step * delta_row, start_col + step * delta_col) for step in range(length)
+                )
+                grid.place(coords, word.grid)
+                return WordPlacement(word=word, coordinates=coords, sentence_index=sentence_index)
     return None
 
 
+@lru_cache(maxsize=None)
 def _candidate_starts(
-    word: str,
+    length: int,
     rows: int,
     cols: int,
     delta_row: int,
     delta_col: int,
-) -> List[Tuple[int, int]]:
-    length = len(word)
-    valid_starts: List[Tuple[int, int]] = []
-    for row in range(rows):
-        for col in range(cols):
-            end_row = row + (length - 1) * delta_row
-            end_col = col + (length - 1) * delta_col
-            if 0 <= end_row < rows and 0 <= end_col < cols:
-                valid_starts.append((row, col))
-    return valid_starts
+) -> Tuple[Tuple[int, int], ...]:
+    """Renvoie les départs possibles pour un mot de ``length`` lettres.
+
+    Le résultat ne dépend que des dimensions et de l'orientation : il est
+    calculé une seule fois et partagé entre tous les mots et tous les essais.
+    """
+
+    span_row = (length - 1) * delta_row
+    span_col = (length - 1) * delta_col
+    row_range = range(max(0, -span_row), min(rows, rows - span_row))
+    col_range = range(max(0, -span_col), min(cols, cols - span_col))
+    return tuple((row, col) for row in row_range for col in col_range)
 
 
 def _fill_grid(grid: List[List[Optional[str]]], alphabet: str, rng: random.Random) -> None:
@@ -166,13 +220,193 @@ def _fill_grid(grid: List[List[Optional[str]]], alphabet: str, rng: random.Rando
                 grid[row_index][col_index] = rng.choice(letters)
 
 
+@dataclass(frozen=True)
+class SeededGrid:
+    """Grille générée à partir d'une graine, qu'on peut donc régénérer à l'identique."""
+
+    seed: int
+    grid: Tuple[Tuple[str, ...], ...]
+    placements: Tuple[WordPlacement, ...]
+
+
+def generate_seeded_grid(theme: MysteryTheme, seed: int) -> SeededGrid:
+    """Génère la grille de ``theme`` correspondant à ``seed``."""
+
+    grid, placements = _generate_grid(theme, rng=random.Random(seed))
+    return SeededGrid(seed=seed, grid=tuple(tuple(row) for row in grid), placements=placements)
+
+
+GRID_CACHE_FILE = Path(__file__).with_name("grilles_mystere_cache.json")
+GRID_CACHE_SIZE = 3
+# À incrémenter dès que l'algorithme de génération change : une même graine
+# ne donnerait plus la même grille, donc les entrées existantes deviennent
+# invalides.
+_GENERATOR_VERSION = 1
+
+
+def theme_cache_key(theme: MysteryTheme) -> str:
+    """Clé de cache qui dépend du contenu du thème et de la taille de grille."""
+
+    payload = {
+        "version": _GENERATOR_VERSION,
+        "name": theme.name,
+        "words": [[word.display, word.grid] for word in theme.words],
+        "grid_size": list(theme.grid_size),
+        "filler_alphabet": theme.filler_alphabet,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _grid_to_json(seeded: SeededGrid) -> dict:
+    return {
+        "seed": seeded.seed,
+        "grid": ["".join(row) for row in seeded.grid],
+        "placements": [
+            [placement.sentence_index, [list(coord) for coord in placement.coordinates]]
+            for placement in seeded.placements
+        ],
+    }
+
+
+def _grid_from_json(theme: MysteryTheme, data: dict) -> SeededGrid:
+    grid = tuple(tuple(row) for row in data["grid"])
+    placements = []
+    for sentence_index, coordinates in data["placements"]:
+        word = theme.words[sentence_index]
+        coords = tuple((int(row), int(col)) for row, col in coordinates)
+        if "".join(grid[row][col] for row, col in coords) != word.grid:
+            raise ValueError("Entrée de cache incohérente avec le thème.")
+        placements.append(WordPlacement(word=word, coordinates=coords, sentence_index=sentence_index))
+    return SeededGrid(seed=int(data["seed"]), grid=grid, placements=tuple(placements))
+
+
+class GridPool:
+    """Réserve de grilles pré-générées, conservée dans un petit cache sur disque.
+
+    Rien n'est généré au lancement : :meth:`take` sert une grille déjà prête
+    quand il y en a une (ne générant de façon synchrone qu'en dernier
+    recours), puis un fil d'exécution en arrière-plan complète la réserve du
+    seul thème joué jusqu'à ``GRID_CACHE_SIZE`` grilles.  Ajouter des
+    centaines de thèmes ne coûte donc rien au démarrage.  Chaque grille garde
+    sa graine pour pouvoir être rejouée.
+    """
+
+    def __init__(self, themes: Sequence[MysteryTheme], path: Path = GRID_CACHE_FILE) -> None:
+        self.themes = tuple(themes)
+        self.path = path
+        self._lock = threading.Lock()
+        self._cache: Dict[str, List[dict]] = self._load()
+        self._pending: List[MysteryTheme] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def _load(self) -> Dict[str, List[dict]]:
+        try:
+            with self.path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        valid_keys = {theme_cache_key(theme) for theme in self.themes}
+        return {key: entries for key, entries in data.items() if key in valid_keys and isinstance(entries, list)}
+
+    def _save(self) -> None:
+        """Écrit le cache sur disque, hors du verrou, via un fichier temporaire."""
+
+        with self._lock:
+            payload = json.dumps(self._cache, ensure_ascii=False)
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(payload)
+                os.replace(tmp_name, self.path)
+            except OSError:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass  # le cache n'est qu'une optimisation
+
+    def start(self, themes: Sequence[MysteryTheme]) -> None:
+        """Lance en arrière-plan le remplissage de la réserve de ``themes``."""
+
+        with self._lock:
+            self._pending.extend(theme for theme in themes if theme not in self._pending)
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="grilles-mystere-pool", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                themes, self._pending = self._pending, []
+            self.fill(themes)
+
+    def fill(self, themes: Optional[Sequence[MysteryTheme]] = None) -> None:
+        """Complète la réserve de ``themes`` (par défaut de tous les thèmes)."""
+
+        seeder = random.SystemRandom()
+        added = False
+        for theme in self.themes if themes is None else themes:
+            key = theme_cache_key(theme)
+            while True:
+                with self._lock:
+                    if len(self._cache.get(key, [])) >= GRID_CACHE_SIZE:
+                        break
+                try:
+                    seeded = generate_seeded_grid(theme, seeder.randrange(2**32))
+                except GridGenerationError:
+                    break
+                with self._lock:
+                    self._cache.setdefault(key, []).append(_grid_to_json(seeded))
+                added = True
+        # Une seule écriture par passage, et non une par grille générée.
+        if added:
+            self._save()
+
+    def take(self, theme: MysteryTheme) -> SeededGrid:
+        """Renvoie une grille prête pour ``theme`` et relance le remplissage de sa réserve."""
+
+        key = theme_cache_key(theme)
+        seeded: Optional[SeededGrid] = None
+        with self._lock:
+            entries = self._cache.get(key, [])
+            while entries and seeded is None:
+                try:
+                    seeded = _grid_from_json(theme, entries.pop(0))
+                except (KeyError, IndexError, TypeError, ValueError):
+                    continue
+        self._save()
+        if seeded is None:
+            seeded = generate_seeded_grid(theme, random.SystemRandom().randrange(2**32))
+        self.start([theme])
+        return seeded
+
+
 class MysterySentenceGame:
     """Jeu interactif basé sur prompt_toolkit pour découvrir une phrase."""
 
-    def __init__(self, theme: MysteryTheme, *, rng: Optional[random.Random] = None) -> None:
+    def __init__(
+        self,
+        theme: MysteryTheme,
+        *,
+        rng: Optional[random.Random] = None,
+        seeded_grid: Optional[SeededGrid] = None,
+    ) -> None:
         self.theme = theme
         self.rng = rng or random.Random()
-        self.grid, self.placements = _generate_grid(theme, rng=self.rng)
+        self.seed: Optional[int] = None
+        if seeded_grid is not None:
+            self.seed = seeded_grid.seed
+            self.grid = [list(row) for row in seeded_grid.grid]
+            self.placements = seeded_grid.placements
+        else:
+            self.grid, self.placements = _generate_grid(theme, rng=self.rng)
         self.cursor_row = 0
         self.cursor_col = 0
         self.current_word: Optional[WordPlacement] = None
@@ -181,6 +415,17 @@ class MysterySentenceGame:
         }
         self.typed_words: Dict[int, List[str]] = {placement.sentence_index: [] for placement in self.placements}
         self.completed_words: set[int] = set()
+        # Cache de rendu : fragments par ligne de la grille (``None`` = à
+        # recalculer) et lignes occupées par chaque mot, pour n'invalider que
+        # les lignes touchées par un déplacement ou un changement d'état.
+        self._row_fragments: List[Optional[List[Tuple[str, str]]]] = [None] * len(self.grid)
+        self._placement_rows: Dict[int, FrozenSet[int]] = {
+            placement.sentence_index: frozenset(row for row, _ in placement.coordinates)
+            for placement in self.placements
+        }
+        self._ordered_placements: Tuple[WordPlacement, ...] = tuple(
+            sorted(self.placements, key=lambda wp: wp.sentence_index)
+        )
         self.message = (
             "Utilise les flèches pour parcourir la grille. Tape les lettres pour copier le mot. "
             "Retour arrière efface la dernière lettre. Échap pour quitter."
@@ -196,7 +441,7 @@ class MysterySentenceGame:
         dictation_window = Window(content=self.dictation_control, height=len(self.theme.words) + 3)
 
         self.message_control = FormattedTextControl(self._render_message, show_cursor=False)
-        message_window = Window(content=self.message_control, height=2)
+        message_window = Window(content=self.message_control, height=3)
 
         container = HSplit([grid_window, dictation_window, message_window])
 
@@ -229,32 +474,45 @@ class MysterySentenceGame:
     # --------------------------------------------------------------- render --
     def _render_grid(self) -> FormattedText:
         fragments: List[Tuple[str, str]] = []
-        width = len(self.grid[0])
-        for row_index, row in enumerate(self.grid):
-            for col_index, letter in enumerate(row):
-                style = "class:grid"
-                word = self.word_lookup.get((row_index, col_index))
-                if word:
-                    if word.sentence_index in self.completed_words:
-                        style = "class:grid.word-complete"
-                    elif word == self.current_word:
-                        style = "class:grid.word-active"
-                elif row_index == self.cursor_row and col_index == self.cursor_col:
-                    style = "class:grid.cursor"
-
-                fragments.append((style, letter))
-                if col_index != width - 1:
-                    fragments.append(("", " "))
-
-            if row_index != len(self.grid) - 1:
-                fragments.append(("", "\n"))
+        for row_index, cached in enumerate(self._row_fragments):
+            if cached is None:
+                cached = self._row_fragments[row_index] = self._render_row(row_index)
+            fragments.extend(cached)
+        return fragments
 
+    def _render_row(self, row_index: int) -> List[Tuple[str, str]]:
+        fragments: List[Tuple[str, str]] = []
+        row = self.grid[row_index]
+        width = len(row)
+        for col_index, letter in enumerate(row):
+            style = "class:grid"
+            word = self.word_lookup.get((row_index, col_index))
+            if word:
+                if word.sentence_index in self.completed_words:
+                    style = "class:grid.word-complete"
+                elif word == self.current_word:
+                    style = "class:grid.word-active"
+            elif row_index == self.cursor_row and col_index == self.cursor_col:
+                style = "class:grid.cursor"
+
+            fragments.append((style, letter))
+            if col_index != width - 1:
+                fragments.append(("", " "))
+
+        if row_index != len(self.grid) - 1:
+            fragments.append(("", "\n"))
         return fragments
 
+    def _invalidate_rows(self, rows: Iterable[int]) -> None:
+        """Oublie les fragments mis en cache pour ``rows`` (recalculés au prochain rendu)."""
+
+        for row_index in rows:
+            self._row_fragments[row_index] = None
+
     def _render_dictation(self) -> FormattedText:
         fragments: List[Tuple[str, str]] = []
         fragments.append(("class:dictation.label", f"\nPhrase mystère – {self.theme.name} :\n"))
-        for placement in sorted(self.placements, key=lambda wp: wp.sentence_index):
+        for placement in self._ordered_placements:
             index = placement.sentence_index
             typed = "".join(self.typed_words[index])
             target = placement.word.grid
@@ -276,7 +534,10 @@ class MysterySentenceGame:
 
     def _render_message(self) -> FormattedText:
         style = "class:message.success" if self._is_finished() else "class:message"
-        return [(style, self.message)]
+        fragments: List[Tuple[str, str]] = [(style, self.message)]
+        if self.seed is not None:
+            fragments.append(("class:message", f"\nGrille n° {self.seed}"))
+        return fragments
 
     # --------------------------------------------------------------- helpers --
     def _create_key_bindings(self) -> KeyBindings:
@@ -323,9 +584,15 @@ class MysterySentenceGame:
     def _move_cursor(self, delta_row: int, delta_col: int) -> None:
         new_row = max(0, min(self.cursor_row + delta_row, len(self.grid) - 1))
         new_col = max(0, min(self.cursor_col + delta_col, len(self.grid[0]) - 1))
+        previous_word = self.current_word
+        self._invalidate_rows((self.cursor_row, new_row))
         self.cursor_row = new_row
         self.cursor_col = new_col
         self.current_word = self.word_lookup.get((self.cursor_row, self.cursor_col))
+        if self.current_word != previous_word:
+            for placement in (previous_word, self.current_word):
+                if placement is not None:
+                    self._invalidate_rows(self._placement_rows[placement.sentence_index])
         self._update_message()
 
     def _handle_character(self, char: str) -> None:
@@ -342,6 +609,7 @@ class MysterySentenceGame:
         if len(typed) == len(target):
             if "".join(typed) == target:
                 self.completed_words.add(index)
+                self._invalidate_rows(self._placement_rows[index])
                 self.message = "Bravo ! Le mot est correct."
                 if self._is_finished():
                     self.message = "🎉🥳🌟 Félicitations ! Toute la phrase est révélée ! 🌟🥳🎉"
@@ -419,30 +687,177 @@ THEMES: Tuple[MysteryTheme, ...] = (
 )
 
 
-def _choose_theme(themes: Sequence[MysteryTheme]) -> Optional[MysteryTheme]:
+THEME_PACK_DIR = Path(__file__).with_name("grilles_mystere_themes")
+
+
+def theme_from_json(data: dict) -> MysteryTheme:
+    """Construit un :class:`MysteryTheme` à partir de sa description JSON."""
+
+    words = tuple(
+        MysteryWord.from_text(word) if isinstance(word, str) else MysteryWord(display=word["display"], grid=word["grid"])
+        for word in data["words"]
+    )
+    rows, cols = data.get("grid_size", (12, 12))
+    return MysteryTheme(
+        name=str(data["name"]),
+        words=words,
+        grid_size=(int(rows), int(cols)),
+        filler_alphabet=str(data.get("filler_alphabet", string.ascii_uppercase)),
+        show_words_in_dictation=bool(data.get("show_words_in_dictation", True)),
+    )
+
+
+def load_theme_file(path: Path) -> Tuple[MysteryTheme, ...]:
+    """Lit un fichier de thèmes : ``{"themes": [...]}`` ou un thème seul."""
+
+    with path.open("r", encoding="utf-8") as fh:
+        try:
+            data = json.load(fh)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path.name} : JSON invalide ({exc})") from exc
+    entries = data["themes"] if isinstance(data, dict) and "themes" in data else [data]
+    try:
+        return tuple(theme_from_json(entry) for entry in entries)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"{path.name} : thème invalide ({exc!r})") from exc
+
+
+def load_theme_packs(directory: Path = THEME_PACK_DIR, errors: Optional[List[str]] = None) -> Tuple[MysteryTheme, ...]:
+    """Charge tous les fichiers ``*.json`` de ``directory``.
+
+    Les fichiers illisibles sont ignorés ; leur message d'erreur est ajouté à
+    ``errors`` quand cette liste est fournie.
+    """
+
+    themes: List[MysteryTheme] = []
+    for path in sorted(directory.glob("*.json")):
+        try:
+            themes.extend(load_theme_file(path))
+        except (OSError, ValueError) as exc:
+            if errors is not None:
+                errors.append(str(exc))
+    return tuple(themes)
+
+
+def available_themes() -> Tuple[MysteryTheme, ...]:
+    """Thèmes intégrés suivis des thèmes chargés depuis ``THEME_PACK_DIR``."""
+
+    return THEMES + load_theme_packs()
+
+
+@dataclass(frozen=True)
+class ThemeReport:
+    """Résultat de la validation d'un thème."""
+
+    name: str
+    grid_size: Tuple[int, int]
+    ok: bool
+    seconds: float
+    error: str = ""
+
+
+def _validate_theme(theme: MysteryTheme, seeds: Sequence[int]) -> ThemeReport:
+    start = time.perf_counter()
+    try:
+        for seed in seeds:
+            generate_seeded_grid(theme, seed)
+    except GridGenerationError as exc:
+        return ThemeReport(theme.name, theme.grid_size, False, time.perf_counter() - start, str(exc))
+    return ThemeReport(theme.name, theme.grid_size, True, (time.perf_counter() - start) / max(1, len(seeds)))
+
+
+def validate_themes(
+    themes: Sequence[MysteryTheme],
+    *,
+    seeds: Sequence[int] = (0, 1, 2, 3, 4),
+    workers: Optional[int] = None,
+) -> List[ThemeReport]:
+    """Essaie de générer chaque thème à sa ``grid_size`` avec plusieurs graines.
+
+    Les thèmes sont répartis sur un pool de processus ; le temps rapporté pour
+    un thème valide est la durée moyenne d'une génération.
+    """
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_validate_theme, themes, [tuple(seeds)] * len(themes)))
+
+
+def validate_main(argv: Optional[Sequence[str]] = None) -> int:
+    """Valide les thèmes intégrés et les fichiers de thèmes avant de les publier."""
+
+    parser = argparse.ArgumentParser(description="Validation des thèmes de Grilles mystère")
+    parser.add_argument("directory", nargs="?", type=Path, default=THEME_PACK_DIR, help="Dossier de fichiers *.json")
+    parser.add_argument("--slow", type=float, default=0.05, help="Durée (s) au-delà de laquelle un thème est signalé lent")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus")
+    args = parser.parse_args(argv)
+
+    errors: List[str] = []
+    themes = THEMES + load_theme_packs(args.directory, errors)
+    for error in errors:
+        print(f"ERREUR   {error}")
+    reports = validate_themes(themes, workers=args.workers)
+    failures = 0
+    for report in reports:
+        rows, cols = report.grid_size
+        if not report.ok:
+            failures += 1
+            print(f"ÉCHEC    {report.name} ({rows}×{cols}) : {report.error}")
+        elif report.seconds > args.slow:
+            print(f"LENT     {report.name} ({rows}×{cols}) : {report.seconds * 1000:.1f} ms par grille")
+    print(f"{len(reports)} thème(s) vérifié(s), {failures} échec(s), {len(errors)} fichier(s) invalide(s).")
+    return 1 if failures or errors else 0
+
+
+def _choose_theme(themes: Sequence[MysteryTheme]) -> Tuple[Optional[MysteryTheme], Optional[int]]:
+    """Demande le thème, et éventuellement la graine d'une grille à rejouer."""
+
     while True:
         print("Choisissez un thème :")
         for index, theme in enumerate(themes, start=1):
             print(f"{index}. {theme.name}")
+        print("G. Rejouer une grille à partir de son numéro (enseignant)")
         print("0. Retour")
-        choice = input("Votre choix : ")
+        choice = input("Votre choix : ").strip()
         if choice == "0":
-            return None
+            return None, None
+        seed: Optional[int] = None
+        if choice.lower() == "g":
+            choice = input("Numéro du thème : ").strip()
+            try:
+                seed = int(input("Numéro de la grille : ").strip())
+            except ValueError:
+                print("Numéro de grille invalide. Merci de réessayer.")
+                continue
         try:
             index = int(choice) - 1
-            return themes[index]
+            if index < 0:
+                raise IndexError(index)
+            return themes[index], seed
         except (ValueError, IndexError):
             print("Choix invalide. Merci de réessayer.")
 
 
 def main() -> None:
-    rng = random.Random()
-    theme = _choose_theme(THEMES)
-    if theme is None:
-        return
-    game = MysterySentenceGame(theme, rng=rng)
+    themes = available_themes()
+    pool = GridPool(themes)
+    while True:
+        theme, seed = _choose_theme(themes)
+        if theme is None:
+            return
+        try:
+            seeded_grid = pool.take(theme) if seed is None else generate_seeded_grid(theme, seed)
+            break
+        except GridGenerationError as exc:
+            # Les thèmes des fichiers JSON ne sont validés que par --valider.
+            if seed is None:
+                print(f"Impossible de générer une grille pour ce thème ({exc}). Choisissez-en un autre.")
+            else:
+                print(f"Impossible de rejouer la grille {seed} de ce thème ({exc}). Merci de réessayer.")
+    game = MysterySentenceGame(theme, seeded_grid=seeded_grid)
     game.run()
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--valider"]:
+        raise SystemExit(validate_main(sys.argv[2:]))
     main()
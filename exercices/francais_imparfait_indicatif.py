@@ -6,7 +6,10 @@ import sys
 
 DISPLAY_NAME = "Français : Imparfait de l'indicatif"
 
-from .logger import log_result
+from dataclasses import replace
+
+from .question_banks import load_bank
+from .quiz_engine import FRENCH_TEXTS, AnswerSet, Question, run_quiz
 from .utils import show_lesson
 
 LESSON = """
@@ -54,41 +57,16 @@ MODE_LABELS = {
     "hard": "Difficile (écrire le verbe complet)",
 }
 
-QUESTIONS = [
-    # 1er groupe
-    {"group": "1", "sentence": "Tous les soirs, je (chanter) chant____ avant de dormir.", "base": "chant", "ending": "ais"},
-    {"group": "1", "sentence": "Quand il pleuvait, tu (porter) port____ ton manteau rouge.", "base": "port", "ending": "ais"},
-    {"group": "1", "sentence": "À l'époque, elle (jouer) jou____ du piano chaque mercredi.", "base": "jou", "ending": "ait"},
-    {"group": "1", "sentence": "Petits, nous (regarder) regard____ les étoiles en été.", "base": "regard", "ending": "ions"},
-    {"group": "1", "sentence": "En CE2, vous (dessiner) dessin____ pendant la récréation.", "base": "dessin", "ending": "iez"},
-    {"group": "1", "sentence": "Autrefois, ils (habiter) habit____ dans ce village.", "base": "habit", "ending": "aient"},
-    {"group": "1", "sentence": "Pendant la dictée, je (lancer) lanç____ mon regard vers le tableau.", "base": "lanç", "ending": "ais"},
-    {"group": "1", "sentence": "L'été, il (plonger) plonge____ dans la rivière.", "base": "plonge", "ending": "ait"},
-    {"group": "1", "sentence": "En chorale, nous (crier) cri____ de joie à la fin du spectacle.", "base": "cri", "ending": "ions"},
-    {"group": "1", "sentence": "Au marché, vous (payer) pay____ en pièces jaunes.", "base": "pay", "ending": "iez"},
-    # 2e groupe (l'élève doit aussi écrire "iss" en mode facile)
-    {"group": "2", "sentence": "Le week-end, je (finir) fin____ mes devoirs tôt.", "base": "fin", "ending": "issais"},
-    {"group": "2", "sentence": "À la cantine, tu (choisir) chois____ toujours le même plat.", "base": "chois", "ending": "issais"},
-    {"group": "2", "sentence": "Au printemps, le chiot (grandir) grand____ vite.", "base": "grand", "ending": "issait"},
-    {"group": "2", "sentence": "En classe, nous (réfléchir) réfléch____ avant de répondre.", "base": "réfléch", "ending": "issions"},
-    {"group": "2", "sentence": "À ce jeu, vous (réussir) réuss____ souvent les niveaux difficiles.", "base": "réuss", "ending": "issiez"},
-    {"group": "2", "sentence": "Petites, elles (rougir) roug____ de timidité.", "base": "roug", "ending": "issaient"},
-    # 3e groupe
-    {"group": "3", "sentence": "Hier, la télé (être) ét____ en panne.", "base": "ét", "ending": "ait"},
-    {"group": "3", "sentence": "Chaque matin, j' (avoir) av____ du mal à me lever.", "base": "av", "ending": "ais"},
-    {"group": "3", "sentence": "Avant, il (faire) fais____ du vélo pour aller à l'école.", "base": "fais", "ending": "ait"},
-    {"group": "3", "sentence": "À cette époque, nous (faire) fais____ tout à la main.", "base": "fais", "ending": "ions"},
-    {"group": "3", "sentence": "Pendant les vacances, vous (voir) voy____ vos cousins tous les jours.", "base": "voy", "ending": "iez"},
-    {"group": "3", "sentence": "Dans le jardin, nous (voir) voy____ souvent des hérissons.", "base": "voy", "ending": "ions"},
-    {"group": "3", "sentence": "Le soir, ils (venir) ven____ nous dire bonsoir.", "base": "ven", "ending": "aient"},
-]
-
-
-def _normalise_text(raw: str) -> str:
-    answer = raw.strip().lower().replace(" ", "")
-    while answer.startswith("-"):
-        answer = answer[1:]
-    return answer
+# Questions dans ``banques_questions/francais_imparfait_indicatif.json``,
+# une section par groupe ("1", "2", "3").
+BANK = load_bank("francais_imparfait_indicatif")
+
+
+TEXTS = replace(
+    FRENCH_TEXTS,
+    correct="✅ Exact !",
+    final="\nScore final : {score}/{total} ({percentage:.1f} %)",
+)
 
 
 def _menu_choice(selected_groups: set[str], mode: str) -> str:
@@ -133,8 +111,9 @@ def _ask_with_preview(question: dict[str, str], mode: str) -> str:
 
 
 def _run_quiz(selected_groups: set[str], mode: str) -> None:
-    active_questions = [q for q in QUESTIONS if q["group"] in selected_groups]
-    if not active_questions:
+    groups = sorted(selected_groups)
+    total = BANK.count(groups)
+    if not total:
         print("\n⚠️ Tu dois cocher au moins un groupe avant de lancer le quiz.")
         return
 
@@ -143,31 +122,29 @@ def _run_quiz(selected_groups: set[str], mode: str) -> None:
     else:
         print("\nMode difficile : écris le verbe conjugué en entier.")
 
-    score = 0
-    total = len(active_questions)
-
-    for index, question in enumerate(active_questions, start=1):
-        print(f"\nQuestion {index}/{total}")
-        print("Écris le verbe entre parenthèses à l'imparfait, puis appuie sur [ENTER].")
-        raw_answer = _ask_with_preview(question, mode)
-        answer = _normalise_text(raw_answer)
+    run_quiz(
+        "francais_imparfait_indicatif",
+        (_question(record, mode) for record in BANK.questions(groups)),
+        total=total,
+        texts=TEXTS,
+        ask=lambda question: _ask_with_preview(question.tag, mode),
+    )
 
-        expected_full = f"{question['base']}{question['ending']}"
-        expected = question["ending"] if mode == "easy" else expected_full
 
-        if answer == expected:
-            print("✅ Exact !")
-            score += 1
-        else:
-            if mode == "easy":
-                print(f"❌ Non. La bonne fin était « {question['ending']} ».")
-            else:
-                print(f"❌ Non. Le verbe attendu était « {expected_full} ».")
-            print(f"   Forme complète : {expected_full}")
-
-    percentage = score / total * 100 if total else 0.0
-    print(f"\nScore final : {score}/{total} ({percentage:.1f} %)")
-    log_result("francais_imparfait_indicatif", percentage)
+def _question(record: dict[str, str], mode: str) -> Question:
+    expected_full = f"{record['base']}{record['ending']}"
+    if mode == "easy":
+        expected = record["ending"]
+        wrong = f"❌ Non. La bonne fin était « {expected} »."
+    else:
+        expected = expected_full
+        wrong = f"❌ Non. Le verbe attendu était « {expected_full} »."
+    return Question(
+        "Écris le verbe entre parenthèses à l'imparfait, puis appuie sur [ENTER].",
+        answers=AnswerSet.build([expected], keep_accents=True, ignore_spaces=True),
+        feedback=(wrong, f"   Forme complète : {expected_full}"),
+        tag=record,
+    )
 
 
 def main() -> None:
@@ -5,9 +5,10 @@ from __future__ import annotations
 DISPLAY_NAME = "Français : Passé composé (complet)"
 
 from collections import Counter, defaultdict
+from dataclasses import replace
 import random
 
-from .logger import log_result
+from .quiz_engine import FRENCH_TEXTS, AnswerSet, Question, QuizResult, log_results, run_quiz
 from .utils import show_lesson
 
 LESSON = """
@@ -51,7 +52,9 @@ def _item(
         "explanation": explanation,
     }
     if expected is not None:
-        result["expected"] = expected
+        # Réponses pliées une fois pour toutes.  Les participes isolés
+        # gardent leurs accents : « chante » n'est pas « chanté ».
+        result["expected"] = AnswerSet.build(expected, keep_accents=fmt == "short_answer")
     if choices is not None:
         result["choices"] = choices
     if answer is not None:
@@ -90,24 +93,24 @@ FORMAT_ITEMS: dict[str, list[dict[str, object]]] = {
         _item("qcm", "infinitif", "identification", 1, "dit", "Infinitif de « nous avons dit » ?", "Dit vient de dire.", choices=["dire", "dit", "dîner"], answer=1),
     ],
     "rewrite": [
-        _item("rewrite", "auxiliaire", "transformation", 3, "venir", "Réécris au passé composé : « Elles viennent tôt. »", "Venir avec être : elles sont venues.", expected=["elles sont venues tôt", "elles sont venues tot"]),
-        _item("rewrite", "auxiliaire", "transformation", 3, "manger", "Réécris au passé composé : « Nous mangeons au restaurant. »", "Manger avec avoir : nous avons mangé.", expected=["nous avons mangé au restaurant", "nous avons mange au restaurant"]),
-        _item("rewrite", "participe", "irregulier", 2, "prendre", "Réécris au passé composé : « Je prends le bus. »", "Prendre → j'ai pris.", expected=["j'ai pris le bus", "jai pris le bus"]),
+        _item("rewrite", "auxiliaire", "transformation", 3, "venir", "Réécris au passé composé : « Elles viennent tôt. »", "Venir avec être : elles sont venues.", expected=["elles sont venues tôt"]),
+        _item("rewrite", "auxiliaire", "transformation", 3, "manger", "Réécris au passé composé : « Nous mangeons au restaurant. »", "Manger avec avoir : nous avons mangé.", expected=["nous avons mangé au restaurant"]),
+        _item("rewrite", "participe", "irregulier", 2, "prendre", "Réécris au passé composé : « Je prends le bus. »", "Prendre → j'ai pris.", expected=["j'ai pris le bus"]),
         _item("rewrite", "participe", "irregulier", 2, "voir", "Réécris au passé composé : « Tu vois la mer. »", "Voir → tu as vu.", expected=["tu as vu la mer"]),
-        _item("rewrite", "accord", "etre", 4, "aller", "Réécris au passé composé : « Elles vont à l'école. »", "Aller avec être + accord : elles sont allées.", expected=["elles sont allées à l'école", "elles sont allées a l'école", "elles sont allees a l'ecole", "elles sont allées à l'ecole"]),
-        _item("rewrite", "accord", "etre", 4, "naître", "Réécris au passé composé : « Ils naissent en 2010. »", "Naître avec être : ils sont nés.", expected=["ils sont nés en 2010", "ils sont nes en 2010"]),
+        _item("rewrite", "accord", "etre", 4, "aller", "Réécris au passé composé : « Elles vont à l'école. »", "Aller avec être + accord : elles sont allées.", expected=["elles sont allées à l'école"]),
+        _item("rewrite", "accord", "etre", 4, "naître", "Réécris au passé composé : « Ils naissent en 2010. »", "Naître avec être : ils sont nés.", expected=["ils sont nés en 2010"]),
     ],
     "correction": [
-        _item("correction", "accord", "etre", 4, "arriver", "Corrige : « Elles sont arrivé en avance. »", "Avec être : accord au féminin pluriel, arrivées.", expected=["elles sont arrivées en avance", "elles sont arrivees en avance"]),
-        _item("correction", "accord", "avoir_cod_ant", 4, "écrire", "Corrige : « Les lettres que j'ai écrit sont longues. »", "Avec avoir + COD avant : écrites.", expected=["les lettres que j'ai écrites sont longues", "les lettres que j'ai ecrites sont longues"]),
+        _item("correction", "accord", "etre", 4, "arriver", "Corrige : « Elles sont arrivé en avance. »", "Avec être : accord au féminin pluriel, arrivées.", expected=["elles sont arrivées en avance"]),
+        _item("correction", "accord", "avoir_cod_ant", 4, "écrire", "Corrige : « Les lettres que j'ai écrit sont longues. »", "Avec avoir + COD avant : écrites.", expected=["les lettres que j'ai écrites sont longues"]),
         _item("correction", "accord", "etre", 4, "venir", "Corrige : « Ils sont venue hier. »", "Sujet masculin pluriel avec être : venus.", expected=["ils sont venus hier"]),
-        _item("correction", "participe", "irregulier", 2, "mettre", "Corrige : « J'ai met mon manteau. »", "Participe de mettre : mis.", expected=["j'ai mis mon manteau", "jai mis mon manteau"]),
+        _item("correction", "participe", "irregulier", 2, "mettre", "Corrige : « J'ai met mon manteau. »", "Participe de mettre : mis.", expected=["j'ai mis mon manteau"]),
         _item("correction", "participe", "irregulier", 2, "faire", "Corrige : « Nous avons fais nos devoirs. »", "Participe de faire : fait.", expected=["nous avons fait nos devoirs"]),
-        _item("correction", "auxiliaire", "avoir_etre", 3, "partir", "Corrige : « Elle a partie tôt. »", "Partir avec être : elle est partie.", expected=["elle est partie tôt", "elle est partie tot"]),
+        _item("correction", "auxiliaire", "avoir_etre", 3, "partir", "Corrige : « Elle a partie tôt. »", "Partir avec être : elle est partie.", expected=["elle est partie tôt"]),
     ],
     "infinitif": [
         _item("infinitif", "infinitif", "identification", 1, "grandir", "Donne l'infinitif : « Elles ont grandi vite. »", "Grandi vient de grandir.", expected=["grandir"]),
-        _item("infinitif", "infinitif", "identification", 1, "écrire", "Donne l'infinitif : « J'ai écrit une carte. »", "Écrit vient de écrire.", expected=["écrire", "ecrire"]),
+        _item("infinitif", "infinitif", "identification", 1, "écrire", "Donne l'infinitif : « J'ai écrit une carte. »", "Écrit vient de écrire.", expected=["écrire"]),
         _item("infinitif", "infinitif", "identification", 1, "venir", "Donne l'infinitif : « Nous sommes venus hier. »", "Venus vient de venir.", expected=["venir"]),
         _item("infinitif", "infinitif", "identification", 1, "mettre", "Donne l'infinitif : « Tu as mis ta veste. »", "Mis vient de mettre.", expected=["mettre"]),
         _item("infinitif", "infinitif", "identification", 1, "voir", "Donne l'infinitif : « Ils ont vu ce musée. »", "Vu vient de voir.", expected=["voir"]),
@@ -125,11 +128,6 @@ BLOCK_SPECS: dict[str, tuple[tuple[str, int], ...]] = {
 BLOCK_ORDER = ["A", "B", "C", "D"]
 
 
-def _normalize(text: str) -> str:
-    cleaned = text.strip().lower().replace("’", "'")
-    return " ".join(cleaned.split())
-
-
 def _pick_items(fmt: str, count: int) -> list[dict[str, object]]:
     pool = list(FORMAT_ITEMS[fmt])
     if count >= len(pool):
@@ -145,47 +143,47 @@ def _build_block_items(block_name: str) -> list[dict[str, object]]:
     return result
 
 
-def _ask_item(item: dict[str, object]) -> bool:
-    print(f"\n➡️ {item['prompt']}")
-    fmt = item["format"]
-
-    if fmt == "qcm":
-        choices: list[str] = item["choices"]  # type: ignore[assignment]
-        for i, choice in enumerate(choices, start=1):
-            print(f"  {i}. {choice}")
-        raw = input("Ton choix (1/2/3) : ").strip()
-        if raw not in {"1", "2", "3"}:
-            print("❌ Réponse invalide (1, 2 ou 3 attendus).")
-            print(f"ℹ️ {item['explanation']}")
-            return False
-        success = int(raw) == item["answer"]
-    else:
-        answer = _normalize(input("Ta réponse : "))
-        expected = [_normalize(x) for x in item["expected"]]  # type: ignore[index]
-        success = answer in expected
+TEXTS = replace(
+    FRENCH_TEXTS,
+    header="",
+    option="  {number}. {option}",
+    choice_prompt="Ton choix (1/2/3) : ",
+    invalid_choice="Réponse invalide (1, 2 ou 3 attendus).",
+    correct="✅ Correct !",
+    wrong="❌ Incorrect.",
+    expected="",
+)
 
-    if success:
-        print("✅ Correct !")
-    else:
-        print("❌ Incorrect.")
-        print(f"ℹ️ {item['explanation']}")
-    return success
 
+def _question(item: dict[str, object]) -> Question:
+    prompt = f"➡️ {item['prompt']}"
+    explanation = str(item["explanation"])
+    if item["format"] == "qcm":
+        choices = tuple(item["choices"])  # type: ignore[arg-type]
+        # Les QCM numérotent leurs réponses à partir de 1.
+        return Question(prompt, choices=choices, answer=int(item["answer"]) - 1, explanation=explanation, tag=item)
+    return Question(prompt, answers=item["expected"], explanation=explanation, tag=item)  # type: ignore[arg-type]
 
-def _run_block(block_name: str, questions: list[dict[str, object]], stats: dict[str, Counter]) -> tuple[int, int]:
+
+def _run_block(block_name: str, questions: list[dict[str, object]], stats: dict[str, Counter]) -> QuizResult:
     print(f"\n===== Bloc {block_name} ({len(questions)} questions) =====")
-    score = 0
-    for item in questions:
-        ok = _ask_item(item)
-        skill = str(item["skill"])
-        subskill = str(item["subskill"])
+
+    def record(question: Question, ok: bool) -> None:
+        item = question.tag
+        skill = str(item["skill"])  # type: ignore[index]
+        subskill = str(item["subskill"])  # type: ignore[index]
         stats[skill]["total"] += 1
         stats[skill]["success"] += int(ok)
         stats[skill][f"subskill:{subskill}"] += int(not ok)
-        if ok:
-            score += 1
-    print(f"Bloc {block_name} : {score}/{len(questions)}")
-    return score, len(questions)
+
+    return run_quiz(
+        "francais_passe_compose_terminaisons",
+        [_question(item) for item in questions],
+        texts=replace(TEXTS, final=f"Bloc {block_name} : {{score}}/{{total}}"),
+        choice_style="numbered",
+        on_answer=record,
+        log=False,
+    )
 
 
 def _print_diagnostic(stats: dict[str, Counter]) -> None:
@@ -215,24 +213,21 @@ def main() -> None:
     show_lesson(LESSON)
     mode = input("Choisis le mode : (E)ntraînement ou É(v)aluation : ").strip().lower()
 
-    total_score = 0
-    total_questions = 0
+    results: list[QuizResult] = []
     stats: dict[str, Counter] = defaultdict(Counter)
 
     for block in BLOCK_ORDER:
         questions = _build_block_items(block)
-        score, block_total = _run_block(block, questions, stats)
-        total_score += score
-        total_questions += block_total
+        result = _run_block(block, questions, stats)
+        results.append(result)
 
-        pct = score / block_total * 100 if block_total else 0
-        if pct < 75:
+        if result.percentage < 75:
             print("🛠️ Remédiation : 4 questions ciblées supplémentaires.")
             remedial = questions[:4]
-            r_score, r_total = _run_block(f"{block} (remédiation)", remedial, stats)
-            total_score += r_score
-            total_questions += r_total
+            results.append(_run_block(f"{block} (remédiation)", remedial, stats))
 
+    total_score = sum(result.score for result in results)
+    total_questions = sum(result.asked for result in results)
     percentage = total_score / total_questions * 100 if total_questions else 0.0
     print(f"\n🎯 Score global : {total_score}/{total_questions} ({percentage:.1f} %) ")
     if mode == "v":
@@ -241,7 +236,7 @@ def main() -> None:
         print("\nℹ️ Mode entraînement : feedback immédiat activé.")
 
     _print_diagnostic(stats)
-    log_result("francais_passe_compose_terminaisons", percentage)
+    log_results("francais_passe_compose_terminaisons", results)
 
 
 if __name__ == "__main__":
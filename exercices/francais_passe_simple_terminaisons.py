@@ -4,7 +4,11 @@ from __future__ import annotations
 
 DISPLAY_NAME = "Français : Passé simple – terminaisons"
 
-from .logger import log_result
+from dataclasses import replace
+from typing import Iterable
+
+from .conjugation import GROUP_LABELS, PERSONS, EndingItem, ending_items, with_subject
+from .quiz_engine import FRENCH_TEXTS, AnswerSet, Question, QuizResult, log_results, run_quiz
 from .utils import show_lesson
 
 LESSON = """
@@ -24,8 +28,16 @@ la **terminaison** du verbe (ex. `ai`, `as`, `îmes`).
 
 Les phrases indiquent toujours le groupe visé pour t'aider à repérer la bonne
 terminaison.
+
+🔁 En **entraînement libre**, les phrases sont tirées au hasard parmi plus de
+cent verbes, par séries de 20 : tu t'arrêtes quand tu veux.
 """
 
+# Nombre de questions par série d'entraînement libre.
+PRACTICE_SERIES = 20
+
+TEXTS = replace(FRENCH_TEXTS, header="Question {index}/{total}", answer_prompt="Terminaison : ", correct="✅ Bien joué !")
+
 QUESTIONS = [
     {  # 1er groupe
         "prompt": "Je (parler) longtemps avec ma sœur : je parl__ avec elle.",
@@ -156,31 +168,65 @@ QUESTIONS = [
 ]
 
 
+def _question(question: dict) -> Question:
+    return Question(
+        f"{question['group']} — {question['prompt']}",
+        answers=AnswerSet.build(question["ending"], keep_accents=True),
+        feedback=(
+            f"❌ Mauvaise terminaison. Il fallait écrire `{question['ending'][0]}` "
+            f"pour obtenir `{question['full_word']}`.",
+            f"ℹ️ {question['explanation']}",
+        ),
+    )
+
+
+def _generated_question(item: EndingItem) -> Question:
+    """Question d'entraînement libre construite par le moteur de conjugaison."""
+
+    subject = PERSONS[item.person]
+    return _question(
+        {
+            "prompt": f"{subject.capitalize()} ({item.verb}) : {item.blank('__')}.",
+            "ending": [item.ending],
+            "full_word": item.form,
+            "group": GROUP_LABELS[item.group],
+            "explanation": f"{item.verb.capitalize()} → {with_subject(subject, item.form)} : terminaison -{item.ending}.",
+        }
+    )
+
+
+def _run(questions: Iterable[Question], total: int) -> QuizResult:
+    return run_quiz(
+        "francais_passe_simple_terminaisons",
+        questions,
+        total=total,
+        texts=TEXTS,
+        log=False,
+    )
+
+
+def _free_practice() -> list[QuizResult]:
+    """Séries de questions générées, tant que l'élève en redemande."""
+
+    items = ending_items("passe_simple")
+    results: list[QuizResult] = []
+    while True:
+        results.append(_run((_generated_question(next(items)) for _ in range(PRACTICE_SERIES)), PRACTICE_SERIES))
+        if input("Une autre série ? (o/n) : ").strip().lower() not in ("o", "oui"):
+            return results
+
+
 def main() -> None:
     """Affiche la leçon puis lance le quiz sur le passé simple."""
 
     show_lesson(LESSON)
     print("Tape seulement la terminaison demandée (ex. `ai`, `is`, `ûtes`).")
-    score = 0
-    total = len(QUESTIONS)
-    for index, question in enumerate(QUESTIONS, start=1):
-        print(f"\nQuestion {index} – {question['group']}")
-        print(question["prompt"])
-        answer = input("Terminaison : ").strip().lower()
-        valid = [ending.lower() for ending in question["ending"]]
-        if answer in valid:
-            print("✅ Bien joué !")
-            score += 1
-        else:
-            correct = question["ending"][0]
-            full_word = question["full_word"]
-            print(
-                f"❌ Mauvaise terminaison. Il fallait écrire `{correct}` pour obtenir `{full_word}`."
-            )
-            print(f"ℹ️ {question['explanation']}")
-    print(f"\nScore final : {score}/{total}")
-    percentage = score / total * 100 if total else 0.0
-    log_result("francais_passe_simple_terminaisons", percentage)
+    mode = input("Choisis : (Q)uiz de la leçon ou (E)ntraînement libre : ").strip().lower()
+    if mode.startswith("e"):
+        results = _free_practice()
+    else:
+        results = [_run(map(_question, QUESTIONS), len(QUESTIONS))]
+    log_results("francais_passe_simple_terminaisons", results)
 
 
 if __name__ == "__main__":
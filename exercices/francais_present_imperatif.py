@@ -4,8 +4,10 @@ from __future__ import annotations
 
 DISPLAY_NAME = "Français : Présent de l'impératif"
 
-from .logger import log_result
-from .utils import ask_choice_with_navigation, show_lesson
+from dataclasses import replace
+
+from .quiz_engine import FRENCH_TEXTS, AnswerSet, Question, run_quiz
+from .utils import show_lesson
 
 LESSON = """
 📚 **Le présent de l'impératif : donner un ordre, un conseil ou une consigne**
@@ -135,12 +137,12 @@ EXERCISES = [
                 "prompt": (
                     "2. « Dracula..., Mords et nourris-toi du sang de tes victimes ! »"
                 ),
-                "answers": ["mords et nourris-toi", "mords, nourris-toi", "mords nourris-toi"],
+                "answers": ["mords et nourris-toi", "mords nourris-toi"],
                 "explanation": "On trouve « mords » et « nourris-toi ».",
             },
             {
                 "prompt": "3. « Rends cette casquette..., et mets-toi en rang ! »",
-                "answers": ["rends et mets-toi", "rends, mets-toi", "rends mets-toi"],
+                "answers": ["rends et mets-toi", "rends mets-toi"],
                 "explanation": "Les verbes à l'impératif : « rends » et « mets-toi ».",
             },
             {
@@ -152,18 +154,14 @@ EXERCISES = [
                 "prompt": (
                     "5. « Tu es espionné..., N'aie pas peur : une haie sépare... »"
                 ),
-                "answers": ["n'aie pas peur", "n'aie pas peur:"],
+                "answers": ["n'aie pas peur"],
                 "explanation": "Le verbe à l'impératif est « n'aie pas peur ».",
             },
             {
                 "prompt": (
                     "6. « Allons, fais un effort : cultive-toi et lis ! »"
                 ),
-                "answers": [
-                    "allons, fais, cultive-toi et lis",
-                    "allons fais cultive-toi et lis",
-                    "allons, fais, cultive-toi, lis",
-                ],
+                "answers": ["allons, fais, cultive-toi et lis", "allons, fais, cultive-toi, lis"],
                 "explanation": "Les verbes : « allons », « fais », « cultive-toi », « lis ».",
             },
             {
@@ -227,49 +225,32 @@ EXERCISES = [
 ]
 
 
-def _normalise_answer(answer: str) -> str:
-    return answer.strip().lower().replace("’", "'")
+TEXTS = replace(FRENCH_TEXTS, header="Question {index}")
+
+
+def _question(item: dict[str, object], choices: list[str] | None) -> Question:
+    if choices:
+        return Question(
+            str(item["prompt"]),
+            choices=tuple(choices),
+            answer=int(item["answer"]),
+            explanation=str(item["explanation"]),
+        )
+    return Question(
+        str(item["prompt"]),
+        answers=AnswerSet.build(item["answers"], keep_accents=True),
+        explanation=str(item["explanation"]),
+    )
 
 
 def _run_quiz(
     questions: list[dict[str, object]], *, choices: list[str] | None = None
 ) -> None:
-    score = 0
-    total = len(questions)
-    for index, question in enumerate(questions, start=1):
-        print(f"\nQuestion {index}")
-        print(question["prompt"])
-        if choices:
-            student, option_letters, quit_requested = ask_choice_with_navigation(choices)
-            if quit_requested:
-                print("\nRetour au menu demandé. Fin de l'exercice.\n")
-                return
-            correct_index = question["answer"]
-            correct_text = choices[correct_index]
-            correct_letter = option_letters[correct_index]
-            if student == correct_index:
-                print("✅ Bravo !")
-                score += 1
-            else:
-                print(
-                    "❌ Pas tout à fait."
-                    f" ✅ Réponse attendue : {correct_letter}) {correct_text}"
-                )
-                print(f"ℹ️ {question['explanation']}")
-        else:
-            answer = _normalise_answer(input("Ta réponse : "))
-            valid = {_normalise_answer(item) for item in question["answers"]}
-            if answer in valid:
-                print("✅ Bravo !")
-                score += 1
-            else:
-                print("❌ Pas tout à fait.")
-                print(f"✅ Réponse attendue : {question['answers'][0]}")
-                print(f"ℹ️ {question['explanation']}")
-
-    print(f"\nScore final : {score}/{total}")
-    percentage = score / total * 100 if total else 0.0
-    log_result("francais_present_imperatif", percentage)
+    run_quiz(
+        "francais_present_imperatif",
+        [_question(item, choices) for item in questions],
+        texts=TEXTS,
+    )
 
 
 def _display_exercise_menu() -> str:
@@ -4,26 +4,13 @@ from __future__ import annotations
 
 DISPLAY_NAME = "Géométrie : Appartenance ∈ / ∉"
 
-import os
-import sys
 from dataclasses import dataclass
 from typing import List
 
+from .keyboard import key_session
 from .logger import log_result
 from .utils import show_lesson
 
-if os.name == "nt":
-    import msvcrt  # pragma: no cover - Windows specific
-else:  # pragma: no cover - attribute only used for type checking
-    msvcrt = None  # type: ignore[assignment]
-
-try:
-    import termios
-    import tty
-except ImportError:  # pragma: no cover - Windows fallback
-    termios = None  # type: ignore[assignment]
-    tty = None  # type: ignore[assignment]
-
 
 BOLD = "\033[1m"
 CYAN = "\033[96m"
@@ -45,63 +32,31 @@ class Question:
 
 
 OPTIONS: List[str] = ["∈", "∉"]
-LEFT_KEYS = {"\x1b[D", "\xe0K"}
-RIGHT_KEYS = {"\x1b[C", "\xe0M"}
-ENTER_KEYS = {"\r", "\n", "\r\n"}
-
-
-def read_key() -> str:
-    """Lit une touche du clavier et renvoie sa représentation."""
-
-    if os.name == "nt" and msvcrt is not None:  # pragma: no cover - Windows only
-        key = msvcrt.getwch()
-        if key in ("\x00", "\xe0"):
-            key += msvcrt.getwch()
-        return key
-
-    if termios is None or tty is None:  # pragma: no cover - improbable fallback
-        return sys.stdin.read(1)
-
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        first = sys.stdin.read(1)
-        if first == "\x1b":
-            second = sys.stdin.read(1)
-            if second == "[":
-                third = sys.stdin.read(1)
-                return first + second + third
-            return first + second
-        return first
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
 def choose_symbol() -> str:
     """Permet à l'élève de choisir entre ∈ et ∉ avec les flèches."""
 
     index = 0
-    prompt_printed = False
-    while True:
-        options_display = "  ".join(
-            f"[{symbol}]" if i == index else f" {symbol} "
-            for i, symbol in enumerate(OPTIONS)
-        )
-        if not prompt_printed:
-            print("Utilise les flèches gauche/droite puis appuie sur Entrée.")
-            prompt_printed = True
-        print(f"\r{options_display}    ", end="", flush=True)
-        key = read_key()
-        if key in LEFT_KEYS:
-            index = (index - 1) % len(OPTIONS)
-        elif key in RIGHT_KEYS:
-            index = (index + 1) % len(OPTIONS)
-        elif key in ENTER_KEYS or key == "\r":
-            print()
-            return OPTIONS[index]
-        elif key == "\x03":  # Ctrl+C
-            raise KeyboardInterrupt
+    with key_session() as keys:
+        if keys is None:  # pas de terminal : simple saisie
+            answer = input("Tape 1 pour ∈ ou 2 pour ∉ : ").strip()
+            return OPTIONS[1] if answer == "2" else OPTIONS[0]
+        print("Utilise les flèches gauche/droite puis appuie sur Entrée.")
+        while True:
+            options_display = "  ".join(
+                f"[{symbol}]" if i == index else f" {symbol} "
+                for i, symbol in enumerate(OPTIONS)
+            )
+            print(f"\r{options_display}    ", end="", flush=True)
+            event = keys.read()
+            if event.key == "LEFT":
+                index = (index - event.repeat) % len(OPTIONS)
+            elif event.key == "RIGHT":
+                index = (index + event.repeat) % len(OPTIONS)
+            elif event.key == "ENTER":
+                print()
+                return OPTIONS[index]
 
 
 def main() -> None:
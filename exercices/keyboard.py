@@ -0,0 +1,302 @@
+"""Shared keyboard input for the arrow-driven widgets.
+
+The terminal is switched to cbreak mode once per prompt session instead of
+around every key press, and input is read in chunks through a non-blocking
+decoder that understands complete escape sequences (CSI such as
+``ESC [ 1 ; 5 C`` and SS3 such as ``ESC O A``).  Keys that arrive faster
+than the widget redraws, for example a held arrow, are coalesced into one
+:class:`KeyEvent` carrying a repeat count, so nothing is dropped and the
+display never lags behind the keyboard.
+
+Keys are reported as names (``"UP"``, ``"DOWN"``, ``"LEFT"``, ``"RIGHT"``,
+``"ENTER"``, ``"ESC"``, ``"BACKSPACE"``, ``"HOME"``, ``"END"``,
+``"PAGE_UP"``, ``"PAGE_DOWN"``, ``"DELETE"``) or as the typed character.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import select
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+try:  # ``msvcrt`` is only available on Windows
+    import msvcrt
+except Exception:  # pragma: no cover - import will fail on non-Windows
+    msvcrt = None  # type: ignore[assignment]
+try:  # Raw key handling on POSIX
+    import termios
+    import tty
+except Exception:  # pragma: no cover - not available everywhere
+    termios = None  # type: ignore[assignment]
+    tty = None  # type: ignore[assignment]
+
+
+# How long a lone ESC waits for the rest of an escape sequence.
+ESCAPE_TIMEOUT = 0.05
+
+_CSI_FINAL = {
+    "A": "UP",
+    "B": "DOWN",
+    "C": "RIGHT",
+    "D": "LEFT",
+    "H": "HOME",
+    "F": "END",
+}
+_CSI_TILDE = {
+    "1": "HOME",
+    "2": "INSERT",
+    "3": "DELETE",
+    "4": "END",
+    "5": "PAGE_UP",
+    "6": "PAGE_DOWN",
+    "7": "HOME",
+    "8": "END",
+}
+_CONTROL = {
+    "\r": "ENTER",
+    "\n": "ENTER",
+    "\x7f": "BACKSPACE",
+    "\x08": "BACKSPACE",
+    "\t": "TAB",
+}
+_WINDOWS_SPECIAL = {
+    "H": "UP",
+    "P": "DOWN",
+    "K": "LEFT",
+    "M": "RIGHT",
+    "G": "HOME",
+    "O": "END",
+    "I": "PAGE_UP",
+    "Q": "PAGE_DOWN",
+    "S": "DELETE",
+}
+
+
+@dataclass(frozen=True)
+class KeyEvent:
+    """A decoded key, pressed ``repeat`` times in a row."""
+
+    key: str
+    repeat: int = 1
+
+
+class KeyDecoder:
+    """Incremental decoder turning terminal bytes into key names.
+
+    Bytes are fed as they arrive; :meth:`pop` returns the next complete key,
+    or ``None`` while a multi-byte character or escape sequence is still
+    incomplete.  With ``final=True`` an incomplete escape sequence is given
+    up on and reported as ``"ESC"`` followed by its characters.
+    """
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+
+    def feed(self, data: bytes) -> None:
+        self._pending += self._utf8.decode(data)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def pop(self, *, final: bool = False) -> str | None:
+        text = self._pending
+        if not text:
+            return None
+        if text[0] != "\x1b":
+            self._pending = text[1:]
+            return _CONTROL.get(text[0], text[0])
+        key, length = _parse_escape(text)
+        if length == 0:  # incomplete sequence
+            if not final:
+                return None
+            key, length = "ESC", 1
+        self._pending = text[length:]
+        return key
+
+
+def _parse_escape(text: str) -> tuple[str | None, int]:
+    """Decode the escape sequence at the start of ``text``.
+
+    Returns ``(key, consumed)``; ``consumed`` is 0 when more input is needed.
+    Unknown but well-formed sequences are swallowed and reported as ``None``.
+    """
+
+    if len(text) < 2:
+        return None, 0
+    introducer = text[1]
+    if introducer == "O":  # SS3, sent by terminals in keypad mode
+        if len(text) < 3:
+            return None, 0
+        return _CSI_FINAL.get(text[2]), 3
+    if introducer != "[":
+        # ESC followed by a plain key (Alt+key): report ESC on its own.
+        return "ESC", 1
+    for index in range(2, len(text)):
+        char = text[index]
+        if "\x40" <= char <= "\x7e":
+            params = text[2:index]
+            if char == "~":
+                return _CSI_TILDE.get(params.split(";")[0]), index + 1
+            return _CSI_FINAL.get(char), index + 1
+        if not ("\x20" <= char <= "\x3f"):
+            # Broken sequence: drop the ESC [ prefix and carry on.
+            return "ESC", 1
+    return None, 0
+
+
+class KeySession:
+    """Terminal in cbreak mode with a buffered, non-blocking key decoder.
+
+    Create it through :func:`key_session`.  Output keeps working normally
+    (only echo and line buffering are disabled), so widgets can print while
+    the session is open.
+    """
+
+    def __init__(self, fd: int | None) -> None:
+        self.fd = fd
+        self._decoder = KeyDecoder()
+        self._queue: list[str] = []
+
+    # -- POSIX -----------------------------------------------------------
+    def _fill(self, timeout: float | None) -> bool:
+        """Read whatever is available, waiting up to ``timeout`` seconds."""
+
+        assert self.fd is not None
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        data = os.read(self.fd, 4096)
+        if not data:
+            raise EOFError
+        self._decoder.feed(data)
+        return True
+
+    def _drain_decoder(self, final: bool = False) -> None:
+        while True:
+            key = self._decoder.pop(final=final)
+            if key is None:
+                if final or not self._decoder.pending:
+                    return
+                # An incomplete sequence: it is either still arriving or a
+                # lone ESC key.  Give it a short moment to complete.
+                if not self._fill(ESCAPE_TIMEOUT):
+                    final = True
+                continue
+            self._queue.append(key)
+
+    def _poll_posix(self, timeout: float | None) -> None:
+        if not self._queue:
+            if self._fill(timeout):
+                self._drain_decoder()
+        # Pick up anything else that is already waiting, without blocking.
+        while self._fill(0):
+            self._drain_decoder()
+
+    # -- Windows ---------------------------------------------------------
+    def _read_windows(self) -> str | None:  # pragma: no cover - Windows
+        key = msvcrt.getwch()
+        if key in ("\x00", "\xe0"):
+            return _WINDOWS_SPECIAL.get(msvcrt.getwch())
+        if key == "\x1b":
+            return "ESC"
+        return _CONTROL.get(key, key)
+
+    def _poll_windows(self, timeout: float | None) -> None:  # pragma: no cover - Windows
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._queue and not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
+        while msvcrt.kbhit():
+            self._queue.append(self._read_windows())
+
+    # -- public API ------------------------------------------------------
+    def poll(self, timeout: float | None = None) -> bool:
+        """Wait up to ``timeout`` seconds (forever if ``None``) for input.
+
+        Returns True when at least one key is queued.
+        """
+
+        if os.name == "nt" and msvcrt is not None:  # pragma: no cover - Windows
+            self._poll_windows(timeout)
+        elif self.fd is not None:
+            self._poll_posix(timeout)
+        return bool(self._queue)
+
+    def read(self, *, coalesce: bool = True) -> KeyEvent | None:
+        """Return the next key event, blocking until one arrives.
+
+        With ``coalesce`` the identical keys queued right behind it are
+        merged into its ``repeat`` count.  Returns ``None`` when no
+        terminal is attached.
+        """
+
+        while True:
+            if self.fd is None and not (os.name == "nt" and msvcrt is not None):
+                return None
+            if not self.poll(None):
+                continue
+            key = self._queue.pop(0)
+            if key is None:  # unknown escape sequence
+                continue
+            repeat = 1
+            if coalesce:
+                while self._queue and self._queue[0] == key:
+                    self._queue.pop(0)
+                    repeat += 1
+            return KeyEvent(key, repeat)
+
+    def flush(self) -> bool:
+        """Discard pending input; return True if there was any."""
+
+        self.poll(0)
+        had_input = bool(self._queue)
+        self._queue.clear()
+        return had_input
+
+
+_active: KeySession | None = None
+
+
+@contextmanager
+def key_session() -> Iterator[KeySession | None]:
+    """Enter cbreak mode for the duration of the block.
+
+    Yields a :class:`KeySession`, or ``None`` when stdin is not a terminal
+    (widgets then fall back to ``input()``).  Sessions nest: an inner
+    ``with key_session()`` reuses the outer one, so the terminal mode is
+    switched only once.
+    """
+
+    global _active
+    if _active is not None:
+        yield _active
+        return
+    if not sys.stdin.isatty():
+        yield None
+        return
+    if os.name == "nt" or termios is None or tty is None:  # pragma: no cover - Windows
+        _active = KeySession(None)
+        try:
+            yield _active
+        finally:
+            _active = None
+        return
+
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    sys.stdout.flush()
+    try:
+        tty.setcbreak(fd)
+        _active = KeySession(fd)
+        yield _active
+    finally:
+        _active = None
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 import random
-from decimal import Decimal
-
+from typing import Iterator
+
+from .factor_grouping import (
+    best_grouping,
+    format_number,
+    generate_problem,
+    group_distractors,
+    wrong_results,
+    wrong_rewrites,
+)
 from .logger import log_result
 from .utils import ask_choice_with_navigation, show_lesson
 
@@ -17,62 +25,40 @@ BOLD = "\033[1m"
 RESET = "\033[0m"
 
 
+# Le groupement attendu, son résultat et le produit final sont calculés par
+# ``factor_grouping`` (qui retrouve ceux de la fiche).
 MULTIPLICATIONS: list[dict[str, object]] = [
     {
         "label": "A",
         "factors": ["2", "43", "5"],
-        "group": ["2", "5"],
-        "group_result": "10",
-        "final": "430",
     },
     {
         "label": "B",
         "factors": ["2,5", "17", "4", "10"],
-        "group": ["2,5", "4"],
-        "group_result": "10",
-        "final": "1700",
     },
     {
         "label": "C",
         "factors": ["5", "71,38", "4", "5"],
-        "group": ["5", "4", "5"],
-        "group_result": "100",
-        "final": "7138",
     },
     {
         "label": "D",
         "factors": ["10", "4", "0,8"],
-        "group": ["10", "0,8"],
-        "group_result": "8",
-        "final": "32",
     },
     {
         "label": "E",
         "factors": ["2", "12,3", "50"],
-        "group": ["2", "50"],
-        "group_result": "100",
-        "final": "1230",
     },
     {
         "label": "F",
         "factors": ["25", "3,7", "4"],
-        "group": ["25", "4"],
-        "group_result": "100",
-        "final": "370",
     },
     {
         "label": "G",
         "factors": ["12", "2,5", "5", "4"],
-        "group": ["2,5", "4"],
-        "group_result": "10",
-        "final": "600",
     },
     {
         "label": "H",
         "factors": ["7", "0,25", "9", "4"],
-        "group": ["0,25", "4"],
-        "group_result": "1",
-        "final": "63",
     },
 ]
 
@@ -85,60 +71,24 @@ def _group_text(group: list[str]) -> str:
     return f"({' × '.join(group)})"
 
 
-def _value(text: str) -> Decimal:
-    return Decimal(text.replace(",", "."))
-
-
-def _remove_group_once(factors: list[str], group: list[str]) -> list[str]:
-    remaining = factors.copy()
-    for element in group:
-        remaining.remove(element)
-    return remaining
-
-
-def _group_options(factors: list[str], group: list[str]) -> list[str]:
-    options = [_group_text(group)]
-
-    pair_a = factors[:2]
-    pair_b = factors[-2:]
-    for proposal in (pair_a, pair_b):
-        proposal_text = _group_text(proposal)
-        if proposal_text not in options:
-            options.append(proposal_text)
-
-    if len(factors) >= 4:
-        first_three = factors[:3]
-        first_three_text = _group_text(first_three)
-        if first_three_text not in options:
-            options.append(first_three_text)
-
-    while len(options) < 4:
-        fallback = _group_text([factors[0], factors[-1]])
-        if fallback not in options:
-            options.append(fallback)
-        else:
-            options.append(_group_text([factors[1], factors[-1]]))
-
-    return options[:4]
+def _rewrite_text(factors: list[str], group: tuple[str, ...], rest: tuple[str, ...]) -> str:
+    if rest:
+        return f"{_expression_text(factors)}  →  {_group_text(list(group))} × {' × '.join(rest)}"
+    return f"{_expression_text(factors)}  →  {_group_text(list(group))}"
 
 
-def _rearrangements(factors: list[str], group: list[str]) -> tuple[str, list[str]]:
-    remaining = _remove_group_once(factors, group)
-    group_text = _group_text(group)
+def _group_options(factors: list[str]) -> list[str]:
+    """Le meilleur groupement puis les suivants du classement du solveur."""
 
-    if remaining:
-        tail = " × ".join(remaining)
-        correct = f"{_expression_text(factors)}  →  {group_text} × {tail}"
-    else:
-        correct = f"{_expression_text(factors)}  →  {group_text}"
+    best = best_grouping(factors)
+    return [_group_text(list(best.group))] + [_group_text(list(group)) for group in group_distractors(factors)]
 
-    wrong_one = f"{_expression_text(factors)}  →  {_group_text(factors[:2])} × {' × '.join(factors[2:])}"
-    wrong_two_group = _group_text([remaining[0], group[0]]) if remaining else _group_text(factors[:2])
-    wrong_two_tail = " × ".join(group[1:] + ([remaining[-1]] if remaining else []))
-    wrong_two = f"{_expression_text(factors)}  →  {wrong_two_group} × {wrong_two_tail}"
 
-    options = [correct, wrong_one, wrong_two]
-    return correct, options
+def _rearrangements(factors: list[str], rng: random.Random) -> tuple[str, list[str]]:
+    best = best_grouping(factors)
+    correct = _rewrite_text(factors, best.group, best.rest)
+    wrong = [_rewrite_text(factors, group, rest) for group, rest in wrong_rewrites(factors, rng=rng)]
+    return correct, [correct] + wrong
 
 
 def _shuffle_choices(correct_choice: str, distractors: list[str], rng: random.Random) -> tuple[list[str], int]:
@@ -163,6 +113,74 @@ def _ask_question(prompt: str, choices: list[str], answer_index: int) -> bool:
     return ok
 
 
+def _play(factors: list[str], rng: random.Random) -> tuple[int, int, bool]:
+    """Les 3 mini-questions sur un produit.
+
+    Renvoie ``(bonnes réponses, questions posées, arrêt demandé)`` : si
+    l'élève quitte en cours de route, les réponses déjà données comptent.
+    """
+
+    score = asked = 0
+    try:
+        for ok in _questions(factors, rng):
+            asked += 1
+            score += ok
+    except KeyboardInterrupt:
+        return score, asked, True
+    return score, asked, False
+
+
+def _questions(factors: list[str], rng: random.Random) -> Iterator[bool]:
+    """Pose les 3 mini-questions une à une et produit chaque verdict."""
+
+    best = best_grouping(factors)
+    group = list(best.group)
+    group_result = format_number(best.product)
+    final = format_number(best.total)
+    print(f"Calcul : {BOLD}{_expression_text(factors)}{RESET}")
+
+    # Question 1/3
+    right_group = _group_text(group)
+    shuffled_group_choices, group_answer_index = _shuffle_choices(right_group, _group_options(factors), rng)
+    yield _ask_question(
+        f"{BOLD}Question 1/3{RESET} — Quelle association est la plus astucieuse pour commencer ?",
+        shuffled_group_choices,
+        group_answer_index,
+    )
+    print(f"Explication : commencer par {CYAN}{right_group}{RESET} donne rapidement {BOLD}{group_result}{RESET}.")
+
+    # Question 2/3 (UI spéciale fléchée)
+    correct, rearrangements = _rearrangements(factors, rng)
+    highlighted = correct.replace(right_group, f"{CYAN}{BOLD}{right_group}{RESET}")
+    print(
+        f"\n{BOLD}Réécriture modèle :{RESET} {highlighted}\n"
+        f"On calcule d'abord le groupe en couleur, puis on continue avec les autres facteurs."
+    )
+    shuffled_rearrangements, rearrangement_answer_index = _shuffle_choices(correct, rearrangements, rng)
+    yield _ask_question(
+        f"{BOLD}Question 2/3{RESET} — Quelle ligne avec flèche montre la bonne réorganisation ?",
+        shuffled_rearrangements,
+        rearrangement_answer_index,
+    )
+
+    # Question 3/3
+    result_distractors = [format_number(value) for value in wrong_results(factors)]
+    result_choices, result_answer_index = _shuffle_choices(final, result_distractors, rng)
+    yield _ask_question(
+        f"{BOLD}Question 3/3{RESET} — Après l'association astucieuse, quel est le résultat final ?",
+        result_choices,
+        result_answer_index,
+    )
+
+    if best.rest:
+        print(
+            f"Correction détaillée : {right_group} = {group_result}, puis "
+            f"{group_result} × {' × '.join(best.rest)} = {BOLD}{final}{RESET}."
+        )
+    else:
+        print(f"Correction détaillée : {right_group} = {BOLD}{final}{RESET}.")
+
+
 def main() -> None:
     lesson = f"""
 {CYAN}{BOLD}Associer astucieusement les facteurs (inspiré de la fiche en photo){RESET}
@@ -172,6 +190,7 @@ Pour chaque multiplication, on avance avec {BOLD}3 mini-questions{RESET} :
 1) choisir l'association la plus efficace (parfois 2 facteurs, parfois 3) ;
 2) repérer la bonne réécriture avec parenthèses et flèches ;
 3) donner le résultat final.
+À la fin, tu peux enchaîner des multiplications inventées (3 à 8 facteurs).
 
 {BOLD}Méthode conseillée (surtout quand il y a 4 facteurs){RESET}
 • Étape 1 : repérer le groupe facile (qui donne souvent 10, 20, 50, 100 ou 1).
@@ -191,87 +210,30 @@ H = 7 × 0,25 × 9 × 4
     show_lesson(lesson)
 
     score = 0
-    total = len(MULTIPLICATIONS) * 3
+    total = 0
     rng = random.Random()
 
     try:
         for index, item in enumerate(MULTIPLICATIONS, start=1):
-            label = str(item["label"])
-            factors = list(item["factors"])
-            group = list(item["group"])
-            group_result = str(item["group_result"])
-            final = str(item["final"])
-
-            print(f"\n{CYAN}{BOLD}Multiplication {label} ({index}/{len(MULTIPLICATIONS)}){RESET}")
-            print(f"Calcul : {BOLD}{_expression_text(factors)}{RESET}")
-
-            # Question 1/3
-            group_choices = _group_options(factors, group)
-            right_group = _group_text(group)
-            shuffled_group_choices, group_answer_index = _shuffle_choices(
-                right_group,
-                group_choices,
-                rng,
-            )
-            if _ask_question(
-                f"{BOLD}Question 1/3{RESET} — Quelle association est la plus astucieuse pour commencer ?",
-                shuffled_group_choices,
-                group_answer_index,
-            ):
-                score += 1
-            print(
-                f"Explication : commencer par {CYAN}{right_group}{RESET} donne rapidement {BOLD}{group_result}{RESET}."
-            )
-
-            # Question 2/3 (UI spéciale fléchée)
-            correct, rearrangements = _rearrangements(factors, group)
-            highlighted = correct.replace(
-                right_group,
-                f"{CYAN}{BOLD}{right_group}{RESET}",
-            )
-            print(
-                f"\n{BOLD}Réécriture modèle :{RESET} {highlighted}\n"
-                f"On calcule d'abord le groupe en couleur, puis on continue avec les autres facteurs."
-            )
-            shuffled_rearrangements, rearrangement_answer_index = _shuffle_choices(
-                correct,
-                rearrangements,
-                rng,
-            )
-            if _ask_question(
-                f"{BOLD}Question 2/3{RESET} — Quelle ligne avec flèche montre la bonne réorganisation ?",
-                shuffled_rearrangements,
-                rearrangement_answer_index,
-            ):
-                score += 1
-
-            # Question 3/3
-            result_distractors = [
-                str(_value(final) + Decimal("10")),
-                str(_value(final) / Decimal("10")),
-                str(_value(final) - Decimal("10")),
-            ]
-            result_choices, result_answer_index = _shuffle_choices(final, result_distractors, rng)
-            if _ask_question(
-                f"{BOLD}Question 3/3{RESET} — Après l'association astucieuse, quel est le résultat final ?",
-                result_choices,
-                result_answer_index,
-            ):
-                score += 1
-
-            remaining = _remove_group_once(factors, group)
-            if remaining:
-                print(
-                    f"Correction détaillée : {_group_text(group)} = {group_result}, puis "
-                    f"{group_result} × {' × '.join(remaining)} = {BOLD}{final}{RESET}."
-                )
-            else:
-                print(f"Correction détaillée : {_group_text(group)} = {BOLD}{final}{RESET}.")
-
+            print(f"\n{CYAN}{BOLD}Multiplication {item['label']} ({index}/{len(MULTIPLICATIONS)}){RESET}")
+            earned, asked, stopped = _play(list(item["factors"]), rng)
+            score, total = score + earned, total + asked
+            if stopped:
+                raise KeyboardInterrupt
+
+        number = 0
+        while input("\nVeux-tu une multiplication inventée de plus ? (o/n) ").strip().lower() in ("o", "oui"):
+            number += 1
+            factors = list(generate_problem(rng.randint(3, 8), rng))
+            print(f"\n{CYAN}{BOLD}Multiplication bonus {number}{RESET}")
+            earned, asked, stopped = _play(factors, rng)
+            score, total = score + earned, total + asked
+            if stopped:
+                raise KeyboardInterrupt
     except KeyboardInterrupt:
         print("\nRetour au menu demandé.")
 
-    percentage = score / total * 100
+    percentage = score / total * 100 if total else 0.0
     print(f"\n{BOLD}Résultat final :{RESET} {score}/{total} ({percentage:.1f}%).")
     log_result("math_association_facteurs_images", percentage)
 
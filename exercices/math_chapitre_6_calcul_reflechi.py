@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import random
+
 from .logger import log_result
+from .mental_math import KIND_TITLES, MentalProblem, format_number, problem_set
 from .utils import ask_choice_with_navigation, show_lesson
 
 DISPLAY_NAME = "Maths : Chapitre 6 — calcul réfléchi (menu par exercice)"
@@ -13,6 +16,15 @@ CYAN = "\033[96m"
 BOLD = "\033[1m"
 RESET = "\033[0m"
 
+# Problèmes inventés par quiz d'entraînement.
+GENERATED_PROBLEMS = 3
+
+_STRATEGY_HINTS = {
+    "compensation": "on remplace le nombre par le nombre rond le plus proche, puis on corrige l'écart",
+    "decomposition": "on multiplie séparément les dizaines et les unités, puis on ajoute",
+    "doubling": "on double un facteur et on prend la moitié de l'autre : le produit ne change pas",
+}
+
 
 def _ask_question(question: dict[str, object]) -> bool:
     print(f"\n{BOLD}{question['question']}{RESET}")
@@ -448,6 +460,56 @@ def _exercise_5_bis() -> None:
     )
 
 
+def _shuffled(correct: str, wrong: list[str], rng: random.Random) -> tuple[list[str], int]:
+    choices = list(dict.fromkeys([correct, *wrong]))
+    rng.shuffle(choices)
+    return choices, choices.index(correct)
+
+
+def _problem_questions(problem: MentalProblem, rng: random.Random) -> list[dict[str, object]]:
+    """Une question sur la réécriture, puis une par étape de calcul."""
+
+    title = KIND_TITLES[problem.kind].split(" :")[0]
+    choices, answer = _shuffled(problem.rewrite, list(problem.wrong_rewrites), rng)
+    questions: list[dict[str, object]] = [
+        {
+            "question": f"[{title}] Pour calculer {problem.expression}, quelle réécriture est juste ?",
+            "choices": choices,
+            "answer": answer,
+            "explain": f"{problem.expression} = {problem.rewrite} : {_STRATEGY_HINTS[problem.kind]}.",
+        }
+    ]
+    for number, step in enumerate(problem.steps, start=1):
+        value = format_number(step.value)
+        last = number == len(problem.steps)
+        choices, answer = _shuffled(value, [format_number(wrong) for wrong in step.wrong[:2]], rng)
+        questions.append(
+            {
+                "question": f"{step.text} =",
+                "choices": choices,
+                "answer": answer,
+                "explain": f"Donc {problem.expression} = {value}." if last else f"{step.text} = {value}.",
+            }
+        )
+    return questions
+
+
+def _generated_exercise(kind: str) -> None:
+    seed = random.randrange(1 << 32)
+    rng = random.Random(seed)
+    questions = [
+        question
+        for problem in problem_set(kind, GENERATED_PROBLEMS, seed)
+        for question in _problem_questions(problem, rng)
+    ]
+    _run_guided_quiz(
+        f"gen_{kind}",
+        f"Entraînement — {KIND_TITLES[kind]}",
+        f"Des calculs inventés à chaque fois : {_STRATEGY_HINTS[kind]}.",
+        questions,
+    )
+
+
 def main() -> None:
     show_lesson(
         f"""
@@ -459,6 +521,7 @@ Chaque quiz est découpé en mini-étapes pour ralentir le raisonnement :
 - écrire la bonne expression ;
 - calculer sans sauter d'étape ;
 - vérifier le résultat.
+Les entraînements en fin de menu inventent de nouveaux calculs à chaque fois.
 """
     )
 
@@ -471,6 +534,9 @@ Chaque quiz est découpé en mini-étapes pour ralentir le raisonnement :
         ("Exercice 4 bis — Sortie au cinéma", _exercise_4_bis),
         ("Exercice 5 — Expressions et phrases", _exercise_5),
         ("Exercice 5 bis — Expressions et phrases", _exercise_5_bis),
+        ("Entraînement — Compensation (calculs inventés)", lambda: _generated_exercise("compensation")),
+        ("Entraînement — Décomposition (calculs inventés)", lambda: _generated_exercise("decomposition")),
+        ("Entraînement — Doubler et diviser par 2 (calculs inventés)", lambda: _generated_exercise("doubling")),
     ]
 
     while True:
@@ -1,7 +1,13 @@
 """Leçon et quiz centrés sur la comparaison et l'encadrement des nombres décimaux."""
 
+from __future__ import annotations
+
+import random
 import textwrap
+from itertools import chain
 
+from .difficulty import load_difficulty
+from .drills import decimals
 from .logger import log_result
 from .utils import ask_choice_with_navigation, format_fraction, show_lesson
 
@@ -13,6 +19,53 @@ CYAN = "\033[96m"
 BOLD = "\033[1m"
 RESET = "\033[0m"
 
+DIFFICULTY = load_difficulty("math_comparaison_encadrement_decimaux")
+COMPARISON_SKILL = "comparer deux décimaux"
+# Comparaisons générées après les questions fixes, au niveau de l'élève.
+ADAPTIVE_QUESTIONS = 5
+
+
+def _decimal_text(whole: int, digits: str) -> str:
+    return f"{whole},{digits}" if digits else str(whole)
+
+
+def _comparison_question(numbers: dict[int, list[tuple[int, str]]] | None = None) -> dict:
+    """Génère « Lequel est le plus grand ? » à la difficulté courante.
+
+    Plus le niveau monte, plus les nombres ont de décimales, partagent leur
+    partie entière et leurs premiers chiffres, et plus le piège « le nombre
+    le plus long n'est pas le plus grand » (8,7 / 8,07) revient souvent.
+    ``numbers`` fournit, par nombre de décimales, les premiers nombres
+    tirés d'avance (tous différents) ; on en tire un au besoin.
+    """
+
+    level = DIFFICULTY.level(COMPARISON_SKILL)
+    places = DIFFICULTY.scaled(COMPARISON_SKILL, 1, 3)
+    batch = numbers.get(places) if numbers is not None else None
+    whole, first = batch.pop() if batch else decimals(1, places)[0]
+    if level > 0.6 and random.random() < 0.2:
+        # Même nombre écrit avec un zéro inutile : 4,5 = 4,50.
+        second_whole, second = whole, first + "0"
+    else:
+        second_whole = whole
+        if random.random() >= 0.5 + level:
+            second_whole = max(0, whole + random.choice((-3, -2, -1, 1, 2, 3)))
+        second_places = random.randint(1, places) if level >= 0.5 else places
+        shared = min(second_places - 1, int(level * places))
+        second = first[:shared] + "".join(random.choice("0123456789") for _ in range(second_places - shared))
+    a, b = _decimal_text(whole, first), _decimal_text(second_whole, second)
+    a_value = (whole, first.ljust(4, "0"))
+    b_value = (second_whole, second.ljust(4, "0"))
+    if a_value == b_value and a == b:
+        return _comparison_question(numbers)
+    answer = 2 if a_value == b_value else (0 if a_value > b_value else 1)
+    return {
+        "question": f"Lequel est le plus grand : {a} ou {b} ?",
+        "choices": [a, b, "Ils sont égaux"],
+        "answer": answer,
+        "skill": COMPARISON_SKILL,
+    }
+
 
 def main() -> None:
     """Affiche la leçon inspirée du support et lance un quiz de 20 questions."""
@@ -176,7 +229,11 @@ Prêt ? Entraîne-toi maintenant sur la comparaison et l'encadrement !
         " Tape 'q' à tout moment pour retourner au menu précédent."
     )
     score = 0
-    for i, q in enumerate(questions, start=1):
+    # Les questions adaptatives sont générées au moment d'être posées, à partir
+    # de nombres distincts tirés d'un coup pour chaque nombre de décimales.
+    numbers = {places: decimals(ADAPTIVE_QUESTIONS, places) for places in range(1, 4)}
+    adaptive = (_comparison_question(numbers) for _ in range(ADAPTIVE_QUESTIONS))
+    for i, q in enumerate(chain(questions, adaptive), start=1):
         question_label = f"Question {i}: "
         question_lines = q["question"].splitlines()
         if question_lines:
@@ -190,8 +247,11 @@ Prêt ? Entraîne-toi maintenant sur la comparaison et l'encadrement !
         student, option_letters, quit_requested = ask_choice_with_navigation(q["choices"])
         if quit_requested:
             print("\nRetour au menu Mathématiques demandé. Fin du quiz.\n")
+            DIFFICULTY.save()
             return
         correct = q["answer"]
+        if "skill" in q:
+            DIFFICULTY.record(q["skill"], student == correct)
         correct_text = q["choices"][correct]
         correct_letter = option_letters[correct]
         if student == correct:
@@ -205,7 +265,8 @@ Prêt ? Entraîne-toi maintenant sur la comparaison et l'encadrement !
             for extra_line in correct_lines[1:]:
                 print(f"{RED}   {extra_line}{RESET}")
 
-    total = len(questions)
+    total = len(questions) + ADAPTIVE_QUESTIONS
+    DIFFICULTY.save()
     print(f"\n{BOLD}Score final : {score}/{total}{RESET}")
     if score == total:
         print(f"{GREEN}Bravo ! Tu maîtrises les comparaisons et encadrements décimaux. 🥳{RESET}")
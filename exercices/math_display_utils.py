@@ -6,7 +6,16 @@ and similar column-arithmetic exercises.
 
 from __future__ import annotations
 
+import io
 import os
+import re
+import shutil
+import sys
+import unicodedata
+from contextlib import contextmanager, redirect_stdout
+from typing import Callable, Iterator, Sequence, TextIO
+
+from .keyboard import key_session
 
 # ANSI escape codes
 GREEN = "\033[92m"
@@ -18,8 +27,145 @@ BOLD = "\033[1m"
 RESET = "\033[0m"
 
 
+# Cursor home + erase screen + erase scrollback: what ``clear`` emits, without
+# spawning a shell and a ``clear`` process for every frame.
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+
+# Lines kept free below a retained frame for prompts and answers; if the
+# frame plus this margin does not fit, the terminal could scroll and cursor
+# addressing would land on the wrong lines, so a full redraw is used instead.
+_PROMPT_MARGIN = 8
+
+_SGR_OR_CHAR = re.compile(r"\033\[[0-9;]*m|.", re.DOTALL)
+
+
+def _visible_width(text: str) -> int:
+    """Terminal columns taken by ``text`` (ANSI codes ignored, wide chars count 2)."""
+    width = 0
+    for token in _SGR_OR_CHAR.findall(text):
+        if token.startswith("\033"):
+            continue
+        width += 2 if unicodedata.east_asian_width(token) in ("W", "F") else 1
+    return width
+
+
+def _line_patch(row: int, old: str, new: str) -> str:
+    """Escape sequence rewriting ``old`` into ``new`` on screen line ``row``.
+
+    Only the part from the first differing character onwards is sent.  The
+    colour codes active at that point are replayed so the tail keeps its
+    style.
+    """
+    split = 0
+    active: list[str] = []
+    for token in _SGR_OR_CHAR.findall(new):
+        end = split + len(token)
+        if old[split:end] != token:
+            break
+        if token.startswith("\033"):
+            active = [] if token in (RESET, "\033[m") else active + [token]
+        split = end
+    column = _visible_width(new[:split]) + 1
+    return f"\033[{row};{column}H{RESET}{''.join(active)}{new[split:]}\033[K"
+
+
+class TerminalRenderer:
+    """Draw full frames with ANSI sequences and a single write per frame.
+
+    Everything printed inside :meth:`frame` is captured, then written to the
+    terminal in one go, preceded by :data:`CLEAR_SCREEN`.  The learner never
+    sees a half-drawn frame and no subprocess is involved.
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self._stream = stream
+        self._vt_enabled = os.name != "nt"
+        # Lines currently on screen from the last retained frame, or ``None``
+        # when the screen content is unknown (after a full-screen frame).
+        self._retained: list[str] | None = None
+
+    @property
+    def stream(self) -> TextIO:
+        # Resolved lazily so redirections of ``sys.stdout`` are honoured.
+        return self._stream or sys.stdout
+
+    def write(self, data: str) -> None:
+        """Write ``data`` to the terminal and flush immediately."""
+        if not self._vt_enabled:  # pragma: no cover - Windows only
+            # An empty ``system`` call switches the Windows console to
+            # VT processing so the escape sequences are interpreted.
+            os.system("")
+            self._vt_enabled = True
+        self.stream.write(data)
+        self.stream.flush()
+
+    def clear(self) -> None:
+        self._retained = None
+        self.write(CLEAR_SCREEN)
+
+    def present(self, text: str) -> None:
+        """Replace the whole screen with ``text``."""
+        self._retained = None
+        self.write(CLEAR_SCREEN + text)
+
+    def present_lines(self, lines: list[str]) -> None:
+        """Show ``lines`` at the top of the screen, rewriting only what changed.
+
+        The previous retained frame is compared line by line; changed lines
+        are patched in place with cursor addressing, from their first changed
+        cell onwards, and everything below
+        the frame (prompts, answers typed by the learner) is erased.  The
+        cursor is left on the line just below the frame, exactly as after a
+        full redraw.  Falls back to a full redraw when the screen content is
+        unknown or the frame might not fit on screen.
+        """
+        previous = self._retained
+        rows = shutil.get_terminal_size(fallback=(80, 24)).lines
+        if previous is None or len(lines) + _PROMPT_MARGIN > rows:
+            self.present("".join(line + "\n" for line in lines))
+            self._retained = list(lines)
+            return
+        out = [
+            _line_patch(row, previous[row - 1] if row <= len(previous) else "", line)
+            for row, line in enumerate(lines, start=1)
+            if row > len(previous) or previous[row - 1] != line
+        ]
+        out.append(f"\033[{len(lines) + 1};1H\033[J")
+        self.write("".join(out))
+        self._retained = list(lines)
+
+    @contextmanager
+    def frame(self) -> Iterator[None]:
+        """Capture ``print`` output and present it as one frame on exit."""
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            yield
+        self.present(buffer.getvalue())
+
+    @contextmanager
+    def retained_frame(self) -> Iterator[None]:
+        """Like :meth:`frame`, but only send the lines that changed."""
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            yield
+        self.present_lines(buffer.getvalue().splitlines())
+
+
+renderer = TerminalRenderer()
+
+
 def clear_screen() -> None:
-    os.system("cls" if os.name == "nt" else "clear")
+    renderer.clear()
+
+
+def frame():
+    """Shortcut for :meth:`TerminalRenderer.frame` on the shared renderer."""
+    return renderer.frame()
+
+
+def retained_frame():
+    """Shortcut for :meth:`TerminalRenderer.retained_frame` on the shared renderer."""
+    return renderer.retained_frame()
 
 
 def render_digit_cell(
@@ -85,3 +231,36 @@ def render_number_row(
 def render_separator(total_cols: int, *, prefix: str = "   ") -> str:
     """Return a separator line spanning all digit columns."""
     return prefix + "─" * (total_cols * 3)
+
+
+def capture_lines(draw: Callable[..., None], *args, **kwargs) -> list[str]:
+    """Call ``draw`` and return what it printed, as a list of lines."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        draw(*args, **kwargs)
+    return buffer.getvalue().splitlines()
+
+
+def animate(frames: Sequence[list[str]], interval: float) -> None:
+    """Play ``frames`` (lists of lines) with ``interval`` seconds between them.
+
+    Frames are drawn through :meth:`TerminalRenderer.present_lines`, so only
+    the cells that change between two frames are rewritten.  The process
+    sleeps in ``select`` between frames, and any key press skips straight to
+    the last frame.  Without a terminal only the last frame is shown.
+    """
+    if not frames:
+        return
+    with key_session() as keys:
+        if keys is not None:
+            for lines in frames[:-1]:
+                renderer.present_lines(lines)
+                if keys.poll(interval):
+                    keys.flush()
+                    break
+        renderer.present_lines(frames[-1])
+
+
+def blink(on: list[str], off: list[str], *, duration: float = 1.0, n_blinks: int = 4) -> None:
+    """Flash between ``on`` and ``off`` for ``duration`` seconds, ending on ``on``."""
+    animate([on, off] * n_blinks + [on], duration / (n_blinks * 2))
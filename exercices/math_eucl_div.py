@@ -4,46 +4,107 @@ from __future__ import annotations
 DISPLAY_NAME = "Maths : Division euclidienne"
 
 import re
+import shutil
 import time
 from dataclasses import dataclass
 
-from .math_display_utils import GREEN, YELLOW, CYAN, RED, MAGENTA, BOLD, RESET, clear_screen
+from .math_display_utils import GREEN, YELLOW, CYAN, RED, MAGENTA, BOLD, RESET, clear_screen, frame, renderer, retained_frame
 
 # Consistent colour for the divisor throughout the whole exercise
 _M = MAGENTA + BOLD   # "divisor colour" — apply as f"{_M}{divisor}{RESET}"
+from .difficulty import load_difficulty
+from .drills import digits_range, divisions
 from .math_multiplication_1chiffre import run_multiplication_interactive
+from .math_solutions import DivisionStep, SubtractionPlan, division_steps, plan_subtraction
 
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
+DIFFICULTY = load_difficulty("math_eucl_div")
+_QUOTIENT_SKILL = "chiffre du quotient"
+# Below this level the proposed divisions have no remainder.
+_EXACT_LEVEL = 0.25
+
+
 @dataclass
-class _Step:
-    end_col: int           # last dividend column consumed (0-based)
-    partial_dividend: int  # e.g. 73
-    quotient_digit: int    # 0–9
-    product: int           # quotient_digit × divisor
-    remainder: int         # partial_dividend − product
-
-
-def _precompute(dividend_str: str, divisor: int) -> list[_Step]:
-    steps: list[_Step] = []
-    current = 0
-    n = len(dividend_str)
-    for i, ch in enumerate(dividend_str):
-        current = current * 10 + int(ch)
-        if current < divisor and not steps:
-            continue
-        q = current // divisor
-        prod = q * divisor
-        rem = current - prod
-        steps.append(_Step(i, current, q, prod, rem))
-        current = rem
-    if not steps:
-        # whole dividend smaller than divisor
-        steps.append(_Step(n - 1, int(dividend_str), 0, 0, int(dividend_str)))
-    return steps
+class _DecimalStep:
+    partial: int    # previous remainder × 10 ("on abaisse un 0")
+    digit: int      # decimal digit of the quotient
+    remainder: int  # partial − digit × divisor
+
+
+@dataclass
+class DivisionExpansion:
+    quotient: str                     # integer part of the quotient
+    remainder: int                    # remainder of the euclidean division
+    decimal_steps: list[_DecimalStep]
+    period_start: int | None          # index of the first repeating decimal
+    truncated: bool                   # stopped at max_decimals before the end
+
+    @property
+    def decimals(self) -> str:
+        return "".join(str(step.digit) for step in self.decimal_steps)
+
+
+_MAX_DECIMALS = 2000
+
+
+def _expand_decimals(remainder: int, divisor: int, max_decimals: int) -> tuple[list[_DecimalStep], int | None, bool]:
+    """Continue the division after the decimal point.
+
+    Each remainder is recorded with the position where it first appeared;
+    meeting it again means every following digit repeats from there.  One
+    dictionary lookup per digit keeps this linear in the number of decimals.
+    """
+    steps: list[_DecimalStep] = []
+    seen: dict[int, int] = {}
+    while remainder:
+        if remainder in seen:
+            return steps, seen[remainder], False
+        if len(steps) >= max_decimals:
+            return steps, None, True
+        seen[remainder] = len(steps)
+        partial = remainder * 10
+        digit, remainder = divmod(partial, divisor)
+        steps.append(_DecimalStep(partial, digit, remainder))
+    return steps, None, False
+
+
+def expand_division(dividend_str: str, divisor: int, max_decimals: int = _MAX_DECIMALS) -> DivisionExpansion:
+    """Euclidean division of ``dividend_str`` by ``divisor``, then its decimals."""
+    steps = division_steps(dividend_str, divisor)
+    quotient = "".join(str(step.quotient_digit) for step in steps).lstrip("0") or "0"
+    remainder = steps[-1].remainder
+    decimal_steps, period_start, truncated = _expand_decimals(remainder, divisor, max_decimals)
+    return DivisionExpansion(quotient, remainder, decimal_steps, period_start, truncated)
+
+
+def _expansion_lines(expansion: DivisionExpansion, width: int) -> list[str]:
+    """Write the quotient with its repetend overlined, wrapped to ``width``.
+
+    The repeating digits get a bar ("_" on the line above), as in class.
+    """
+    number = expansion.quotient
+    decimals = expansion.decimals
+    if decimals:
+        number += "," + decimals
+    if expansion.truncated:
+        number += "…"
+    bar = [" "] * len(number)
+    if expansion.period_start is not None:
+        first = len(expansion.quotient) + 1 + expansion.period_start
+        bar[first:first + len(decimals) - expansion.period_start] = "_" * (len(decimals) - expansion.period_start)
+    bar_str = "".join(bar)
+    width = max(10, width)
+    lines: list[str] = []
+    for start in range(0, len(number), width):
+        chunk_bar = bar_str[start:start + width].rstrip()
+        if chunk_bar:
+            lines.append(f"  {YELLOW}{chunk_bar}{RESET}")
+        lines.append(f"  {BOLD}{number[start:start + width]}{RESET}")
+    return lines
 
 
 # ---------------------------------------------------------------------------
@@ -94,7 +155,7 @@ def _sep_str(end_col: int, n_wide: int, nd: int) -> str:
 def _render_canvas(
     dividend_str: str,
     divisor_str: str,
-    steps: list[_Step],
+    steps: list[DivisionStep],
     *,
     q_digits: list[str | None],           # per step: char or None (hidden)
     products: list[list[str] | None],      # per step: slots or None (hidden)
@@ -126,125 +187,124 @@ def _render_canvas(
             sl[col] = _s(d, color)
         return "".join(sl)
 
-    clear_screen()
-
-    # ── Label row ──────────────────────────────────────────────────────────
-    lc = DIM if sm else CYAN
-    left_w = 2 + nd * 3
-    print(
-        f"  {lc}dividende{RESET}"
-        + " " * max(0, left_w - 11)
-        + "    "
-        + f"{lc}diviseur{RESET}"
-    )
+    with retained_frame():
+        # ── Label row ──────────────────────────────────────────────────────────
+        lc = DIM if sm else CYAN
+        left_w = 2 + nd * 3
+        print(
+            f"  {lc}dividende{RESET}"
+            + " " * max(0, left_w - 11)
+            + "    "
+            + f"{lc}diviseur{RESET}"
+        )
 
-    # ── Dividend │ Divisor ─────────────────────────────────────────────────
-    div_slots = []
-    for j, d in enumerate(dividend_str):
-        if sm:
-            color = CYAN if j == active_sub_col else DIM
-        elif highlight_dividend_col == j:
-            color = CYAN
-        elif active_sub_col == j:
-            color = CYAN
-        elif focus_col_range is not None and not (focus_col_range[0] <= j <= focus_col_range[1]):
-            color = DIM
+        # ── Dividend │ Divisor ─────────────────────────────────────────────────
+        div_slots = []
+        for j, d in enumerate(dividend_str):
+            if sm:
+                color = CYAN if j == active_sub_col else DIM
+            elif highlight_dividend_col == j:
+                color = CYAN
+            elif active_sub_col == j:
+                color = CYAN
+            elif focus_col_range is not None and not (focus_col_range[0] <= j <= focus_col_range[1]):
+                color = DIM
+            else:
+                color = BOLD
+            div_slots.append(_s(d, color))
+        divisor_color = DIM if sm else MAGENTA
+        print(left("  ", div_slots) + BAR + right_slots(divisor_str, divisor_color))
+
+        # ── Blank │ separator under divisor ───────────────────────────────────
+        corner = f" {DIM}├{RESET} " if sm else f" {BOLD}├{RESET} "
+        horiz = f"{DIM}{'─' * (rw * 3)}{RESET}" if sm else "─" * (rw * 3)
+        print(left("  ", [_B] * nd) + corner + horiz)
+
+        # ── Blank │ quotient ──────────────────────────────────────────────────
+        q_sl = [_B] * rw
+        any_q = False
+        for i, qd in enumerate(q_digits):
+            if qd is not None:
+                col = rw - nsteps + i
+                q_sl[col] = _s(qd, DIM if sm else GREEN)
+                any_q = True
+        if any_q:
+            q_label = f"  {DIM}quotient{RESET}" if sm else f"  {CYAN}quotient{RESET}"
         else:
-            color = BOLD
-        div_slots.append(_s(d, color))
-    divisor_color = DIM if sm else MAGENTA
-    print(left("  ", div_slots) + BAR + right_slots(divisor_str, divisor_color))
-
-    # ── Blank │ separator under divisor ───────────────────────────────────
-    corner = f" {DIM}├{RESET} " if sm else f" {BOLD}├{RESET} "
-    horiz = f"{DIM}{'─' * (rw * 3)}{RESET}" if sm else "─" * (rw * 3)
-    print(left("  ", [_B] * nd) + corner + horiz)
-
-    # ── Blank │ quotient ──────────────────────────────────────────────────
-    q_sl = [_B] * rw
-    any_q = False
-    for i, qd in enumerate(q_digits):
-        if qd is not None:
-            col = rw - nsteps + i
-            q_sl[col] = _s(qd, DIM if sm else GREEN)
-            any_q = True
-    if any_q:
-        q_label = f"  {DIM}quotient{RESET}" if sm else f"  {CYAN}quotient{RESET}"
-    else:
-        q_label = ""
-    print(left("  ", [_B] * nd) + BAR + "".join(q_sl) + q_label)
-
-    # ── Steps ──────────────────────────────────────────────────────────────
-    for i, step in enumerate(steps):
-        if step.quotient_digit == 0:
-            # Dividend < divisor: no subtraction row, just show remainder/reste
-            if i == nsteps - 1:
-                r_slots = remainders[i] if remainders[i] is not None else [_B] * nd
-                if sm:
-                    r_slots = [_dim_slot(s) for s in r_slots]
-                reste_label = f"  {CYAN}reste{RESET}" if remainders[i] is not None else ""
-                print(left("  ", r_slots) + reste_label)
-            continue
+            q_label = ""
+        print(left("  ", [_B] * nd) + BAR + "".join(q_sl) + q_label)
+
+        # ── Steps ──────────────────────────────────────────────────────────────
+        for i, step in enumerate(steps):
+            if step.quotient_digit == 0:
+                # Dividend < divisor: no subtraction row, just show remainder/reste
+                if i == nsteps - 1:
+                    r_slots = remainders[i] if remainders[i] is not None else [_B] * nd
+                    if sm:
+                        r_slots = [_dim_slot(s) for s in r_slots]
+                    reste_label = f"  {CYAN}reste{RESET}" if remainders[i] is not None else ""
+                    print(left("  ", r_slots) + reste_label)
+                continue
+
+            # Non-active steps: dim everything during subtraction
+            if sm and i != active_step:
+                if products[i] is not None:
+                    print(f"{DIM}─ {RESET}" + "".join(_dim_slot(s) for s in products[i]))
+                else:
+                    print(left("  ", [_B] * nd))
+                if seps_shown[i]:
+                    n_wide = max(len(str(step.product)), len(str(step.partial_dividend)))
+                    print(f"{DIM}{_sep_str(step.end_col, n_wide, nd)}{RESET}")
+                else:
+                    print(left("  ", [_B] * nd))
+                r_src = remainders[i] if remainders[i] is not None else [_B] * nd
+                print(left("  ", [_dim_slot(s) for s in r_src]))
+                continue
 
-        # Non-active steps: dim everything during subtraction
-        if sm and i != active_step:
+            # Product row: "─ " prefix
             if products[i] is not None:
-                print(f"{DIM}─ {RESET}" + "".join(_dim_slot(s) for s in products[i]))
+                if i == active_step and active_sub_col is not None:
+                    # Color active product digit RED, dim the others
+                    prod_s = str(step.product)
+                    prod_start = step.end_col - len(prod_s) + 1
+                    p_slots = [_B] * nd
+                    for c in range(prod_start, step.end_col + 1):
+                        pd = prod_s[c - prod_start]
+                        p_slots[c] = _s(pd, RED if c == active_sub_col else DIM)
+                    print(left("─ ", p_slots))
+                else:
+                    print(left("─ ", products[i]))
             else:
                 print(left("  ", [_B] * nd))
+
+            # Carry row: CYAN "1" at each column where a carry has been placed
+            if i == active_step and borrow_cols:
+                carry_slots = [_B] * nd
+                for bc in borrow_cols:
+                    if 0 <= bc < nd:
+                        carry_slots[bc] = _s("1", CYAN)
+                print(left("  ", carry_slots))
+
+            # Separator row
             if seps_shown[i]:
                 n_wide = max(len(str(step.product)), len(str(step.partial_dividend)))
-                print(f"{DIM}{_sep_str(step.end_col, n_wide, nd)}{RESET}")
+                print(_sep_str(step.end_col, n_wide, nd))
             else:
                 print(left("  ", [_B] * nd))
-            r_src = remainders[i] if remainders[i] is not None else [_B] * nd
-            print(left("  ", [_dim_slot(s) for s in r_src]))
-            continue
 
-        # Product row: "─ " prefix
-        if products[i] is not None:
-            if i == active_step and active_sub_col is not None:
-                # Color active product digit RED, dim the others
-                prod_s = str(step.product)
-                prod_start = step.end_col - len(prod_s) + 1
-                p_slots = [_B] * nd
-                for c in range(prod_start, step.end_col + 1):
-                    pd = prod_s[c - prod_start]
-                    p_slots[c] = _s(pd, RED if c == active_sub_col else DIM)
-                print(left("─ ", p_slots))
+            # Remainder/result row
+            if i == active_step and active_rem is not None:
+                r_slots = active_rem
+            elif remainders[i] is not None:
+                r_slots = remainders[i]
             else:
-                print(left("─ ", products[i]))
-        else:
-            print(left("  ", [_B] * nd))
-
-        # Carry row: CYAN "1" at each column where a carry has been placed
-        if i == active_step and borrow_cols:
-            carry_slots = [_B] * nd
-            for bc in borrow_cols:
-                if 0 <= bc < nd:
-                    carry_slots[bc] = _s("1", CYAN)
-            print(left("  ", carry_slots))
-
-        # Separator row
-        if seps_shown[i]:
-            n_wide = max(len(str(step.product)), len(str(step.partial_dividend)))
-            print(_sep_str(step.end_col, n_wide, nd))
-        else:
-            print(left("  ", [_B] * nd))
+                r_slots = [_B] * nd
 
-        # Remainder/result row
-        if i == active_step and active_rem is not None:
-            r_slots = active_rem
-        elif remainders[i] is not None:
-            r_slots = remainders[i]
-        else:
-            r_slots = [_B] * nd
-
-        if i == nsteps - 1:
-            reste_label = f"  {CYAN}reste{RESET}" if remainders[i] is not None else ""
-            print(left("  ", r_slots) + reste_label)
-        else:
-            print(left("  ", r_slots))
+            if i == nsteps - 1:
+                reste_label = f"  {CYAN}reste{RESET}" if remainders[i] is not None else ""
+                print(left("  ", r_slots) + reste_label)
+            else:
+                print(left("  ", r_slots))
 
 
 # ---------------------------------------------------------------------------
@@ -264,8 +324,9 @@ def _find_quotient_digit(partial: int, divisor: int) -> int:
     d0 = int(divisor_s[0])
     p0 = int(partial_s[0])
     hint_partial = int(partial_s[:2]) if (p0 < d0 and len(partial_s) > 1) else p0
-    # Only show the hint when it offers a simpler sub-problem than the full question
-    if hint_partial != partial or d0 != divisor:
+    # Only show the hint when it offers a simpler sub-problem than the full
+    # question, and only until the student finds quotient digits unaided.
+    if (hint_partial != partial or d0 != divisor) and not DIFFICULTY.hard(_QUOTIENT_SKILL):
         hint_line = (
             f"  {CYAN}Astuce :{RESET} commence par combien de fois "
             f"{_M}{d0}{RESET} entre dans {BOLD}{hint_partial}{RESET} "
@@ -278,24 +339,24 @@ def _find_quotient_digit(partial: int, divisor: int) -> int:
     tried: set[int] = set()
 
     while True:
-        clear_screen()
-        # ── Goal — always visible ────────────────────────────────────────
-        print(f"\n  {BOLD}Combien de fois {_M}{divisor}{RESET} entre dans {partial} ?{RESET}")
-        print(f"  (On cherche le plus grand chiffre N tel que N × {_M}{divisor}{RESET} ≤ {partial})\n")
-        print(hint_line + "\n")
-
-        # ── History of previous attempts ─────────────────────────────────
-        if history:
-            print(f"  Tes essais jusqu'ici :")
-            for hn, hprod, verdict in history:
-                if verdict == "trop_grand":
-                    print(f"    {RED}{hn} × {_M}{divisor}{RESET}{RED} = {hprod} > {partial}  → trop grand{RESET}")
-                else:
-                    hprod1 = (hn + 1) * divisor
-                    print(f"    {YELLOW}{hn} × {_M}{divisor}{RESET}{YELLOW} = {hprod} ≤ {partial},  "
-                          f"mais {CYAN}{BOLD}{hn+1}{RESET}{YELLOW} × {_M}{divisor}{RESET}{YELLOW}"
-                          f" = {hprod1} ≤ {partial}  → pas assez{RESET}")
-            print()
+        with frame():
+            # ── Goal — always visible ────────────────────────────────────
+            print(f"\n  {BOLD}Combien de fois {_M}{divisor}{RESET} entre dans {partial} ?{RESET}")
+            print(f"  (On cherche le plus grand chiffre N tel que N × {_M}{divisor}{RESET} ≤ {partial})\n")
+            print(hint_line + "\n")
+
+            # ── History of previous attempts ─────────────────────────────
+            if history:
+                print(f"  Tes essais jusqu'ici :")
+                for hn, hprod, verdict in history:
+                    if verdict == "trop_grand":
+                        print(f"    {RED}{hn} × {_M}{divisor}{RESET}{RED} = {hprod} > {partial}  → trop grand{RESET}")
+                    else:
+                        hprod1 = (hn + 1) * divisor
+                        print(f"    {YELLOW}{hn} × {_M}{divisor}{RESET}{YELLOW} = {hprod} ≤ {partial},  "
+                              f"mais {CYAN}{BOLD}{hn+1}{RESET}{YELLOW} × {_M}{divisor}{RESET}{YELLOW}"
+                              f" = {hprod1} ≤ {partial}  → pas assez{RESET}")
+                print()
 
         raw = input(f"  Essaie : {_M}{divisor}{RESET} × ___ ?   Chiffre (0-9) : ").strip()
         if not raw.isdigit() or len(raw) != 1:
@@ -355,6 +416,7 @@ def _find_quotient_digit(partial: int, divisor: int) -> int:
             print(f"  {GREEN}{BOLD}Donc le chiffre du quotient est {n} :{RESET}")
             print(f"  {GREEN}c'est le plus grand chiffre pour lequel {_M}{divisor}{RESET}{GREEN} × {n} tient encore dans {partial}.{RESET}\n")
             input("  Entrée pour continuer...")
+            DIFFICULTY.record(_QUOTIENT_SKILL, not history)
             return n
 
 
@@ -365,7 +427,7 @@ def _find_quotient_digit(partial: int, divisor: int) -> int:
 def _do_subtraction(
     dividend_str: str,
     divisor_str: str,
-    steps: list[_Step],
+    steps: list[DivisionStep],
     step_idx: int,
     *,
     q_digits: list[str | None],
@@ -373,6 +435,7 @@ def _do_subtraction(
     seps_shown: list[bool],
     remainders: list[list[str] | None],
     focus_col_range: tuple[int, int] | None = None,
+    plan: SubtractionPlan | None = None,
 ) -> list[str]:
     """Guide the student through partial_dividend − product digit by digit.
     Returns the fully-revealed result slots list (nd entries)."""
@@ -382,22 +445,24 @@ def _do_subtraction(
     product = step.product
     end_col = step.end_col
 
-    partial_s = str(partial)
-    product_s = str(product)
-    # Pad product to same length as partial
-    n_digits = max(len(partial_s), len(product_s))
-    partial_s = partial_s.zfill(n_digits)
-    product_s = product_s.zfill(n_digits)
+    # The whole borrow schedule is known before the first column is shown;
+    # the loop below only replays it.
+    if plan is None:
+        plan = plan_subtraction(partial, product)
+    n_digits = len(plan)
 
     result_slots: list[str] = [_B] * nd
-    carry = 0           # Austrian method: carry adds +1 to subtrahend of next column
     borrow_cols: list[int] = []   # columns where carry "1" markers persist in display
 
-    for pos in range(n_digits - 1, -1, -1):
-        col = end_col - (n_digits - 1 - pos)
-        top_d = int(partial_s[pos])    # minuend digit (never modified in Austrian method)
-        bot_d = int(product_s[pos])    # subtrahend digit before carry
+    for k in range(n_digits):
+        col = end_col - k
+        top_d = plan.top[k]            # minuend digit (never modified in Austrian method)
+        bot_d = plan.bottom[k]         # subtrahend digit before carry
+        carry = plan.carry_in[k]       # Austrian method: carry adds +1 to subtrahend
         effective_bot = bot_d + carry  # actual value to subtract
+        needs_borrow = bool(plan.borrowed[k])
+        borrowed_top = top_d + 10      # only shown when needs_borrow
+        expected = plan.result[k]
 
         seps_shown[step_idx] = True
 
@@ -416,18 +481,6 @@ def _do_subtraction(
                 subtraction_mode=True,
             )
 
-        # Pre-compute this column's arithmetic
-        if top_d < effective_bot:
-            borrowed_top = top_d + 10
-            next_carry = 1
-            expected = borrowed_top - effective_bot
-            needs_borrow = True
-        else:
-            borrowed_top = 0  # unused
-            next_carry = 0
-            expected = top_d - effective_bot
-            needs_borrow = False
-
         # --- Presentation phase (runs once per column) ---
         _draw()
 
@@ -458,7 +511,6 @@ def _do_subtraction(
             raw = input("  > ").strip()
             if raw.lstrip("-").isdigit() and int(raw) == expected:
                 result_slots[col] = _s(str(expected), GREEN)
-                carry = next_carry
                 break
             else:
                 prompt_top = borrowed_top if needs_borrow else top_d
@@ -480,8 +532,13 @@ def run_division_interactive(dividend: int, divisor: int) -> None:
     dividend_str = str(dividend)
     divisor_str = str(divisor)
     nd = len(dividend_str)
-    steps = _precompute(dividend_str, divisor)
+    steps = division_steps(dividend_str, divisor)
     nsteps = len(steps)
+    # Borrow schedules of every subtraction, planned before the first frame
+    sub_plans = [
+        plan_subtraction(step.partial_dividend, step.product) if step.quotient_digit else None
+        for step in steps
+    ]
 
     # Canvas state (all hidden initially)
     q_digits: list[str | None] = [None] * nsteps
@@ -584,6 +641,7 @@ def run_division_interactive(dividend: int, divisor: int) -> None:
             seps_shown=seps_shown,
             remainders=remainders,
             focus_col_range=focus,
+            plan=sub_plans[i],
         )
 
         # ── Phase E: descent with highlight ───────────────────────────────
@@ -635,25 +693,159 @@ def run_division_interactive(dividend: int, divisor: int) -> None:
     input("  Entrée pour terminer...")
 
 
+# ---------------------------------------------------------------------------
+# Decimal expansion: scrolling step list instead of the canvas
+# ---------------------------------------------------------------------------
+
+def _short(number: int | str, max_len: int = 24) -> str:
+    """Shorten huge numbers as ``1234…7890`` so every step fits on one line."""
+    s = str(number)
+    if len(s) <= max_len:
+        return s
+    keep = (max_len - 1) // 2
+    return f"{s[:keep]}…{s[-keep:]}"
+
+
+def _decimal_step_line(index: int, step: _DecimalStep, divisor: int) -> str:
+    return (
+        f"  {DIM}{index + 1:>4}e{RESET}  reste {_short(step.partial // 10)} → on abaisse un 0 : "
+        f"{_short(step.partial)} ÷ {_M}{_short(divisor)}{RESET} = {GREEN}{step.digit}{RESET}"
+        f"  reste {_short(step.remainder)}"
+    )
+
+
+def _page_lines(lines: list[str]) -> None:
+    """Show ``lines`` one screen at a time instead of one huge canvas."""
+    size = shutil.get_terminal_size(fallback=(80, 24))
+    height = max(5, size.lines - 3)
+    for start in range(0, len(lines), height):
+        renderer.present_lines(lines[start:start + height])
+        if start + height < len(lines):
+            input("  Entrée pour la suite...")
+
+
+def run_decimal_expansion_interactive(
+    dividend_str: str, divisor: int, *, max_decimals: int = _MAX_DECIMALS,
+) -> None:
+    """Continue the division after the decimal point, one digit at a time.
+
+    The steps scroll in a window sized to the terminal; the learner finds
+    each decimal or types ``f`` to let the computer finish.  When a remainder
+    comes back, the repeating period is shown.
+    """
+    expansion = expand_division(dividend_str, divisor, max_decimals)
+    size = shutil.get_terminal_size(fallback=(80, 24))
+    window = max(3, size.lines - 13)  # one line kept for the hint
+    head_width = max(20, size.columns - 30)
+    title = f"  {BOLD}{_short(dividend_str, 40)} ÷ {_M}{_short(divisor, 40)}{RESET}{BOLD} après la virgule{RESET}"
+    decimals = expansion.decimals
+    history: list[str] = []
+    auto = False
+
+    for index, step in enumerate(expansion.decimal_steps):
+        hint = ""
+        while not auto:
+            so_far = expansion.quotient + "," + decimals[:index]
+            if len(so_far) > head_width:
+                so_far = "…" + so_far[-head_width:]
+            # The hint is part of the frame, so a wrong answer never scrolls it.
+            renderer.present_lines([
+                title,
+                f"  Quotient : {GREEN}{BOLD}{so_far}{RESET}",
+                "",
+                *history[-window:],
+                f"  {YELLOW}{index + 1:>4}e{RESET}  reste {_short(step.partial // 10)}"
+                f" → on abaisse un 0 : {BOLD}{_short(step.partial)}{RESET} ÷ {_M}{_short(divisor)}{RESET} = ?",
+                hint,
+            ])
+            raw = input("  Chiffre (0-9), ou 'f' pour finir automatiquement : ").strip().lower()
+            if raw == "f":
+                auto = True
+            elif raw.isdigit() and len(raw) == 1:
+                digit = int(raw)
+                if digit == step.digit:
+                    break
+                # Same hints as the potence steps, then the learner tries again.
+                if digit > step.digit:
+                    hint = (f"  {RED}{digit} × {_short(divisor)} = {_short(digit * divisor)}"
+                            f" > {_short(step.partial)} → trop grand, essaie plus petit !{RESET}")
+                else:
+                    hint = (f"  {YELLOW}{digit + 1} × {_short(divisor)} = {_short((digit + 1) * divisor)}"
+                            f" ≤ {_short(step.partial)} aussi : tu peux faire mieux !{RESET}")
+        history.append(_decimal_step_line(index, step, divisor))
+
+    lines = [title, ""]
+    if expansion.period_start is not None:
+        repeated = expansion.decimal_steps[expansion.period_start].partial // 10
+        period = len(expansion.decimal_steps) - expansion.period_start
+        lines.append(
+            f"  {CYAN}Le reste {_short(repeated)} est déjà apparu avant la décimale n° "
+            f"{expansion.period_start + 1} : les {period} chiffre(s) soulignés au-dessus se répètent à l'infini.{RESET}"
+        )
+    elif expansion.truncated:
+        lines.append(f"  {YELLOW}Arrêt après {max_decimals} décimales : la suite continue.{RESET}")
+    else:
+        lines.append(f"  {GREEN}Le reste est 0 : la division tombe juste.{RESET}")
+    lines.append("")
+    lines.extend(_expansion_lines(expansion, size.columns - 4))
+    lines.append("")
+    _page_lines(lines)
+    input("  Entrée pour terminer...")
+
+
+def _canvas_fits(dividend_str: str, divisor_str: str) -> bool:
+    """Whether the potence canvas for this division fits the terminal width."""
+    steps = len(dividend_str)  # upper bound on the number of quotient digits
+    width = 2 + 3 * len(dividend_str) + 3 + 3 * max(len(divisor_str), steps) + 10
+    return width <= shutil.get_terminal_size(fallback=(80, 24)).columns
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
+def _suggest_division() -> tuple[int, int]:
+    """Division sized to the student's level: exact ones first, then longer
+    dividends, then two-digit divisors."""
+    digits = DIFFICULTY.scaled(_QUOTIENT_SKILL, 2, 5)
+    divisors = range(11, 50) if DIFFICULTY.hard(_QUOTIENT_SKILL) else range(2, 10)
+    exact = True if DIFFICULTY.level(_QUOTIENT_SKILL) < _EXACT_LEVEL else None
+    drill = divisions(1, digits_range(digits), divisors, exact=exact)[0]
+    return drill.left, drill.right
+
+
 def main() -> None:
     print(f"\n{BOLD}=== Division euclidienne ==={RESET}\n")
+    divisor = 0
     while True:
-        raw = input("Dividende (entier positif) : ").strip()
+        raw = input("Dividende (entier positif, Entrée pour une division proposée) : ").strip()
+        if not raw:
+            dividend, divisor = _suggest_division()
+            print(f"Division proposée : {dividend} ÷ {divisor}")
+            break
         if raw.isdigit() and int(raw) > 0:
             dividend = int(raw)
             break
         print(f"{RED}Entre un entier positif.{RESET}")
-    while True:
+    while not divisor:
         raw = input("Diviseur (entier ≥ 2) : ").strip()
         if raw.isdigit() and int(raw) >= 2:
             divisor = int(raw)
             break
         print(f"{RED}Entre un entier supérieur ou égal à 2.{RESET}")
-    run_division_interactive(dividend, divisor)
+    dividend_str = str(dividend)
+    if _canvas_fits(dividend_str, str(divisor)):
+        run_division_interactive(dividend, divisor)
+        DIFFICULTY.save()
+    else:
+        expansion = expand_division(dividend_str, divisor, max_decimals=0)
+        print(f"\n  {YELLOW}Ces nombres sont trop longs pour poser la division à l'écran.{RESET}")
+        print(f"  Quotient : {BOLD}{expansion.quotient}{RESET}")
+        print(f"  Reste : {BOLD}{expansion.remainder}{RESET}\n")
+    if dividend % divisor:
+        raw = input("Veux-tu continuer la division après la virgule ? (o/n) ").strip().lower()
+        if raw in {"o", "oui"}:
+            run_decimal_expansion_interactive(dividend_str, divisor)
 
 
 if __name__ == "__main__":
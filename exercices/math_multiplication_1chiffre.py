@@ -4,7 +4,7 @@ from __future__ import annotations
 
 DISPLAY_NAME = "Maths : Multiplication par un chiffre"
 
-import time
+import random
 
 
 class _Cancelled(Exception):
@@ -23,8 +23,10 @@ def _inp(prompt: str) -> str:
 
 from .math_display_utils import (
     GREEN, YELLOW, CYAN, RED, BOLD, RESET,
-    clear_screen, render_number_row, render_separator,
+    blink, capture_lines, clear_screen, render_number_row, render_separator, renderer,
 )
+from .drills import digits_range, multiplications
+from .math_solutions import plan_multiplication
 
 
 # ---------------------------------------------------------------------------
@@ -42,6 +44,30 @@ def _show(
     carry: int = 0,
     carry_hl: bool = False,
     result_final: bool = False,                       # all result digits in green
+) -> None:
+    """Draw the full multiplication column layout, replacing what is on screen.
+
+    Only the cells that differ from the previous layout are actually sent.
+    """
+    renderer.present_lines(capture_lines(
+        _print_layout,
+        top, bot, result_slots,
+        top_hl=top_hl, bot_hl=bot_hl, result_hl=result_hl,
+        carry=carry, carry_hl=carry_hl, result_final=result_final,
+    ))
+
+
+def _print_layout(
+    top: str,
+    bot: str,
+    result_slots: list[str],
+    *,
+    top_hl: int | None,
+    bot_hl: bool,
+    result_hl: int | frozenset[int] | None,
+    carry: int,
+    carry_hl: bool,
+    result_final: bool,
 ) -> None:
     """Print the full multiplication column layout."""
     width = len(result_slots)
@@ -100,19 +126,21 @@ def _blink(
     duration: float = 1.0,
     n_blinks: int = 4,
 ) -> None:
-    """Flash a highlighted element on/off for `duration` seconds, ending highlighted."""
-    interval = duration / (n_blinks * 2)
-    for i in range(n_blinks * 2 + 1):  # +1 so final frame is always "on"
-        on = (i % 2 == 0)
-        clear_screen()
-        _show(
-            top, bot, result_slots,
+    """Flash a highlighted element on/off for `duration` seconds, ending highlighted.
+
+    Only the highlighted cells are redrawn between frames; any key skips it.
+    """
+    def layout(on: bool) -> list[str]:
+        return capture_lines(
+            _print_layout, top, bot, result_slots,
+            top_hl=None, bot_hl=False,
             result_hl=result_hl if on else None,
             carry=carry,
             carry_hl=carry_hl if on else False,
+            result_final=False,
         )
-        if i < n_blinks * 2:
-            time.sleep(interval)
+
+    blink(layout(True), layout(False), duration=duration, n_blinks=n_blinks)
 
 
 # ---------------------------------------------------------------------------
@@ -134,7 +162,6 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
         if b == 0:
             width = len(top)
             result_slots = [" "] * (width - 1) + ["0"]
-            clear_screen()
             _show(top, bot, result_slots)
             print(f"Tout nombre multiplié par 0 est égal à {BOLD}0{RESET}.")
             _inp(f"\n{YELLOW}(x pour annuler){RESET}  Appuie sur Entrée pour continuer...")
@@ -160,29 +187,28 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
         width = len(result_str)
         result_slots: list[str] = ["?"] * width
         carry = 0
+        # Every product and carry is planned up front; the loop replays it.
+        plan = plan_multiplication(a, b)
 
         # Initial layout
-        clear_screen()
         _show(top, bot, result_slots)
         print(f"{YELLOW}(x pour annuler){RESET}")
         _inp("Appuie sur Entrée pour commencer...")
 
         for step in range(len(top)):
             pos_from_right = step
-            top_idx = len(top) - 1 - step
-            digit_a = int(top[top_idx])
+            digit_a = plan.digit[step]
             result_col = width - 1 - step
             is_last_step = (step == len(top) - 1)
 
             # Show display with current digit pair highlighted
-            clear_screen()
             _show(top, bot, result_slots,
                   top_hl=pos_from_right, bot_hl=True,
                   carry=carry)
             print(f"{YELLOW}(x pour annuler){RESET}")
 
             # Step 1 — ask the basic multiplication fact
-            product_raw = digit_a * b
+            product_raw = plan.product[step]
             while True:
                 raw = _inp(f"Combien font {digit_a} × {b} ? ")
                 if raw.lstrip("-").isdigit() and int(raw) == product_raw:
@@ -191,17 +217,15 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
                 print(f"{RED}Non, ce n'est pas {raw}... Combien font {digit_a} × {b} ?{RESET}")
 
             # Step 2 — add previous carry if any
-            total = product_raw + carry
+            total = plan.total[step]
             if carry > 0:
                 # For single-digit products, show the value temporarily in the result slot
                 if product_raw < 10:
                     result_slots[result_col] = str(product_raw)
-                    clear_screen()
                     _show(top, bot, result_slots,
                           result_hl=result_col,
                           carry=carry, carry_hl=True)
                 else:
-                    clear_screen()
                     _show(top, bot, result_slots, carry=carry, carry_hl=True)
 
                 print(f"  {digit_a} × {b} = {BOLD}{product_raw}{RESET}")
@@ -214,8 +238,8 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
                     print(f"{RED}Non, ce n'est pas {raw}... {product_raw} + {carry} = ?{RESET}")
 
             # Step 3 — pose and carry
-            pose = total % 10
-            new_carry = total // 10
+            pose = plan.units[step]
+            new_carry = plan.carry_out[step]
 
             if is_last_step and new_carry > 0:
                 # Last digit and total is two digits: place both directly, no retenue left
@@ -231,7 +255,6 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
                 carry = 0
 
                 # Land with both digits highlighted
-                clear_screen()
                 _show(top, bot, result_slots, result_hl=both_cols)
 
             else:
@@ -253,7 +276,6 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
                 carry = new_carry
 
                 # Land with posed digit AND retenue both highlighted
-                clear_screen()
                 _show(top, bot, result_slots,
                       result_hl=result_col,
                       carry=carry,
@@ -264,11 +286,9 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
         # Place any remaining carry (normal path: last step had no overflow)
         if carry > 0:
             result_slots[0] = str(carry)
-            clear_screen()
             _show(top, bot, result_slots)
 
         # Final verification
-        clear_screen()
         _show(top, bot, result_slots)
         print(f"Quel est le résultat de {a} × {b} ?")
         while True:
@@ -279,7 +299,6 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
             print(f"{RED}Non, ce n'est pas {raw}... Quel est le résultat de {a} × {b} ?{RESET}")
 
         # Show final result in green
-        clear_screen()
         _show(top, bot, result_slots, result_final=True)
         print(f"  {GREEN}{BOLD}{a} × {b} = {result}{RESET}\n")
         _inp("Appuie sur Entrée pour continuer...")
@@ -296,18 +315,31 @@ def run_multiplication_interactive(a: int, b: int) -> bool:
 # Entry point
 # ---------------------------------------------------------------------------
 
+def _suggest_multiplication() -> tuple[int, int]:
+    """A 2- to 4-digit number times a digit, with at least one carry to manage."""
+    drill = multiplications(1, digits_range(random.randint(2, 4)), range(2, 10), carries=True)[0]
+    return drill.left, drill.right
+
+
 def main() -> None:
     """Ask for two numbers and launch the guided multiplication."""
     print(f"\n{BOLD}=== Multiplication par un chiffre ==={RESET}\n")
 
+    b = None
     while True:
-        raw = input("Quel est le premier nombre (peut avoir plusieurs chiffres) ? ").strip()
+        raw = input(
+            "Quel est le premier nombre (peut avoir plusieurs chiffres, Entrée pour une multiplication proposée) ? "
+        ).strip()
+        if not raw:
+            a, b = _suggest_multiplication()
+            print(f"Multiplication proposée : {a} × {b}")
+            break
         if raw.isdigit() and int(raw) > 0:
             a = int(raw)
             break
         print(f"{RED}Merci d'entrer un nombre entier positif.{RESET}")
 
-    while True:
+    while b is None:
         raw = input("Quel est le deuxième nombre (un seul chiffre, de 0 à 9) ? ").strip()
         if raw.isdigit() and len(raw) == 1:
             b = int(raw)
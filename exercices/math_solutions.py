@@ -0,0 +1,248 @@
+"""Headless column-arithmetic engine.
+
+Computes complete worked solutions — quotient digits, partial products,
+borrows and carries — as plain data, without any display or input.  The
+guided exercises (division, multiplication) and the worksheet generator
+build on these models.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+# ---------------------------------------------------------------------------
+# Multiplication by a single digit
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class MultiplicationColumn:
+    digit: int      # digit of the top number (units first)
+    product: int    # digit × multiplier
+    carry_in: int   # carry coming from the previous column
+    total: int      # product + carry_in
+    written: str    # what is written under the bar for this column
+    carry_out: int  # carry passed to the next column (0 on the last one)
+
+
+@dataclass(frozen=True)
+class MultiplicationSolution:
+    a: int
+    b: int
+    columns: tuple[MultiplicationColumn, ...]  # units column first
+    result: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class MultiplicationPlan:
+    """Carry schedule of ``a × b``: one compact byte array per field.
+
+    Index 0 is the units column.  ``carry_out`` is the raw ``total // 10``,
+    also on the last column, where it is written rather than carried.
+    """
+
+    digit: bytes
+    product: bytes
+    carry_in: bytes
+    total: bytes
+    units: bytes
+    carry_out: bytes
+
+    def __len__(self) -> int:
+        return len(self.digit)
+
+
+def plan_multiplication(a: int, b: int) -> MultiplicationPlan:
+    """Compute every column of ``a × b`` (``b`` a single digit) up front."""
+    if not 0 <= b <= 9:
+        raise ValueError("b must be a single digit")
+    top = str(a)
+    n = len(top)
+    digit, product, carry_in, total, units, carry_out = (bytearray(n) for _ in range(6))
+    carry = 0
+    for k, ch in enumerate(reversed(top)):
+        d = ord(ch) - 48
+        p = d * b
+        t = p + carry
+        digit[k], product[k], carry_in[k], total[k] = d, p, carry, t
+        units[k], carry_out[k] = t % 10, t // 10
+        carry = t // 10
+    return MultiplicationPlan(
+        bytes(digit), bytes(product), bytes(carry_in), bytes(total), bytes(units), bytes(carry_out)
+    )
+
+
+def solve_multiplication(a: int, b: int) -> MultiplicationSolution:
+    """Column multiplication of ``a`` by the single digit ``b``.
+
+    The last column writes its whole total (for example ``13``), exactly
+    as it is taught, so no carry is left over.
+    """
+    plan = plan_multiplication(a, b)
+    last = len(plan) - 1
+    columns = tuple(
+        MultiplicationColumn(
+            plan.digit[k], plan.product[k], plan.carry_in[k], plan.total[k],
+            str(plan.total[k]) if k == last else str(plan.units[k]),
+            0 if k == last else plan.carry_out[k],
+        )
+        for k in range(len(plan))
+    )
+    return MultiplicationSolution(a, b, columns, a * b)
+
+
+# ---------------------------------------------------------------------------
+# Subtraction (carry added to the subtrahend, "méthode par compensation")
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SubtractionColumn:
+    top: int        # minuend digit
+    bottom: int     # subtrahend digit (before carry)
+    carry_in: int   # 1 when the previous column borrowed
+    borrowed: bool  # True when ten is added to ``top``
+    result: int     # digit written under the bar
+
+
+@dataclass(frozen=True)
+class SubtractionSolution:
+    minuend: int
+    subtrahend: int
+    columns: tuple[SubtractionColumn, ...]  # units column first
+    result: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class SubtractionPlan:
+    """Borrow schedule of ``minuend − subtrahend``: one byte array per field.
+
+    Index 0 is the units column; ``borrowed[k]`` is 1 when ten is added to
+    ``top[k]``, and then ``carry_in[k + 1]`` is 1.
+    """
+
+    top: bytes
+    bottom: bytes
+    carry_in: bytes
+    borrowed: bytes
+    result: bytes
+
+    def __len__(self) -> int:
+        return len(self.top)
+
+
+def plan_subtraction(minuend: int, subtrahend: int) -> SubtractionPlan:
+    """Compute every column of ``minuend − subtrahend`` up front."""
+    if subtrahend > minuend:
+        raise ValueError("subtrahend must not exceed minuend")
+    top_s = str(minuend)
+    bot_s = str(subtrahend).zfill(len(top_s))
+    n = len(top_s)
+    top, bottom, carry_in, borrowed, result = (bytearray(n) for _ in range(5))
+    carry = 0
+    for k in range(n):
+        t = ord(top_s[n - 1 - k]) - 48
+        b = ord(bot_s[n - 1 - k]) - 48
+        effective = b + carry
+        borrow = 1 if t < effective else 0
+        top[k], bottom[k], carry_in[k], borrowed[k] = t, b, carry, borrow
+        result[k] = t + 10 * borrow - effective
+        carry = borrow
+    return SubtractionPlan(bytes(top), bytes(bottom), bytes(carry_in), bytes(borrowed), bytes(result))
+
+
+def solve_subtraction(minuend: int, subtrahend: int) -> SubtractionSolution:
+    """Column subtraction ``minuend − subtrahend`` (requires minuend ≥ subtrahend)."""
+    plan = plan_subtraction(minuend, subtrahend)
+    columns = tuple(
+        SubtractionColumn(plan.top[k], plan.bottom[k], plan.carry_in[k], bool(plan.borrowed[k]), plan.result[k])
+        for k in range(len(plan))
+    )
+    return SubtractionSolution(minuend, subtrahend, columns, minuend - subtrahend)
+
+
+# ---------------------------------------------------------------------------
+# Euclidean division
+# ---------------------------------------------------------------------------
+
+@dataclass
+class DivisionStep:
+    end_col: int           # last dividend column consumed (0-based)
+    partial_dividend: int  # e.g. 73
+    quotient_digit: int    # 0–9
+    product: int           # quotient_digit × divisor
+    remainder: int         # partial_dividend − product
+
+
+def division_steps(dividend_str: str, divisor: int) -> list[DivisionStep]:
+    """Steps of the potence: one per quotient digit."""
+    steps: list[DivisionStep] = []
+    current = 0
+    n = len(dividend_str)
+    for i, ch in enumerate(dividend_str):
+        current = current * 10 + int(ch)
+        if current < divisor and not steps:
+            continue
+        q = current // divisor
+        prod = q * divisor
+        rem = current - prod
+        steps.append(DivisionStep(i, current, q, prod, rem))
+        current = rem
+    if not steps:
+        # whole dividend smaller than divisor
+        steps.append(DivisionStep(n - 1, int(dividend_str), 0, 0, int(dividend_str)))
+    return steps
+
+
+@dataclass(frozen=True)
+class DivisionStepSolution:
+    partial_dividend: int
+    quotient_digit: int
+    multiplication: MultiplicationSolution | None  # divisor × quotient digit
+    subtraction: SubtractionSolution | None        # partial − product
+    remainder: int
+    brought_down: str | None                       # next dividend digit, if any
+
+
+@dataclass(frozen=True)
+class DivisionSolution:
+    dividend: int
+    divisor: int
+    steps: tuple[DivisionStepSolution, ...]
+    quotient: int
+    remainder: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def solve_division(dividend: int, divisor: int) -> DivisionSolution:
+    """Worked euclidean division of ``dividend`` by ``divisor``.
+
+    Each step records the quotient digit, the column multiplication of the
+    divisor by that digit, the subtraction with its borrows and the digit
+    brought down next.
+    """
+    if divisor < 1:
+        raise ValueError("divisor must be positive")
+    dividend_str = str(dividend)
+    steps = division_steps(dividend_str, divisor)
+    solved: list[DivisionStepSolution] = []
+    for index, step in enumerate(steps):
+        q = step.quotient_digit
+        brought = dividend_str[step.end_col + 1] if index < len(steps) - 1 else None
+        solved.append(DivisionStepSolution(
+            partial_dividend=step.partial_dividend,
+            quotient_digit=q,
+            multiplication=solve_multiplication(divisor, q) if q else None,
+            subtraction=solve_subtraction(step.partial_dividend, step.product) if q else None,
+            remainder=step.remainder,
+            brought_down=brought,
+        ))
+    quotient, remainder = divmod(dividend, divisor)
+    return DivisionSolution(dividend, divisor, tuple(solved), quotient, remainder)
@@ -7,11 +7,16 @@ DISPLAY_NAME = "Maths : Tables de multiplication"
 
 import random
 
+from .difficulty import load_difficulty
+from .distractors import product_distractors
+from .drills import multiplications
 from .logger import get_scores, log_result
 from .utils import show_lesson
 
 LETTERS = ["a", "b", "c", "d", "e"]
 
+DIFFICULTY = load_difficulty("math_tables_multiplication")
+
 
 def multiplication_tables() -> str:
     """Return the multiplication tables from 1 to 10."""
@@ -28,56 +33,45 @@ def multiplication_tables() -> str:
 def _generate_choices(n: int, m: int, hard_mode: bool) -> list[int]:
     """Create answer choices for ``n × m`` respecting difficulty."""
 
-    correct = n * m
-    wrong: set[int] = set()
-
     if hard_mode:
-        variations = [(n - 1, m), (n + 1, m), (n, m - 1), (n, m + 1)]
-        if random.random() < 0.5:
-            idx = random.randrange(len(variations))
-            variations[idx] = (n - 1, m + 1)
-        for a, b in variations:
-            product = a * b
-            if product != correct:
-                wrong.add(product)
-        while len(wrong) < 4:
-            candidate = correct + random.choice([-3, -2, -1, 1, 2, 3])
-            if candidate != correct:
-                wrong.add(candidate)
+        # Erreurs plausibles : produit voisin, chiffres inversés, ±1…
+        wrong = product_distractors(n, m, 4)
     else:
-        while len(wrong) < 2:
-            a = random.randint(1, 5)
-            b = random.randint(1, 5)
-            if a + b > 3:
-                product = (n + a) * (m + b)
-                if product != correct:
-                    wrong.add(product)
-
-    choices = list(wrong) + [correct]
+        wrong = product_distractors(n, m, 2, close=False)
+    choices = wrong + [n * m]
     random.shuffle(choices)
     return choices
 
 
+def _skill(table: int | None) -> str:
+    return "toutes les tables" if table is None else f"table de {table}"
+
+
 def _generate_question(
-    hard_mode: bool, table: int | None = None
+    hard_mode: bool | None = None, table: int | None = None, asked: set[tuple[int, int]] | None = None
 ) -> tuple[str, list[int], int]:
     """Return a question, choices and index of the correct answer.
 
     ``table`` constrains the first operand to the chosen multiplication
     table. ``None`` keeps the existing behaviour with fully random
-    operands.
+    operands.  ``hard_mode`` defaults to the current level of the skill
+    in :data:`DIFFICULTY`.  Products in ``asked`` are not repeated until
+    every product of the range has been asked; the new one is added.
     """
 
-    if table is not None:
-        n = table
-        m = random.randint(2, 9) if hard_mode else random.randint(1, 10)
-    else:
-        if hard_mode:
-            n = random.randint(2, 9)
-            m = random.randint(2, 9)
-        else:
-            n = random.randint(1, 10)
-            m = random.randint(1, 10)
+    if hard_mode is None:
+        hard_mode = DIFFICULTY.hard(_skill(table))
+
+    factors = range(2, 10) if hard_mode else range(1, 11)
+    firsts = range(table, table + 1) if table is not None else factors
+    asked = set() if asked is None else asked
+    drawn = multiplications(1, firsts, factors, exclude=asked)
+    if not drawn:
+        # Toutes les multiplications ont été posées : on recommence un tour.
+        asked.clear()
+        drawn = multiplications(1, firsts, factors)
+    n, m = drawn[0].key
+    asked.add((n, m))
     question = f"Combien font {n} × {m} ?"
     choices = _generate_choices(n, m, hard_mode)
     answer_index = choices.index(n * m)
@@ -101,16 +95,20 @@ def main() -> None:
                 break
             print("Veuillez entrer un nombre entre 1 et 10.")
 
+    skill = _skill(table_choice)
+    # First session with the adaptive level: start from the recent scores.
     previous = get_scores("math_tables_multiplication", limit=5)
-    hard_mode = bool(previous) and sum(previous) / len(previous) > 75
+    if previous and sum(previous) / len(previous) > 75:
+        DIFFICULTY.seed(skill, 0.5)
 
     print(
         "Quiz : réponds en tapant la lettre ou le nombre de la bonne réponse."
     )
     score = 0
     total = 20
+    asked: set[tuple[int, int]] = set()
     for i in range(1, total + 1):
-        question, choices, answer = _generate_question(hard_mode, table_choice)
+        question, choices, answer = _generate_question(table=table_choice, asked=asked)
         letters = LETTERS[: len(choices)]
         print(f"\nQuestion {i}: {question}")
         for letter, choice in zip(letters, choices):
@@ -123,6 +121,7 @@ def main() -> None:
         else:
             index = -1
         correct_text = choices[answer]
+        DIFFICULTY.record(skill, index == answer)
         if index == answer:
             print("Exact ! ✅")
             score += 1
@@ -130,6 +129,7 @@ def main() -> None:
             print(f"Non, la bonne réponse était {letters[answer]}. {correct_text} ❌")
 
     print(f"\nScore final : {score}/{total}")
+    DIFFICULTY.save()
     log_result("math_tables_multiplication", score / total * 100)
 
 
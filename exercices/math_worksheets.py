@@ -0,0 +1,196 @@
+"""Printable worksheets of divisions and multiplications with answer keys.
+
+Built on the headless engine in :mod:`exercices.math_solutions`: every
+exercise is solved as data, then written out as a statement sheet and a
+detailed answer key (quotient digits, products, borrows, carries).  Sheets
+are generated in parallel across processes, each from its own seed, so a
+pack can be regenerated identically.
+
+Usage::
+
+    python -m exercices.math_worksheets --out fiches --sheets 40 --per-sheet 12 \\
+        --kind mixte --classes CM1-A CM1-B --seed 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .math_solutions import (
+    DivisionSolution,
+    MultiplicationSolution,
+    solve_division,
+    solve_multiplication,
+)
+
+KINDS = ("division", "multiplication", "mixte")
+
+_COLUMN_NAMES = ("unités", "dizaines", "centaines", "milliers", "dizaines de mille", "centaines de mille")
+
+
+@dataclass(frozen=True)
+class SheetSpec:
+    """Everything needed to (re)generate one sheet."""
+
+    title: str
+    number: int
+    seed: int
+    kind: str
+    per_sheet: int
+    digits: int          # digits of the dividend / first factor
+    divisor_digits: int  # digits of the divisor
+
+
+def _random_number(rng: random.Random, digits: int) -> int:
+    return rng.randint(10 ** (digits - 1), 10**digits - 1)
+
+
+def _make_exercise(rng: random.Random, kind: str, digits: int, divisor_digits: int):
+    if kind == "mixte":
+        kind = rng.choice(("division", "multiplication"))
+    if kind == "division":
+        divisor = max(2, _random_number(rng, divisor_digits))
+        return solve_division(_random_number(rng, digits), divisor)
+    return solve_multiplication(_random_number(rng, digits), rng.randint(2, 9))
+
+
+def _column_name(index: int) -> str:
+    return _COLUMN_NAMES[index] if index < len(_COLUMN_NAMES) else f"colonne {index + 1}"
+
+
+def _statement(solution: DivisionSolution | MultiplicationSolution) -> str:
+    if isinstance(solution, DivisionSolution):
+        return f"{solution.dividend} ÷ {solution.divisor} = ........ reste ........"
+    return f"{solution.a} × {solution.b} = ................"
+
+
+def _answer_key(solution: DivisionSolution | MultiplicationSolution) -> list[str]:
+    """Worked solution, one line per elementary step."""
+    if isinstance(solution, MultiplicationSolution):
+        lines = [f"{solution.a} × {solution.b} = {solution.result}"]
+        for col in solution.columns:
+            calc = f"{col.digit} × {solution.b} = {col.product}"
+            if col.carry_in:
+                calc += f", + {col.carry_in} = {col.total}"
+            action = f"je pose {col.written}"
+            if col.carry_out:
+                action += f", je retiens {col.carry_out}"
+            lines.append(f"   {calc} → {action}")
+        return lines
+
+    lines = [f"{solution.dividend} ÷ {solution.divisor} = {solution.quotient} reste {solution.remainder}"]
+    for step in solution.steps:
+        parts = [f"dans {step.partial_dividend}, combien de fois {solution.divisor} ? {step.quotient_digit}"]
+        if step.subtraction is not None:
+            product = step.subtraction.subtrahend
+            parts.append(f"{solution.divisor} × {step.quotient_digit} = {product}")
+            borrows = [_column_name(i) for i, col in enumerate(step.subtraction.columns) if col.borrowed]
+            sub = f"{step.partial_dividend} − {product} = {step.remainder}"
+            if borrows:
+                sub += f" (retenue aux {', '.join(borrows)})"
+            parts.append(sub)
+        if step.brought_down is not None:
+            parts.append(f"on abaisse le {step.brought_down} → {step.remainder * 10 + int(step.brought_down)}")
+        lines.append("   " + " ; ".join(parts))
+    lines.append(f"   Vérification : {solution.divisor} × {solution.quotient} + {solution.remainder} = {solution.dividend}")
+    return lines
+
+
+def build_sheet(spec: SheetSpec) -> tuple[str, str, list[dict]]:
+    """Return (statement sheet, answer key, solutions as data) for ``spec``."""
+    rng = random.Random(spec.seed)
+    solutions = [_make_exercise(rng, spec.kind, spec.digits, spec.divisor_digits) for _ in range(spec.per_sheet)]
+    header = f"{spec.title} — fiche n° {spec.number}"
+    sheet = [header, "Nom : ....................    Date : ...........", ""]
+    key = [f"{header} — CORRIGÉ (graine {spec.seed})", ""]
+    for index, solution in enumerate(solutions, start=1):
+        sheet.append(f"{index:>2}) {_statement(solution)}")
+        sheet.append("")
+        answer = _answer_key(solution)
+        key.append(f"{index:>2}) {answer[0]}")
+        key.extend(answer[1:])
+        key.append("")
+    return "\n".join(sheet) + "\n", "\n".join(key), [solution.to_dict() for solution in solutions]
+
+
+def _write_sheet(job: tuple[SheetSpec, str]) -> str:
+    spec, directory = job
+    sheet, key, data = build_sheet(spec)
+    out = Path(directory)
+    stem = f"{spec.number:04d}"
+    (out / f"fiche_{stem}.txt").write_text(sheet, encoding="utf-8")
+    (out / f"corrige_{stem}.txt").write_text(key, encoding="utf-8")
+    with (out / f"solutions_{stem}.json").open("w", encoding="utf-8") as fh:
+        json.dump({"seed": spec.seed, "kind": spec.kind, "exercises": data}, fh, ensure_ascii=False)
+    return stem
+
+
+def write_worksheets(
+    out_dir: Path,
+    *,
+    classes: Sequence[str] = ("Classe",),
+    sheets: int = 10,
+    per_sheet: int = 12,
+    kind: str = "mixte",
+    digits: int = 4,
+    divisor_digits: int = 1,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> int:
+    """Generate ``sheets`` sheets per class under ``out_dir/<class>``.
+
+    Returns the number of sheets written.  Sheet seeds derive from ``seed``,
+    the class position and the sheet number, so rerunning with the same
+    arguments rewrites identical packs.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}")
+    jobs: list[tuple[SheetSpec, str]] = []
+    for class_index, class_name in enumerate(classes):
+        directory = out_dir / class_name
+        directory.mkdir(parents=True, exist_ok=True)
+        for number in range(1, sheets + 1):
+            sheet_seed = (seed * 1_000 + class_index) * 100_000 + number
+            spec = SheetSpec(class_name, number, sheet_seed, kind, per_sheet, digits, divisor_digits)
+            jobs.append((spec, str(directory)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(1 for _ in executor.map(_write_sheet, jobs, chunksize=max(1, len(jobs) // 64)))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fiches de divisions et multiplications avec corrigés")
+    parser.add_argument("--out", type=Path, default=Path("fiches"), help="Dossier de sortie")
+    parser.add_argument("--classes", nargs="+", default=["Classe"], help="Un sous-dossier par classe")
+    parser.add_argument("--sheets", type=int, default=10, help="Nombre de fiches par classe")
+    parser.add_argument("--per-sheet", type=int, default=12, help="Exercices par fiche")
+    parser.add_argument("--kind", choices=KINDS, default="mixte")
+    parser.add_argument("--digits", type=int, default=4, help="Chiffres du dividende / du premier facteur")
+    parser.add_argument("--divisor-digits", type=int, default=1, help="Chiffres du diviseur")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du paquet (pour le régénérer)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    written = write_worksheets(
+        args.out,
+        classes=args.classes,
+        sheets=args.sheets,
+        per_sheet=args.per_sheet,
+        kind=args.kind,
+        digits=args.digits,
+        divisor_digits=args.divisor_digits,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    print(f"{written} fiche(s) écrite(s) dans {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
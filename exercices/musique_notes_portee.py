@@ -3,7 +3,10 @@ from __future__ import annotations
 """Exercice interactif pour relier des notes à leur nom."""
 
 import curses
-from typing import Iterable
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Sequence
 
 from .logger import log_result
 
@@ -98,10 +101,198 @@ NOTES = _build_notes()
 TOTAL_NOTES = len(NOTES)
 
 
-def _first_available(solved: set[str]) -> tuple[int, int] | None:
+# ---------------------------------------------------------------------------
+# Moteur de mise en page : portée, lignes supplémentaires et bulles calculées
+# pour n'importe quel ensemble de notes, en clé de sol ou en clé de fa.
+
+NOTE_NAMES = ("Do", "Ré", "Mi", "Fa", "Sol", "La", "Si")
+
+BASS_CLEF = [
+    "    ",
+    " __ ",
+    "/  )",
+    "  /:",
+    " /  ",
+    "/   ",
+]
+
+# Hauteur de la ligne du bas de la portée, en degrés depuis le Do 0
+# (octave * 7 + degré) : Mi 4 en clé de sol, Sol 2 en clé de fa.
+CLEFS = {
+    "sol": (4 * 7 + 2, TREBLE_CLEF),
+    "fa": (2 * 7 + 4, BASS_CLEF),
+}
+
+# Notes proposées par l'entraînement aléatoire (Do 4 → La 5, Mi 2 → Do 4).
+DRILL_RANGES = {
+    "sol": range(4 * 7, 5 * 7 + 6),
+    "fa": range(2 * 7 + 2, 4 * 7 + 1),
+}
+DRILL_QUESTIONS = 10
+DRILL_OPTIONS = 4
+
+
+@dataclass(frozen=True)
+class PlacedNote:
+    """Note positionnée à l'écran, avec ses lignes supplémentaires."""
+
+    name: str
+    row: int
+    col: int
+    ledgers: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class StaffLayout:
+    """Mise en page complète d'un exercice de lecture de notes."""
+
+    staff_top: int
+    staff_left: int
+    staff_width: int
+    clef: tuple[str, ...]
+    notes: tuple[PlacedNote, ...]
+    option_layout: tuple[tuple[str, ...], ...]
+    option_positions: dict[str, tuple[int, int]]
+    min_height: int
+    min_width: int
+
+    @property
+    def staff_lines(self) -> list[int]:
+        return [self.staff_top + i * 2 for i in range(5)]
+
+    @property
+    def window(self) -> tuple[int, int, int, int]:
+        """Zone (haut, gauche, hauteur, largeur) de la portée, clé comprise."""
+
+        rows = [self.staff_top - 1, self.staff_top + 8]
+        for note in self.notes:
+            rows.append(note.row)
+            rows.extend(note.ledgers)
+        top = min(rows)
+        left = self.staff_left - 5
+        return top, left, max(rows) + 1 - top, self.staff_width + 7
+
+
+def _classic_layout() -> StaffLayout:
+    """Les tables historiques de l'exercice, exprimées comme une mise en page."""
+
+    return StaffLayout(
+        staff_top=STAFF_TOP,
+        staff_left=STAFF_LEFT,
+        staff_width=STAFF_WIDTH,
+        clef=tuple(TREBLE_CLEF),
+        notes=tuple(
+            PlacedNote(str(note["name"]), int(note["row"]), int(note["col"]),
+                       (int(note["row"]),) if note["ledger"] else ())
+            for note in NOTES
+        ),
+        option_layout=tuple(tuple(row) for row in OPTION_LAYOUT),
+        option_positions=dict(OPTION_POSITIONS),
+        min_height=MIN_HEIGHT,
+        min_width=MIN_WIDTH,
+    )
+
+
+CLASSIC_LAYOUT = _classic_layout()
+
+
+def note_name(step: int, *, with_octave: bool = False) -> str:
+    """Nom français de la note ``step`` (octave * 7 + degré)."""
+
+    octave, degree = divmod(step, 7)
+    name = NOTE_NAMES[degree]
+    return f"{name} {octave}" if with_octave else name
+
+
+def _distinct_names(steps: Sequence[int]) -> list[str]:
+    """Noms affichés : l'octave n'est précisée que si un nom revient plusieurs fois."""
+
+    counts: dict[str, int] = {}
+    for step in steps:
+        counts[note_name(step)] = counts.get(note_name(step), 0) + 1
+    names = []
+    for step in steps:
+        base = note_name(step)
+        if counts[base] == 1:
+            names.append(base)
+        elif counts[base] == 2:
+            lowest = min(s for s in steps if note_name(s) == base)
+            names.append(f"{base} du bas" if step == lowest else f"{base} du haut")
+        else:
+            names.append(note_name(step, with_octave=True))
+    return names
+
+
+@lru_cache(maxsize=512)
+def compute_layout(
+    steps: tuple[int, ...],
+    clef: str,
+    options: tuple[str, ...] | None,
+    size: tuple[int, int],
+) -> StaffLayout:
+    """Calcule la mise en page de ``steps`` pour un terminal de taille ``size``.
+
+    ``size`` vaut ``(lignes, colonnes)``.  ``options`` donne les noms des
+    bulles (par défaut, les noms des notes).  Les positions sont exprimées en
+    demi-interlignes par rapport à la ligne du haut : les notes hors de la
+    portée reçoivent leurs lignes supplémentaires, et les bulles sont rangées
+    sous la portée, autant par ligne que la largeur le permet.  Le résultat
+    est mis en cache par ensemble de notes et taille de terminal.
+    """
+
+    bottom_step, clef_art = CLEFS[clef]
+    names = _distinct_names(steps)
+    offsets = [8 - (step - bottom_step) for step in steps]
+    staff_top = 5 + max(0, -min(offsets, default=0))
+    staff_width = max(STAFF_WIDTH, 8 + len(steps) * NOTE_SPACING)
+
+    notes = []
+    for index, (name, offset) in enumerate(zip(names, offsets)):
+        if offset > 8:
+            ledger_offsets = range(10, offset + 1, 2)
+        elif offset < 0:
+            ledger_offsets = range(-2, offset - 1, -2)
+        else:
+            ledger_offsets = range(0)
+        notes.append(PlacedNote(
+            name=name,
+            row=staff_top + offset,
+            col=STAFF_LEFT + 4 + index * NOTE_SPACING,
+            ledgers=tuple(staff_top + o for o in ledger_offsets),
+        ))
+
+    _, columns = size
+    option_names = tuple(options) if options is not None else tuple(names)
+    per_row = max(1, (columns - 4) // (BUBBLE_WIDTH + 2))
+    first_row = staff_top + max(8, max(offsets, default=8)) + 2
+    option_layout = tuple(
+        option_names[start:start + per_row] for start in range(0, len(option_names), per_row)
+    )
+    option_positions = {
+        name: (first_row + row_index * 2, 2 + col_index * (BUBBLE_WIDTH + 2))
+        for row_index, row in enumerate(option_layout)
+        for col_index, name in enumerate(row)
+    }
+    last_row = first_row + 2 * (len(option_layout) - 1)
+    return StaffLayout(
+        staff_top=staff_top,
+        staff_left=STAFF_LEFT,
+        staff_width=staff_width,
+        clef=tuple(clef_art),
+        notes=tuple(notes),
+        option_layout=option_layout,
+        option_positions=option_positions,
+        min_height=last_row + 5,
+        min_width=max(STAFF_LEFT + staff_width + 2, min(columns, BUBBLE_WIDTH + 6)),
+    )
+
+
+def _first_available(
+    solved: set[str], option_layout: Sequence[Sequence[str]] = OPTION_LAYOUT
+) -> tuple[int, int] | None:
     """Retourne la première bulle encore disponible."""
 
-    for row_index, row in enumerate(OPTION_LAYOUT):
+    for row_index, row in enumerate(option_layout):
         for col_index, name in enumerate(row):
             if name not in solved:
                 return row_index, col_index
@@ -112,11 +303,12 @@ def _move_horizontal(
     solved: set[str],
     position: tuple[int, int],
     direction: int,
+    option_layout: Sequence[Sequence[str]] = OPTION_LAYOUT,
 ) -> tuple[int, int]:
     """Déplace le curseur horizontalement en ignorant les bulles déjà utilisées."""
 
     row_index, col_index = position
-    row = OPTION_LAYOUT[row_index]
+    row = option_layout[row_index]
     if not row:
         return position
     next_col = col_index
@@ -131,6 +323,7 @@ def _move_vertical(
     solved: set[str],
     position: tuple[int, int],
     direction: int,
+    option_layout: Sequence[Sequence[str]] = OPTION_LAYOUT,
 ) -> tuple[int, int]:
     """Déplace le curseur verticalement vers une ligne possédant une bulle libre."""
 
@@ -138,216 +331,346 @@ def _move_vertical(
     new_row = row_index
     while True:
         new_row += direction
-        if new_row < 0 or new_row >= len(OPTION_LAYOUT):
+        if new_row < 0 or new_row >= len(option_layout):
             return position
         candidates = [
-            idx for idx, name in enumerate(OPTION_LAYOUT[new_row]) if name not in solved
+            idx for idx, name in enumerate(option_layout[new_row]) if name not in solved
         ]
         if candidates:
             closest = min(candidates, key=lambda idx: abs(idx - col_index))
             return new_row, closest
 
 
-def _draw_staff(stdscr: curses.window, highlight: int | None, solved: Iterable[str]) -> None:
-    """Affiche la portée, la clé de sol et les notes."""
+def _draw_staff(win: curses.window, layout: StaffLayout) -> None:
+    """Trace la portée, la clé et les lignes supplémentaires (partie statique)."""
 
-    for row in STAFF_LINES:
-        stdscr.addstr(row, STAFF_LEFT - 1, "|" + "-" * STAFF_WIDTH + "|")
+    win_top, win_left, _, _ = layout.window
+    for row in layout.staff_lines:
+        win.addstr(row - win_top, layout.staff_left - 1 - win_left, "|" + "-" * layout.staff_width + "|")
 
-    clef_row = STAFF_TOP - 1
-    clef_col = STAFF_LEFT - 5
-    for line_index, line in enumerate(TREBLE_CLEF):
+    clef_row = layout.staff_top - 1 - win_top
+    clef_col = layout.staff_left - 5 - win_left
+    for line_index, line in enumerate(layout.clef):
         for offset, char in enumerate(line):
             if char != " ":
-                stdscr.addch(clef_row + line_index, clef_col + offset, char)
-
-    solved_set = set(solved)
-    for index, note in enumerate(NOTES):
-        row = note["row"]
-        col = note["col"]
-        if note["ledger"]:
-            stdscr.addstr(row, col - 2, "---")
-        char = "o"
-        attr = curses.A_BOLD
-        if highlight is not None and index == highlight:
-            char = "@"
-            attr |= curses.A_REVERSE
-        elif note["name"] in solved_set:
-            char = "O"
-        stdscr.addstr(row, col, char, attr)
-
-
-def _draw_options(
-    stdscr: curses.window,
-    selection: tuple[int, int] | None,
-    solved: Iterable[str],
-) -> None:
-    """Affiche les bulles contenant les noms des notes."""
-
-    solved_set = set(solved)
-    for row_index, row in enumerate(OPTION_LAYOUT):
-        for col_index, name in enumerate(row):
-            y, x = OPTION_POSITIONS[name]
-            bubble = f"( {name} )"
-            attr = curses.A_BOLD
-            if name in solved_set:
-                bubble = f"( {name} * )"
-                attr = curses.A_DIM
-            elif selection is not None and selection == (row_index, col_index):
-                attr |= curses.A_REVERSE
-            display = bubble.center(BUBBLE_WIDTH)
-            stdscr.addstr(y, x, " " * BUBBLE_WIDTH)
-            stdscr.addstr(y, x, display[:BUBBLE_WIDTH], attr)
-
-
-def _draw_progress(
-    stdscr: curses.window,
-    solved_order: list[str],
-    highlight: int | None,
-) -> None:
-    """Affiche la progression et la liste des bonnes réponses."""
+                win.addch(clef_row + line_index, clef_col + offset, char)
 
-    if highlight is None:
-        text = f"Notes reliées : {TOTAL_NOTES}/{TOTAL_NOTES} (terminé)"
-    else:
-        text = f"Note à relier : {highlight + 1}/{TOTAL_NOTES}"
-    stdscr.addstr(3, 4, text)
+    for note in layout.notes:
+        for ledger in note.ledgers:
+            win.addstr(ledger - win_top, note.col - 2 - win_left, "---")
 
-    stdscr.addstr(STAFF_TOP, 2, "Associations :")
-    for index, name in enumerate(solved_order):
-        stdscr.addstr(STAFF_TOP + 1 + index, 2, f" - {name}")
 
+def _note_state(index: int, highlight: int | None, name: str, solved: set[str]) -> tuple[str, int]:
+    if highlight is not None and index == highlight:
+        return "@", curses.A_BOLD | curses.A_REVERSE
+    if name in solved:
+        return "O", curses.A_BOLD
+    return "o", curses.A_BOLD
 
-def _draw_feedback(stdscr: curses.window, message: str) -> None:
-    """Affiche un message d'aide ou de correction en bas de l'écran."""
 
-    max_y, max_x = stdscr.getmaxyx()
-    row = max_y - 3
-    width = max_x - 8
-    if width <= 0:
-        return
-    truncated = message[: width]
-    stdscr.addstr(row, 4, " " * width)
-    stdscr.addstr(row, 4, truncated)
+def _draw_bubble(win: curses.window, name: str, selected: bool, solved: bool) -> None:
+    """Affiche la bulle contenant le nom d'une note."""
 
+    bubble = f"( {name} )"
+    attr = curses.A_BOLD
+    if solved:
+        bubble = f"( {name} * )"
+        attr = curses.A_DIM
+    elif selected:
+        attr |= curses.A_REVERSE
+    win.erase()
+    win.addstr(0, 0, bubble.center(BUBBLE_WIDTH)[:BUBBLE_WIDTH], attr)
 
-def _render(
-    stdscr: curses.window,
-    highlight: int | None,
-    selection: tuple[int, int] | None,
-    solved_order: list[str],
-    solved: Iterable[str],
-    feedback: str,
-) -> None:
-    """Rafraîchit l'affichage complet de l'exercice."""
 
-    stdscr.erase()
-    stdscr.addstr(0, 4, "Relie les notes à leur nom", curses.A_BOLD)
-    stdscr.addstr(
-        1,
-        4,
-        "Flèches pour naviguer • Entrée pour valider • q pour quitter",
-        curses.A_DIM,
-    )
-    _draw_progress(stdscr, solved_order, highlight)
-    _draw_options(stdscr, selection, solved)
-    _draw_staff(stdscr, highlight, solved)
-    _draw_feedback(stdscr, feedback)
-    stdscr.refresh()
+def _progress_text(highlight: int | None, total: int) -> str:
+    if highlight is None:
+        return f"Notes reliées : {total}/{total} (terminé)"
+    return f"Note à relier : {highlight + 1}/{total}"
 
 
-def _run_curses(stdscr: curses.window) -> dict[str, object]:
-    """Boucle principale de l'exercice interactif."""
+class _NotesScreen:
+    """Écran découpé en fenêtres curses persistantes.
 
-    curses.curs_set(0)
-    stdscr.keypad(True)
-    stdscr.nodelay(False)
+    Chaque zone (en-tête, progression, associations, portée, bulles,
+    message) a sa propre fenêtre et garde l'état avec lequel elle a été
+    dessinée.  :meth:`render` ne redessine que les zones dont l'état a changé,
+    les marque avec ``noutrefresh`` puis envoie le tout en un seul
+    ``doupdate`` : une flèche ne coûte que les deux bulles concernées.
+    """
 
-    max_y, max_x = stdscr.getmaxyx()
-    if max_y < MIN_HEIGHT or max_x < MIN_WIDTH:
+    def __init__(self, stdscr: curses.window, layout: StaffLayout = CLASSIC_LAYOUT, title: str = "") -> None:
+        max_y, max_x = stdscr.getmaxyx()
         stdscr.erase()
-        stdscr.addstr(
-            0,
-            0,
-            f"Fenêtre trop petite : {max_x}x{max_y} (minimum {MIN_WIDTH}x{MIN_HEIGHT}).",
+        stdscr.noutrefresh()
+        self.layout = layout
+        total = len(layout.notes)
+
+        self.header = curses.newwin(2, max_x, 0, 0)
+        self.header.keypad(True)
+        self.header.addstr(0, 4, title or "Relie les notes à leur nom", curses.A_BOLD)
+        self.header.addstr(
+            1,
+            4,
+            "Flèches pour naviguer • Entrée pour valider • q pour quitter",
+            curses.A_DIM,
         )
-        stdscr.addstr(2, 0, "Agrandis le terminal puis relance l'exercice.")
-        stdscr.addstr(4, 0, "Appuie sur une touche pour revenir au menu.")
-        stdscr.refresh()
-        stdscr.getch()
-        return {"correct": 0, "total": TOTAL_NOTES, "completed": False}
+        self.header.noutrefresh()
+
+        self.progress = curses.newwin(1, max_x - 4, 3, 4)
+        win_top, win_left, win_height, win_width = layout.window
+        self.associations = curses.newwin(total + 2, win_left, layout.staff_top, 0)
+        self.associations.addstr(0, 2, "Associations :")
+        self.associations.noutrefresh()
+
+        self.staff = curses.newwin(win_height, win_width, win_top, win_left)
+        _draw_staff(self.staff, layout)
+
+        # Une colonne de plus que la bulle : curses refuse d'écrire dans la
+        # dernière case d'une fenêtre.
+        self.bubbles = {
+            name: curses.newwin(1, BUBBLE_WIDTH + 1, y, x) for name, (y, x) in layout.option_positions.items()
+        }
+        self.feedback_width = max(0, max_x - 8)
+        self.feedback = curses.newwin(1, max_x - 4, max_y - 3, 4)
+
+        self._progress: str | None = None
+        self._solved_count = 0
+        self._notes: list[tuple[str, int] | None] = [None] * total
+        self._bubbles: dict[str, tuple[bool, bool] | None] = {name: None for name in self.bubbles}
+        self._feedback: str | None = None
+
+    def getch(self) -> int:
+        return self.header.getch()
+
+    def render(
+        self,
+        highlight: int | None,
+        selection: tuple[int, int] | None,
+        solved_order: list[str],
+        solved: Iterable[str],
+        feedback: str,
+    ) -> None:
+        """Met à jour les zones dont l'état a changé depuis le dernier appel."""
+
+        layout = self.layout
+        solved_set = set(solved)
+
+        text = _progress_text(highlight, len(layout.notes))
+        if text != self._progress:
+            self._progress = text
+            self.progress.erase()
+            self.progress.addstr(0, 0, text)
+            self.progress.noutrefresh()
+
+        if len(solved_order) != self._solved_count:
+            for index in range(self._solved_count, len(solved_order)):
+                self.associations.addstr(1 + index, 2, f" - {solved_order[index]}")
+            self._solved_count = len(solved_order)
+            self.associations.noutrefresh()
+
+        win_top, win_left, _, _ = layout.window
+        staff_dirty = False
+        for index, note in enumerate(layout.notes):
+            state = _note_state(index, highlight, note.name, solved_set)
+            if state != self._notes[index]:
+                self._notes[index] = state
+                char, attr = state
+                self.staff.addstr(note.row - win_top, note.col - win_left, char, attr)
+                staff_dirty = True
+        if staff_dirty:
+            self.staff.noutrefresh()
+
+        for row_index, row in enumerate(layout.option_layout):
+            for col_index, name in enumerate(row):
+                state = (selection == (row_index, col_index), name in solved_set)
+                if state != self._bubbles[name]:
+                    self._bubbles[name] = state
+                    _draw_bubble(self.bubbles[name], name, *state)
+                    self.bubbles[name].noutrefresh()
+
+        if feedback != self._feedback and self.feedback_width:
+            self._feedback = feedback
+            self.feedback.erase()
+            self.feedback.addstr(0, 0, feedback[: self.feedback_width])
+            self.feedback.noutrefresh()
+
+        curses.doupdate()
+
+
+def _too_small(stdscr: curses.window, layout: StaffLayout) -> bool:
+    """Affiche un message si le terminal est trop petit pour ``layout``."""
+
+    max_y, max_x = stdscr.getmaxyx()
+    if max_y >= layout.min_height and max_x >= layout.min_width:
+        return False
+    stdscr.erase()
+    stdscr.addstr(
+        0,
+        0,
+        f"Fenêtre trop petite : {max_x}x{max_y} (minimum {layout.min_width}x{layout.min_height}).",
+    )
+    stdscr.addstr(2, 0, "Agrandis le terminal puis relance l'exercice.")
+    stdscr.addstr(4, 0, "Appuie sur une touche pour revenir au menu.")
+    stdscr.refresh()
+    stdscr.getch()
+    return True
+
 
+def _play(
+    stdscr: curses.window,
+    layout: StaffLayout,
+    *,
+    title: str = "",
+    final_prompt: bool = True,
+) -> dict[str, object]:
+    """Fait relier chaque note de ``layout`` à sa bulle, dans l'ordre."""
+
+    notes = layout.notes
+    total = len(notes)
+    options = layout.option_layout
     solved_names: set[str] = set()
     solved_order: list[str] = []
-    selection = _first_available(solved_names)
+    selection = _first_available(solved_names, options)
     note_index = 0
+    mistakes = 0
     feedback = "Utilise les flèches pour choisir un nom, puis Entrée pour valider."
     aborted = False
+    screen = _NotesScreen(stdscr, layout, title)
 
-    while note_index < TOTAL_NOTES:
-        _render(stdscr, note_index, selection, solved_order, solved_names, feedback)
-        key = stdscr.getch()
+    while note_index < total:
+        screen.render(note_index, selection, solved_order, solved_names, feedback)
+        key = screen.getch()
         if key in (ord("q"), 27):
             aborted = True
             break
         if selection is None:
-            selection = _first_available(solved_names)
+            selection = _first_available(solved_names, options)
         if selection is None:
             break
         if key in (curses.KEY_LEFT, ord("h")):
-            selection = _move_horizontal(solved_names, selection, -1)
+            selection = _move_horizontal(solved_names, selection, -1, options)
         elif key in (curses.KEY_RIGHT, ord("l")):
-            selection = _move_horizontal(solved_names, selection, 1)
+            selection = _move_horizontal(solved_names, selection, 1, options)
         elif key in (curses.KEY_UP, ord("k")):
-            selection = _move_vertical(solved_names, selection, -1)
+            selection = _move_vertical(solved_names, selection, -1, options)
         elif key in (curses.KEY_DOWN, ord("j")):
-            selection = _move_vertical(solved_names, selection, 1)
+            selection = _move_vertical(solved_names, selection, 1, options)
         elif key in (curses.KEY_ENTER, 10, 13, ord(" ")):
             row_index, col_index = selection
-            choice = OPTION_LAYOUT[row_index][col_index]
-            current_note = NOTES[note_index]
-            if choice == current_note["name"]:
+            choice = options[row_index][col_index]
+            current_note = notes[note_index]
+            if choice == current_note.name:
                 solved_names.add(choice)
                 solved_order.append(choice)
                 feedback = f"Bravo ! '{choice}' est bien la note surlignée."
                 note_index += 1
-                selection = _first_available(solved_names)
+                selection = _first_available(solved_names, options)
             else:
+                mistakes += 1
                 feedback = f"Non, ce n'est pas '{choice}'. Essaie encore !"
         else:
             feedback = "Utilise les flèches pour te déplacer et Entrée pour valider."
 
-    if note_index >= TOTAL_NOTES and not aborted:
-        selection = None
-        feedback = "Bravo ! Toutes les notes sont reliées. Appuie sur Entrée pour quitter."
-        highlight: int | None = None
-    else:
-        highlight = note_index if note_index < TOTAL_NOTES else None
-        if aborted:
-            feedback = (
-                "Exercice interrompu. Appuie sur Entrée ou 'q' pour revenir au menu."
-            )
+    completed = not aborted and note_index >= total
+    if final_prompt or not completed:
+        if completed:
+            selection = None
+            feedback = "Bravo ! Toutes les notes sont reliées. Appuie sur Entrée pour quitter."
+            highlight: int | None = None
         else:
-            feedback = "Appuie sur Entrée pour revenir au menu."
+            highlight = note_index if note_index < total else None
+            if aborted:
+                feedback = (
+                    "Exercice interrompu. Appuie sur Entrée ou 'q' pour revenir au menu."
+                )
+            else:
+                feedback = "Appuie sur Entrée pour revenir au menu."
 
-    _render(stdscr, highlight, selection, solved_order, solved_names, feedback)
-    while True:
-        key = stdscr.getch()
-        if key in (10, 13, ord("q"), 27):
-            break
+        screen.render(highlight, selection, solved_order, solved_names, feedback)
+        while True:
+            key = screen.getch()
+            if key in (10, 13, ord("q"), 27):
+                break
 
     return {
         "correct": len(solved_names),
-        "total": TOTAL_NOTES,
-        "completed": not aborted and note_index >= TOTAL_NOTES,
+        "total": total,
+        "completed": completed,
+        "mistakes": mistakes,
     }
 
 
+def _run_curses(stdscr: curses.window) -> dict[str, object]:
+    """Boucle principale de l'exercice interactif."""
+
+    curses.curs_set(0)
+    stdscr.keypad(True)
+    stdscr.nodelay(False)
+
+    if _too_small(stdscr, CLASSIC_LAYOUT):
+        return {"correct": 0, "total": TOTAL_NOTES, "completed": False}
+    return _play(stdscr, CLASSIC_LAYOUT)
+
+
+def _run_drill(stdscr: curses.window, clef: str, rng: random.Random) -> dict[str, object]:
+    """Entraînement aléatoire : une note à la fois, ``DRILL_OPTIONS`` bulles."""
+
+    curses.curs_set(0)
+    stdscr.keypad(True)
+    stdscr.nodelay(False)
+
+    clef_label = "clé de sol" if clef == "sol" else "clé de fa"
+    correct = 0
+    asked = 0
+    for question in range(1, DRILL_QUESTIONS + 1):
+        step = rng.choice(DRILL_RANGES[clef])
+        answer = note_name(step)
+        distractors = rng.sample([name for name in NOTE_NAMES if name != answer], DRILL_OPTIONS - 1)
+        options = distractors + [answer]
+        rng.shuffle(options)
+        layout = compute_layout((step,), clef, tuple(options), stdscr.getmaxyx())
+        if _too_small(stdscr, layout):
+            break
+        result = _play(
+            stdscr,
+            layout,
+            title=f"Entraînement {clef_label} — question {question}/{DRILL_QUESTIONS}",
+            final_prompt=False,
+        )
+        if not result["completed"]:
+            break
+        asked += 1
+        if not result["mistakes"]:
+            correct += 1
+    return {"correct": correct, "total": DRILL_QUESTIONS, "completed": asked == DRILL_QUESTIONS}
+
+
+def _choose_mode() -> str | None:
+    while True:
+        print("Choisissez un exercice :")
+        print("1. Relier les notes sur la portée (clé de sol)")
+        print("2. Entraînement aléatoire en clé de sol")
+        print("3. Entraînement aléatoire en clé de fa")
+        print("0. Retour")
+        choice = input("Votre choix : ").strip()
+        if choice == "0":
+            return None
+        if choice in {"1", "2", "3"}:
+            return {"1": "classique", "2": "sol", "3": "fa"}[choice]
+        print("Choix invalide. Merci de réessayer.")
+
+
 def main() -> None:
     """Lance l'exercice interactif de reconnaissance des notes."""
 
+    mode = _choose_mode()
+    if mode is None:
+        return
     try:
-        result = curses.wrapper(_run_curses)
+        if mode == "classique":
+            result = curses.wrapper(_run_curses)
+        else:
+            result = curses.wrapper(_run_drill, mode, random.Random())
     except curses.error:
         print("Le terminal ne supporte pas l'affichage interactif de cet exercice.")
         log_result("musique_notes_portee", None)
@@ -358,7 +681,9 @@ def main() -> None:
     completed = bool(result["completed"])
     score = (correct / total * 100) if total else 0.0
 
-    if completed:
+    if mode != "classique":
+        print(f"Tu as reconnu {correct} note(s) du premier coup sur {total}.")
+    elif completed:
         print(f"Bravo ! Tu as relié {correct} note(s) sur {total}.")
     else:
         print(f"Tu as relié {correct} note(s) sur {total}. Reviens quand tu veux !")
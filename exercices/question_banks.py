@@ -0,0 +1,319 @@
+"""Question banks stored as data and loaded on demand.
+
+A bank is written as a JSON file in :data:`BANK_DIR` and compiled into an
+SQLite file next to it the first time it is used, or again whenever the
+source changes.  Exercises then read only the questions they ask, one
+indexed row at a time, so importing a module costs nothing and memory does
+not grow with the size of the bank.
+
+Source format::
+
+    {
+      "title": "Journal d'un chat assassin",
+      "sections": [
+        {"key": "1", "title": "Chapitre 1 — Lundi", "questions": [{...}, ...]},
+        ...
+      ]
+    }
+
+A bank without sections may give ``"questions"`` at the top level instead;
+it then has a single section whose key is ``""``.  Each question is an
+arbitrary JSON object that the exercise interprets.
+
+Compile every bank ahead of time (for example before packaging) with::
+
+    python -m exercices.question_banks
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+BANK_DIR = Path(__file__).with_name("banques_questions")
+
+# Bump when the compiled layout changes so stale files are rebuilt.
+_FORMAT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE sections (
+    position INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE questions (
+    section INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (section, position)
+) WITHOUT ROWID;
+"""
+
+
+class BankError(Exception):
+    """Raised when a bank source is missing or malformed."""
+
+
+@dataclass(frozen=True)
+class Section:
+    key: str
+    title: str
+    size: int
+
+
+def _source_sections(document: object, source: Path) -> list[dict]:
+    if not isinstance(document, dict):
+        raise BankError(f"{source.name} : un objet JSON est attendu")
+    if "sections" in document:
+        sections = document["sections"]
+    elif "questions" in document:
+        sections = [{"key": "", "title": document.get("title", ""), "questions": document["questions"]}]
+    else:
+        raise BankError(f"{source.name} : clé 'sections' ou 'questions' manquante")
+    if not isinstance(sections, list):
+        raise BankError(f"{source.name} : 'sections' doit être une liste")
+    keys = set()
+    for index, section in enumerate(sections):
+        if not isinstance(section, dict) or not isinstance(section.get("questions"), list):
+            raise BankError(f"{source.name} : section {index + 1} sans liste 'questions'")
+        key = str(section.get("key", index + 1))
+        if key in keys:
+            raise BankError(f"{source.name} : section '{key}' en double")
+        keys.add(key)
+    return sections
+
+
+def _stamp(source: Path) -> str:
+    stat = source.stat()
+    return f"{_FORMAT_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def compile_bank(source: Path, target: Path) -> int:
+    """Compile the JSON bank ``source`` into the SQLite file ``target``.
+
+    The file is written under a temporary name and then moved into place,
+    so a reader never sees a half-written bank.  Returns the number of
+    questions.
+    """
+
+    stamp = _stamp(source)
+    with source.open(encoding="utf-8") as fh:
+        try:
+            document = json.load(fh)
+        except json.JSONDecodeError as exc:
+            raise BankError(f"{source.name} : JSON invalide ({exc})") from exc
+    sections = _source_sections(document, source)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.stem}-", suffix=".sqlite", dir=target.parent)
+    os.close(fd)
+    total = 0
+    try:
+        db = sqlite3.connect(tmp_name)
+        try:
+            db.executescript(_SCHEMA)
+            db.execute("INSERT INTO meta VALUES ('stamp', ?)", (stamp,))
+            db.execute("INSERT INTO meta VALUES ('title', ?)", (str(document.get("title", "")),))
+            for position, section in enumerate(sections):
+                questions = section["questions"]
+                db.execute(
+                    "INSERT INTO sections VALUES (?, ?, ?, ?)",
+                    (position, str(section.get("key", position + 1)), str(section.get("title", "")), len(questions)),
+                )
+                db.executemany(
+                    "INSERT INTO questions VALUES (?, ?, ?)",
+                    (
+                        (position, index, json.dumps(question, ensure_ascii=False, separators=(",", ":")))
+                        for index, question in enumerate(questions)
+                    ),
+                )
+                total += len(questions)
+            db.commit()
+        finally:
+            db.close()
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return total
+
+
+class QuestionBank:
+    """Lazy, read-only view of one compiled bank.
+
+    Creating the object does no I/O; the compiled file is checked, rebuilt
+    if needed and opened on first use.
+    """
+
+    def __init__(self, name: str, directory: Path = BANK_DIR) -> None:
+        self.name = name
+        self.source = directory / f"{name}.json"
+        self.compiled = directory / f"{name}.sqlite"
+        self._db: Optional[sqlite3.Connection] = None
+        self._sections: Optional[list[Section]] = None
+
+    # -- opening ---------------------------------------------------------
+    def _is_current(self) -> bool:
+        if not self.compiled.exists():
+            return False
+        try:
+            db = sqlite3.connect(f"file:{self.compiled}?mode=ro", uri=True)
+            try:
+                row = db.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+            finally:
+                db.close()
+        except sqlite3.Error:
+            return False
+        return row is not None and row[0] == _stamp(self.source)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            if not self.source.exists():
+                if not self.compiled.exists():
+                    raise BankError(f"banque introuvable : {self.source}")
+            elif not self._is_current():
+                try:
+                    compile_bank(self.source, self.compiled)
+                except OSError:
+                    # Read-only installation: keep the compiled bank in memory.
+                    self._db = self._compile_in_memory()
+                    return self._db
+            self._db = sqlite3.connect(f"file:{self.compiled}?mode=ro", uri=True)
+        return self._db
+
+    def _compile_in_memory(self) -> sqlite3.Connection:
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / self.compiled.name
+            compile_bank(self.source, target)
+            disk = sqlite3.connect(target)
+            memory = sqlite3.connect(":memory:")
+            disk.backup(memory)
+            disk.close()
+        return memory
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # -- metadata --------------------------------------------------------
+    def sections(self) -> list[Section]:
+        """Sections in file order, with their sizes."""
+
+        if self._sections is None:
+            rows = self._connection().execute("SELECT key, title, size FROM sections ORDER BY position")
+            self._sections = [Section(*row) for row in rows]
+        return self._sections
+
+    def _positions(self, keys: Optional[Iterable[str]]) -> list[tuple[int, int]]:
+        """``(section position, size)`` for the requested section keys."""
+
+        sections = self.sections()
+        if keys is None:
+            return [(position, section.size) for position, section in enumerate(sections)]
+        wanted = set(keys)
+        unknown = wanted - {section.key for section in sections}
+        if unknown:
+            raise KeyError(f"sections inconnues dans {self.name} : {sorted(unknown)}")
+        return [(position, section.size) for position, section in enumerate(sections) if section.key in wanted]
+
+    def count(self, sections: Optional[Iterable[str]] = None) -> int:
+        """Number of questions in ``sections`` (all sections by default)."""
+
+        return sum(size for _, size in self._positions(sections))
+
+    def __len__(self) -> int:
+        return self.count()
+
+    # -- questions -------------------------------------------------------
+    def _fetch(self, section: int, position: int) -> dict:
+        row = self._connection().execute(
+            "SELECT data FROM questions WHERE section = ? AND position = ?", (section, position)
+        ).fetchone()
+        return json.loads(row[0])
+
+    def question(self, index: int, sections: Optional[Iterable[str]] = None) -> dict:
+        """The ``index``-th question across ``sections``, in file order."""
+
+        if index < 0:
+            raise IndexError(index)
+        for section, size in self._positions(sections):
+            if index < size:
+                return self._fetch(section, index)
+            index -= size
+        raise IndexError("question index out of range")
+
+    def questions(
+        self,
+        sections: Optional[Iterable[str]] = None,
+        *,
+        rng: Optional[random.Random] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Yield questions one at a time, decoding each only when it is asked.
+
+        In file order by default; with ``rng`` in random order, drawing only
+        ``limit`` indices (all of them when ``limit`` is ``None``).
+        """
+
+        positions = self._positions(sections)
+        total = sum(size for _, size in positions)
+        wanted = total if limit is None else min(limit, total)
+        if rng is None:
+            db = self._connection()
+            produced = 0
+            for section, _ in positions:
+                for (data,) in db.execute(
+                    "SELECT data FROM questions WHERE section = ? ORDER BY position", (section,)
+                ):
+                    if produced == wanted:
+                        return
+                    produced += 1
+                    yield json.loads(data)
+            return
+        section_keys = [self.sections()[section].key for section, _ in positions]
+        for index in rng.sample(range(total), wanted):
+            yield self.question(index, section_keys)
+
+
+_BANKS: dict[str, QuestionBank] = {}
+
+
+def load_bank(name: str) -> QuestionBank:
+    """Shared :class:`QuestionBank` for ``name`` (no I/O until first use)."""
+
+    bank = _BANKS.get(name)
+    if bank is None:
+        bank = _BANKS[name] = QuestionBank(name)
+    return bank
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Compile the banks named in ``argv`` (all banks by default)."""
+
+    names = list(argv if argv is not None else sys.argv[1:])
+    if not names:
+        names = sorted(path.stem for path in BANK_DIR.glob("*.json"))
+    status = 0
+    for name in names:
+        source = BANK_DIR / f"{name}.json"
+        try:
+            total = compile_bank(source, source.with_suffix(".sqlite"))
+        except (OSError, BankError) as exc:
+            print(f"❌ {name} : {exc}")
+            status = 1
+        else:
+            print(f"✅ {name} : {total} question(s)")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,269 @@
+"""Shared quiz engine: answer matching and the question loop.
+
+Accepted answers are folded once into an :class:`AnswerSet`, a frozen set of
+normalised forms: case, apostrophes, spacing and (unless the exercise is
+about spelling them) accents are folded, and the usual typing variants —
+``j'ai`` typed as ``jai`` or ``j ai`` — are generated rather than listed by
+hand.  Checking a learner's answer is then one fold and one set lookup.
+
+:func:`run_quiz` asks a sequence of :class:`Question` objects (free text or
+multiple choice), prints the feedback, keeps the score and logs the result,
+so the exercises only describe their questions and wording.
+"""
+
+from __future__ import annotations
+
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Sequence
+
+from .logger import log_result
+from .utils import ask_choice_with_navigation
+
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'", "ʼ": "'", "`": "'", "´": "'"})
+_LIGATURES = str.maketrans({"œ": "oe", "æ": "ae"})
+# Punctuation that only separates words: "mords, nourris-toi" = "mords nourris-toi".
+_SEPARATORS = str.maketrans({",": " ", ";": " ", ":": " "})
+# Characters a learner may leave around an answer: "-ais", "parle.", …
+_EDGE_NOISE = " .!?-"
+
+
+def fold_answer(text: str, *, keep_accents: bool = False, ignore_spaces: bool = False) -> str:
+    """Normalise ``text`` for comparison.
+
+    Lower-cases, unifies apostrophes, treats commas and colons as spaces,
+    collapses spaces (removes them with ``ignore_spaces``), drops spaces
+    around apostrophes and surrounding punctuation, and removes accents
+    unless ``keep_accents`` is set.
+    """
+
+    folded = unicodedata.normalize("NFC", text).translate(_APOSTROPHES).translate(_SEPARATORS).casefold()
+    if not keep_accents:
+        folded = "".join(
+            char for char in unicodedata.normalize("NFD", folded.translate(_LIGATURES))
+            if not unicodedata.combining(char)
+        )
+    folded = "".join(folded.split()) if ignore_spaces else " ".join(folded.split())
+    folded = folded.replace(" '", "'").replace("' ", "'")
+    return folded.strip(_EDGE_NOISE)
+
+
+@dataclass(frozen=True)
+class AnswerSet:
+    """Every accepted spelling of an answer, folded once."""
+
+    display: str
+    forms: frozenset[str]
+    keep_accents: bool = False
+    ignore_spaces: bool = False
+
+    @classmethod
+    def build(
+        cls, answers: Iterable[str], *, keep_accents: bool = False, ignore_spaces: bool = False
+    ) -> AnswerSet:
+        """Fold ``answers`` (the first one is shown as the correction)."""
+
+        answers = tuple(answers)
+        if not answers:
+            raise ValueError("an AnswerSet needs at least one answer")
+        return _answer_set(answers, keep_accents, ignore_spaces)
+
+    def matches(self, raw: str) -> bool:
+        return fold_answer(raw, keep_accents=self.keep_accents, ignore_spaces=self.ignore_spaces) in self.forms
+
+    __contains__ = matches
+
+
+@lru_cache(maxsize=4096)
+def _answer_set(answers: tuple[str, ...], keep_accents: bool, ignore_spaces: bool) -> AnswerSet:
+    forms: set[str] = set()
+    for answer in answers:
+        folded = fold_answer(answer, keep_accents=keep_accents, ignore_spaces=ignore_spaces)
+        forms.add(folded)
+        if "'" in folded:
+            forms.add(folded.replace("'", ""))
+            if not ignore_spaces:
+                forms.add(folded.replace("'", " "))
+    return AnswerSet(answers[0], frozenset(forms), keep_accents, ignore_spaces)
+
+
+@dataclass(frozen=True)
+class Question:
+    """One quiz question: free text (``answers``) or multiple choice (``choices``)."""
+
+    prompt: str
+    answers: Optional[AnswerSet] = None
+    choices: tuple[str, ...] = ()
+    answer: int = -1                          # index of the right choice
+    explanation: str = ""
+    feedback: Optional[tuple[str, ...]] = None  # replaces the default lines after a wrong answer
+    after: str = ""                           # printed after every answer
+    tag: object = None                        # free for the exercise (skill, record, …)
+
+    @property
+    def expected(self) -> str:
+        if self.choices:
+            return self.choices[self.answer]
+        return self.answers.display if self.answers is not None else ""
+
+
+@dataclass(frozen=True)
+class QuizTexts:
+    """Wording of the quiz loop; an empty string skips the line."""
+
+    header: str = "Question {index}/{total}"
+    answer_prompt: str = "Ta réponse : "
+    option: str = "  {number}. {option}"
+    choice_prompt: str = "Ton choix (1-{count}) : "
+    invalid_choice: str = "Entre le numéro d'une réponse."
+    correct: str = "✅ Bravo !"
+    wrong: str = "❌ Pas tout à fait."
+    expected: str = "✅ Réponse attendue : {expected}"
+    explanation: str = "ℹ️ {explanation}"
+    quit: str = "\nRetour au menu demandé. Fin de l'exercice.\n"
+    final: str = "\nScore final : {score}/{total}"
+
+
+FRENCH_TEXTS = QuizTexts()
+ENGLISH_TEXTS = QuizTexts(
+    answer_prompt="Your answer: ",
+    choice_prompt="Your answer (number): ",
+    invalid_choice="Enter the number of your choice.",
+    correct="✅ Correct!",
+    wrong="❌ Not quite.",
+    expected="Correct answer: {expected}",
+    quit="\nBack to the menu.\n",
+    final="\nFinal score: {score}/{total} ({percentage:.1f}%)",
+)
+
+
+@dataclass(frozen=True)
+class AnswerRecord:
+    question: Question
+    correct: bool
+    seconds: float
+
+
+@dataclass
+class QuizResult:
+    exercise: str
+    total: int
+    records: list[AnswerRecord] = field(default_factory=list)
+    aborted: bool = False
+
+    @property
+    def score(self) -> int:
+        return sum(record.correct for record in self.records)
+
+    @property
+    def asked(self) -> int:
+        return len(self.records)
+
+    @property
+    def percentage(self) -> float:
+        return self.score / self.asked * 100 if self.asked else 0.0
+
+
+def log_results(exercise: str, results: Sequence[QuizResult]) -> Optional[float]:
+    """Log the combined score of ``results`` (several rounds of one exercise).
+
+    Nothing is logged when no question was answered.  Returns the logged
+    percentage.
+    """
+
+    asked = sum(result.asked for result in results)
+    if not asked:
+        return None
+    percentage = sum(result.score for result in results) / asked * 100
+    log_result(exercise, percentage)
+    return percentage
+
+
+def _ask_number(question: Question, texts: QuizTexts) -> int:
+    for number, option in enumerate(question.choices, start=1):
+        print(texts.option.format(number=number, option=option))
+    while True:
+        raw = input(texts.choice_prompt.format(count=len(question.choices))).strip()
+        if raw.isdigit() and 1 <= int(raw) <= len(question.choices):
+            return int(raw) - 1
+        print(texts.invalid_choice)
+
+
+def run_quiz(
+    exercise: str,
+    questions: Iterable[Question],
+    *,
+    total: Optional[int] = None,
+    texts: QuizTexts = FRENCH_TEXTS,
+    choice_style: str = "navigation",
+    ask: Optional[Callable[[Question], str]] = None,
+    on_answer: Optional[Callable[[Question, bool], None]] = None,
+    log: bool = True,
+) -> QuizResult:
+    """Ask ``questions`` in order and return the result.
+
+    ``questions`` may be a lazy iterator (for example a question bank);
+    pass ``total`` so headers can show it.  Multiple-choice questions use
+    the arrow-key boxes (``choice_style="navigation"``, where ``q`` leaves
+    the quiz) or a numbered list (``"numbered"``).  ``ask`` replaces the
+    plain ``input`` for free-text answers.  The score is logged under
+    ``exercise`` once the quiz is completed, unless ``log`` is false (use
+    :func:`log_results` to log several rounds together).
+    """
+
+    if total is None:
+        questions = list(questions)
+        total = len(questions)
+    result = QuizResult(exercise, total)
+
+    for index, question in enumerate(questions, start=1):
+        print()
+        if texts.header:
+            print(texts.header.format(index=index, total=total))
+        if question.prompt:
+            print(question.prompt)
+
+        started = time.monotonic()
+        if question.choices:
+            if choice_style == "numbered":
+                selected = _ask_number(question, texts)
+            else:
+                selected, _, quit_requested = ask_choice_with_navigation(question.choices)
+                if quit_requested:
+                    if texts.quit:
+                        print(texts.quit)
+                    result.aborted = True
+                    return result
+            correct = selected == question.answer
+            expected = question.expected
+            if choice_style != "numbered":
+                expected = f"{chr(ord('a') + question.answer)}) {expected}"
+        else:
+            raw = ask(question) if ask is not None else input(texts.answer_prompt)
+            correct = question.answers is not None and question.answers.matches(raw)
+            expected = question.expected
+
+        result.records.append(AnswerRecord(question, correct, time.monotonic() - started))
+        if correct:
+            print(texts.correct)
+        elif question.feedback is not None:
+            for line in question.feedback:
+                print(line)
+        else:
+            for template in (texts.wrong, texts.expected):
+                if template:
+                    print(template.format(expected=expected))
+            if question.explanation and texts.explanation:
+                print(texts.explanation.format(explanation=question.explanation))
+        if question.after:
+            print(question.after)
+        if on_answer is not None:
+            on_answer(question, correct)
+
+    if texts.final:
+        print(texts.final.format(score=result.score, total=total, percentage=result.percentage))
+    if log:
+        log_result(exercise, result.percentage)
+    return result
@@ -0,0 +1,204 @@
+"""Spaced-repetition scheduling shared by the exercises.
+
+Every item an exercise can ask (a word, a bank question, …) has a small
+review state: its Leitner box (number of successes in a row), an SM-2 ease
+factor, the current interval and the time it is next due.  States are kept
+in one SQLite file next to the results log, in a table indexed on
+``(deck, due)``: that index is the priority queue of due items, so picking
+the next N items is a single index range scan (O(log n + N)) even with tens
+of thousands of items per deck, and recording an answer updates one row.
+
+Typical use::
+
+    deck = load_deck("anglais_sports_arts_actions")
+    deck.introduce(word for word, _ in ITEMS)   # new items, in random order
+    for key in deck.next_items(8):
+        ...
+        deck.record(key, correct)
+
+Items that were never answered are due from the moment they are introduced,
+so the most overdue reviews come first, then new items, then the reviews
+that are closest to being due.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterable, Optional
+
+REVIEW_FILE = Path(__file__).with_name("revisions.sqlite")
+
+DAY = 86_400.0
+# A missed item comes back in the same session if there is time left.
+RELEARN_DELAY = 600.0
+# Answers quicker than this count as effortless recall (SM-2 quality 5),
+# slower than SLOW_ANSWER as difficult recall (quality 3).
+FAST_ANSWER = 8.0
+SLOW_ANSWER = 30.0
+MIN_EASE = 1.3
+
+# Bump when the table layout changes; older files are then rebuilt.
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    deck TEXT NOT NULL,
+    item TEXT NOT NULL,
+    box INTEGER NOT NULL DEFAULT 0,
+    ease REAL NOT NULL DEFAULT 2.5,
+    interval REAL NOT NULL DEFAULT 0,
+    due REAL NOT NULL,
+    lapses INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (deck, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_due ON items (deck, due);
+"""
+
+
+@dataclass(frozen=True)
+class ItemState:
+    """Review state of one item."""
+
+    box: int = 0          # Leitner box: successes in a row
+    ease: float = 2.5     # SM-2 ease factor
+    interval: float = 0.0  # days until the next review
+    due: float = 0.0      # epoch seconds
+    lapses: int = 0       # times the item was forgotten
+
+
+def grade(correct: bool, seconds: Optional[float] = None) -> int:
+    """SM-2 quality (0–5) of an answer, from its correctness and speed."""
+
+    if not correct:
+        return 1
+    if seconds is None:
+        return 4
+    if seconds <= FAST_ANSWER:
+        return 5
+    return 3 if seconds >= SLOW_ANSWER else 4
+
+
+def review(state: ItemState, quality: int, now: float) -> ItemState:
+    """State after an answer of SM-2 ``quality`` given at ``now``.
+
+    A failed item goes back to the first box and returns after
+    :data:`RELEARN_DELAY`; a recalled one moves up a box and its interval
+    grows (1 day, 6 days, then times the ease factor).
+    """
+
+    if quality < 3:
+        return replace(state, box=0, interval=0.0, due=now + RELEARN_DELAY, lapses=state.lapses + 1)
+    if state.box == 0:
+        interval = 1.0
+    elif state.box == 1:
+        interval = 6.0
+    else:
+        interval = state.interval * state.ease
+    ease = max(MIN_EASE, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return ItemState(state.box + 1, ease, interval, now + interval * DAY, state.lapses)
+
+
+class Deck:
+    """Review states of the items of one exercise.
+
+    Creating the object does no I/O; the store is opened on first use.
+    """
+
+    def __init__(self, name: str, path: Path = REVIEW_FILE) -> None:
+        self.name = name
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            try:
+                db = sqlite3.connect(self.path)
+                if db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    db.executescript(f"DROP TABLE IF EXISTS items; PRAGMA user_version = {_SCHEMA_VERSION};")
+            except sqlite3.Error:
+                # Read-only installation: keep this session's progress in memory.
+                db = sqlite3.connect(":memory:")
+            db.executescript(_SCHEMA)
+            self._db = db
+        return self._db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM items WHERE deck = ?", (self.name,)).fetchone()[0]
+
+    def introduce(self, items: Iterable[str], now: Optional[float] = None) -> int:
+        """Add the items not yet in the deck, due now in the given order.
+
+        Returns the number of new items.  Known items keep their state.
+        """
+
+        now = time.time() if now is None else now
+        with self._connection() as db:
+            cursor = db.executemany(
+                "INSERT OR IGNORE INTO items (deck, item, due) VALUES (?, ?, ?)",
+                ((self.name, item, now + position * 1e-3) for position, item in enumerate(dict.fromkeys(items))),
+            )
+        return max(cursor.rowcount, 0)
+
+    def next_items(self, count: int, within: Optional[Iterable[str]] = None) -> list[str]:
+        """The ``count`` most urgent items, most overdue first.
+
+        With ``within``, only those items are considered (for example the
+        questions of one chapter); they are loaded into a temporary table
+        so the filter and the ``LIMIT`` both run in SQLite.
+        """
+
+        db = self._connection()
+        if within is None:
+            rows = db.execute(
+                "SELECT item FROM items WHERE deck = ? ORDER BY due LIMIT ?", (self.name, count)
+            )
+            return [item for (item,) in rows]
+        with db:
+            db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (item TEXT PRIMARY KEY) WITHOUT ROWID")
+            db.execute("DELETE FROM wanted")
+            db.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", ((item,) for item in within))
+        rows = db.execute(
+            "SELECT items.item FROM items JOIN wanted ON wanted.item = items.item"
+            " WHERE items.deck = ? ORDER BY items.due LIMIT ?",
+            (self.name, count),
+        )
+        return [item for (item,) in rows]
+
+    def state(self, item: str) -> ItemState:
+        row = self._connection().execute(
+            "SELECT box, ease, interval, due, lapses FROM items WHERE deck = ? AND item = ?", (self.name, item)
+        ).fetchone()
+        return ItemState(*row) if row is not None else ItemState()
+
+    def record(
+        self, item: str, correct: bool, seconds: Optional[float] = None, now: Optional[float] = None
+    ) -> ItemState:
+        """Update ``item`` after an answer and return its new state."""
+
+        now = time.time() if now is None else now
+        state = review(self.state(item), grade(correct, seconds), now)
+        with self._connection() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.name, item, state.box, state.ease, state.interval, state.due, state.lapses),
+            )
+        return state
+
+
+_DECKS: dict[str, Deck] = {}
+
+
+def load_deck(name: str) -> Deck:
+    """Shared :class:`Deck` for the exercise ``name`` (no I/O until first use)."""
+
+    deck = _DECKS.get(name)
+    if deck is None:
+        deck = _DECKS[name] = Deck(name)
+    return deck
@@ -0,0 +1,252 @@
+"""Approximate matching for the spelling exercises.
+
+A typed word is compared with the accepted spellings by Levenshtein
+distance (insertions, deletions and substitutions), computed with Myers'
+bit-parallel algorithm: each accepted word is turned once into one bit mask
+per letter, and a comparison is then a handful of integer operations per
+typed character, whatever the length of the word.  Words whose length is
+too far from the answer are skipped without any computation, so checking
+an answer against a whole vocabulary stays in the microseconds.
+
+:meth:`Vocabulary.check` sorts an answer into :data:`EXACT`,
+:data:`NEAR_MISS` (a typo or two, depending on the word length) or
+:data:`WRONG`, and says which accepted word it was closest to.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional
+
+EXACT = "exact"
+NEAR_MISS = "near_miss"
+WRONG = "wrong"
+
+# Words up to this length tolerate one typo, longer ones two.
+SHORT_WORD = 5
+# Vocabularies from this size get a segment index instead of being scanned.
+INDEX_THRESHOLD = 256
+
+
+def typo_limit(word: str) -> int:
+    """Largest distance to ``word`` still counted as a near miss."""
+
+    return 1 if len(word) <= SHORT_WORD else 2
+
+
+def fold(text: str) -> str:
+    """Case-folded ``text`` with its spaces collapsed."""
+
+    return " ".join(text.casefold().split())
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    word: str
+    masks: dict[str, int]  # bit i set where word[i] is the letter
+    limit: int             # typo_limit(word)
+
+
+def _pattern(word: str) -> _Pattern:
+    masks: dict[str, int] = {}
+    for index, letter in enumerate(word):
+        masks[letter] = masks.get(letter, 0) | 1 << index
+    return _Pattern(word, masks, typo_limit(word))
+
+
+def _distance(pattern: _Pattern, text: str, limit: Optional[int] = None) -> int:
+    """Levenshtein distance from ``pattern`` to ``text`` (Myers / Hyyrö).
+
+    With ``limit``, stops as soon as the distance is known to exceed it and
+    returns ``limit + 1``.
+    """
+
+    length = len(pattern.word)
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    positive, negative, score = full, 0, length
+    remaining = len(text)
+    for letter in text:
+        equal = pattern.masks.get(letter, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        up = negative | ~(horizontal | positive)
+        down = positive & horizontal
+        if up & last:
+            score += 1
+        elif down & last:
+            score -= 1
+        up = (up << 1) | 1
+        down <<= 1
+        positive = (down | ~(vertical | up)) & full
+        negative = up & vertical & full
+        remaining -= 1
+        if limit is not None and score - remaining > limit:
+            return limit + 1
+    return score
+
+
+def edit_distance(first: str, second: str) -> int:
+    """Levenshtein distance between two strings."""
+
+    return _distance(_pattern(first), second)
+
+
+@dataclass(frozen=True)
+class SpellingCheck:
+    """How an answer compares with the accepted words."""
+
+    verdict: str               # EXACT, NEAR_MISS or WRONG
+    closest: str               # accepted word nearest to the answer
+    distance: int
+
+    @property
+    def exact(self) -> bool:
+        return self.verdict == EXACT
+
+    @property
+    def near_miss(self) -> bool:
+        return self.verdict == NEAR_MISS
+
+
+def _segments(word: str, pieces: int) -> list[tuple[int, str]]:
+    """``word`` cut into ``pieces`` nearly equal ``(start, text)`` parts."""
+
+    bounds = [len(word) * index // pieces for index in range(pieces + 1)]
+    return [(bounds[index], word[bounds[index]:bounds[index + 1]]) for index in range(pieces)]
+
+
+class Vocabulary:
+    """Accepted words, preprocessed once for approximate matching.
+
+    Small vocabularies (the accepted spellings of one question) are simply
+    scanned, from the words of the answer's length outwards: a word ``n``
+    letters longer or shorter is at least ``n`` edits away, so whole length
+    groups are skipped once a closer word is found.
+
+    From :data:`INDEX_THRESHOLD` words on, near misses are looked up in a
+    segment index instead: a word within ``k`` edits of the answer, cut into
+    ``k + 1`` pieces, keeps at least one piece intact, found in the answer
+    at most ``k`` letters away from its place.  The index is keyed on the
+    piece, its place and the word length, so only words of a compatible
+    length sharing a piece with the answer near its place are measured.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = tuple(dict.fromkeys(fold(word) for word in words))
+        if not self.words:
+            raise ValueError("a Vocabulary needs at least one word")
+        self._known = frozenset(self.words)
+        self._patterns = tuple(_pattern(word) for word in self.words)
+        by_length: dict[int, list[_Pattern]] = {}
+        for pattern in self._patterns:
+            by_length.setdefault(len(pattern.word), []).append(pattern)
+        self._by_length = {length: tuple(patterns) for length, patterns in by_length.items()}
+        self._longest = max(self._by_length)
+        self._limit = max(typo_limit(word) for word in self.words)
+
+        self._index: Optional[dict[tuple[str, int, int], list[int]]] = None
+        self._unindexed: list[int] = []
+        if len(self.words) >= INDEX_THRESHOLD:
+            self._index = {}
+            for number, word in enumerate(self.words):
+                segments = _segments(word, typo_limit(word) + 1)
+                if not all(text for _, text in segments):
+                    self._unindexed.append(number)
+                    continue
+                for start, text in segments:
+                    self._index.setdefault((text, start, len(word)), []).append(number)
+            self._segment_lengths = sorted({len(text) for text, _, _ in self._index})
+
+    def closest(self, answer: str, limit: Optional[int] = None) -> tuple[str, int]:
+        """Nearest word and its distance, by scanning the vocabulary.
+
+        With ``limit``, words further than ``limit`` are not measured
+        exactly; if none is within it, the first word is returned with
+        ``limit + 1``.
+        """
+
+        answer = fold(answer)
+        if answer in self._known:
+            return answer, 0
+        size = len(answer)
+        best_word, best = self.words[0], max(size, self._longest) + 1
+        if limit is not None:
+            best = min(best, limit + 1)
+        gap = 0
+        while gap < best and (size - gap >= 0 or size + gap <= self._longest):
+            for length in (size - gap, size + gap) if gap else (size,):
+                for pattern in self._by_length.get(length, ()):
+                    distance = _distance(pattern, answer, best - 1)
+                    if distance < best:
+                        best_word, best = pattern.word, distance
+                        if best <= gap:
+                            break
+            gap += 1
+        return best_word, best
+
+    def _candidates(self, answer: str) -> Iterable[int]:
+        """Words that may be near misses of ``answer``."""
+
+        if self._index is None:
+            return range(len(self.words))
+        # Words sharing the most pieces with the answer come first.
+        found = dict.fromkeys(self._unindexed, 0)
+        size = len(answer)
+        lengths = [
+            (length, 1 if length <= SHORT_WORD else 2)
+            for length in range(max(1, size - self._limit), size + self._limit + 1)
+        ]
+        lengths = [(length, limit) for length, limit in lengths if abs(length - size) <= limit]
+        for start in range(size):
+            for piece in self._segment_lengths:
+                if start + piece > size:
+                    break
+                text = answer[start:start + piece]
+                for length, limit in lengths:
+                    for position in range(max(0, start - limit), start + limit + 1):
+                        for number in self._index.get((text, position, length), ()):
+                            found[number] = found.get(number, 0) + 1
+        return sorted(found, key=found.__getitem__, reverse=True)
+
+    def check(self, answer: str) -> SpellingCheck:
+        """Classify ``answer`` as exact, near miss or wrong.
+
+        For a wrong answer, ``closest`` is the nearest word of a scanned
+        vocabulary, or the first word of an indexed one.
+        """
+
+        answer = fold(answer)
+        if answer in self._known:
+            return SpellingCheck(EXACT, answer, 0)
+        word, distance = "", self._limit + 1
+        for number in self._candidates(answer):
+            pattern = self._patterns[number]
+            limit = min(distance - 1, pattern.limit)
+            if abs(len(pattern.word) - len(answer)) <= limit:
+                found = _distance(pattern, answer, limit)
+                if found <= limit:
+                    word, distance = pattern.word, found
+                    if distance == 1:
+                        break
+        if word:
+            return SpellingCheck(NEAR_MISS, word, distance)
+        if self._index is None:
+            word, distance = self.closest(answer)
+        else:
+            word, distance = self.words[0], _distance(self._patterns[0], answer)
+        return SpellingCheck(WRONG, word, distance)
+
+
+@lru_cache(maxsize=1024)
+def _vocabulary(words: tuple[str, ...]) -> Vocabulary:
+    return Vocabulary(words)
+
+
+def check_spelling(answer: str, accepted: Iterable[str]) -> SpellingCheck:
+    """:meth:`Vocabulary.check` against ``accepted`` (preprocessed once per word list)."""
+
+    return _vocabulary(tuple(accepted)).check(answer)
@@ -7,21 +7,19 @@ such as displaying long pieces of text in a scrollable box.
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import sys
-from typing import List, Sequence, Set
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Sequence, Set, Tuple
 
-import pydoc
 try:  # ``msvcrt`` is only available on Windows
     import msvcrt
 except Exception:  # pragma: no cover - import will fail on non-Windows
     msvcrt = None  # type: ignore[assignment]
-try:  # Arrow-key handling on POSIX
-    import termios
-    import tty
-except Exception:  # pragma: no cover - not available everywhere
-    termios = None  # type: ignore[assignment]
-    tty = None  # type: ignore[assignment]
+
+from .keyboard import KeyEvent, KeySession, key_session
 
 
 CYAN = "\033[96m"
@@ -34,9 +32,9 @@ def scroll_text(text: str, exit_letter: str = "q", hint: str | None = None) -> N
 
     The pager always shows a hint about which key to press to exit.  On
     Windows a small custom implementation is used so emojis display
-    correctly.  Elsewhere :func:`pydoc.pager` is still leveraged but the
-    hint is added at the beginning and end of the text so the user knows
-    to press ``exit_letter`` to continue.
+    correctly.  On other terminals the built-in :class:`_Pager` is used:
+    it runs in-process, wraps only the lines it shows and keeps the hint on
+    the bottom line.  Without a terminal the text is simply printed.
 
     Parameters
     ----------
@@ -55,12 +53,215 @@ def scroll_text(text: str, exit_letter: str = "q", hint: str | None = None) -> N
         # Add the hint to the top of the text and keep another copy on the
         # bottom line that remains visible while scrolling.
         _scroll_text_windows(f"{hint}\n\n{text}", exit_letter, hint)
-    else:  # fall back to pydoc's pager elsewhere
-        decorated = f"{hint}\n\n{text}\n\n{hint}"
+    elif sys.stdin.isatty() and sys.stdout.isatty():
+        _Pager(text, exit_letter, hint).run()
+    else:
+        print(f"{hint}\n\n{text}\n\n{hint}")
+
+
+_ANSI_OR_CHAR = re.compile(r"\033\[[0-9;?]*[A-Za-z]|.", re.DOTALL)
+_ANSI = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+
+
+def _char_width(char: str) -> int:
+    """Terminal columns taken by ``char`` (emojis and CJK count 2)."""
+
+    if unicodedata.combining(char) or char in "\u200d\ufe0e\ufe0f":
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def _wrap_line(line: str, width: int) -> List[str]:
+    """Split ``line`` into screen rows of at most ``width`` columns.
+
+    Colour codes do not take room, and the codes active at a break are
+    repeated at the start of the next row so every row can be drawn alone.
+    """
+
+    rows: List[str] = []
+    current: List[str] = []
+    active: List[str] = []
+    used = 0
+    for token in _ANSI_OR_CHAR.findall(line.expandtabs(4)):
+        if token.startswith("\033"):
+            current.append(token)
+            if token.endswith("m"):
+                active = [] if token in (RESET, "\033[m") else active + [token]
+            continue
+        char_width = _char_width(token)
+        if used + char_width > width and used:
+            rows.append("".join(current) + (RESET if active else ""))
+            current = list(active)
+            used = 0
+        current.append(token)
+        used += char_width
+    rows.append("".join(current) + (RESET if active else ""))
+    return rows
+
+
+class _Pager:
+    """Full-screen pager running in the current process.
+
+    Logical lines are only wrapped when they are about to be shown (the
+    wrapped rows are cached until the terminal width changes), so opening a
+    huge text costs no more than opening a short one.  The position is a
+    ``(line, row)`` pair: the logical line at the top of the screen and the
+    wrapped row of that line.
+
+    Keys: arrows or ``j``/``k`` scroll by one row, Page Up/Down, space and
+    ``b`` by one screen, Home/End (``g``/``G``) jump to the ends, ``/``
+    searches (case-insensitive) and ``n`` finds the next match.
+    """
+
+    def __init__(self, text: str, exit_letter: str, hint: str) -> None:
+        self.lines = text.splitlines() or [""]
+        self.exit_letter = exit_letter.lower()
+        self.hint = hint
+        self.top: Tuple[int, int] = (0, 0)
+        self.query = ""
+        self.message = ""
+        self._width = 0
+        self._rows: Dict[int, List[str]] = {}
+
+    # -- wrapping --------------------------------------------------------
+    def _wrapped(self, index: int) -> List[str]:
+        rows = self._rows.get(index)
+        if rows is None:
+            rows = self._rows[index] = _wrap_line(self.lines[index], self._width)
+        return rows
+
+    def _resize(self) -> int:
+        """Adapt to the terminal size; return the number of text rows."""
+
+        size = shutil.get_terminal_size()
+        width = max(10, size.columns)
+        if width != self._width:
+            self._width = width
+            self._rows.clear()
+            self.top = (self.top[0], 0)
+        return max(1, size.lines - 1)
+
+    def _forward(self, position: Tuple[int, int], count: int) -> Tuple[int, int]:
+        line, row = position
+        while count > 0:
+            remaining = len(self._wrapped(line)) - 1 - row
+            if remaining >= count:
+                return line, row + count
+            if line + 1 >= len(self.lines):
+                return line, len(self._wrapped(line)) - 1
+            count -= remaining + 1
+            line, row = line + 1, 0
+        return line, row
+
+    def _backward(self, position: Tuple[int, int], count: int) -> Tuple[int, int]:
+        line, row = position
+        while count > 0:
+            if row >= count:
+                return line, row - count
+            if line == 0:
+                return 0, 0
+            count -= row + 1
+            line = line - 1
+            row = len(self._wrapped(line)) - 1
+        return line, row
+
+    def _last_top(self, height: int) -> Tuple[int, int]:
+        """Highest position at which the last screen is still full."""
+
+        last = len(self.lines) - 1
+        return self._backward((last, len(self._wrapped(last)) - 1), height - 1)
+
+    def _scroll(self, count: int, height: int) -> None:
+        if count > 0:
+            target = self._forward(self.top, count)
+            self.top = min(target, max(self.top, self._last_top(height)))
+        else:
+            self.top = self._backward(self.top, -count)
+
+    # -- drawing ---------------------------------------------------------
+    def _draw(self, height: int) -> None:
+        out = ["\033[H"]
+        line, row = self.top
+        shown = 0
+        while shown < height and line < len(self.lines):
+            rows = self._wrapped(line)
+            for text in rows[row : row + height - shown]:
+                out.append(f"{text}\033[K\n")
+                shown += 1
+            line, row = line + 1, 0
+        out.append("\033[K\n" * (height - shown))
+        status = self.message or (
+            f"{self.hint}  ·  ligne {self.top[0] + 1}/{len(self.lines)}"
+            "  ·  ↑↓ Pg↑ Pg↓  / rechercher"
+        )
+        out.append(f"{BOLD}{status[: self._width - 1]}{RESET}\033[K")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+    # -- search ----------------------------------------------------------
+    def _read_query(self, keys: KeySession) -> str | None:
+        query = ""
+        while True:
+            sys.stdout.write(f"\r\033[K/{query}")
+            sys.stdout.flush()
+            event = keys.read(coalesce=False)
+            if event is None or event.key == "ESC":
+                return None
+            if event.key == "ENTER":
+                return query
+            if event.key == "BACKSPACE":
+                query = query[:-1]
+            elif len(event.key) == 1 and event.key.isprintable():
+                query += event.key
+
+    def _search(self, start: int) -> None:
+        needle = self.query.lower()
+        count = len(self.lines)
+        for offset in range(count):
+            index = (start + offset) % count
+            if needle in _ANSI.sub("", self.lines[index]).lower():
+                self.top = (index, 0)
+                if index < start:
+                    self.message = f"Retour au début : « {self.query} »"
+                return
+        self.message = f"Introuvable : « {self.query} »"
+
+    # -- main loop -------------------------------------------------------
+    def run(self) -> None:
+        sys.stdout.write("\033[?1049h\033[?25l")
         try:
-            pydoc.pager(decorated)
-        except Exception:
-            print(decorated)
+            with key_session() as keys:
+                assert keys is not None
+                while True:
+                    height = self._resize()
+                    self._draw(height)
+                    self.message = ""
+                    event = keys.read()
+                    key = event.key
+                    if key.lower() == self.exit_letter or key == "ESC":
+                        return
+                    if key in ("DOWN", "j", "ENTER"):
+                        self._scroll(event.repeat, height)
+                    elif key in ("UP", "k"):
+                        self._scroll(-event.repeat, height)
+                    elif key in ("PAGE_DOWN", " ", "f"):
+                        self._scroll(height * event.repeat, height)
+                    elif key in ("PAGE_UP", "b"):
+                        self._scroll(-height * event.repeat, height)
+                    elif key in ("HOME", "g"):
+                        self.top = (0, 0)
+                    elif key in ("END", "G"):
+                        self.top = self._last_top(height)
+                    elif key == "/":
+                        query = self._read_query(keys)
+                        if query:
+                            self.query = query
+                            self._search(self.top[0] + 1)
+                    elif key == "n" and self.query:
+                        self._search(self.top[0] + 1)
+        finally:
+            sys.stdout.write("\033[?25h\033[?1049l")
+            sys.stdout.flush()
 
 
 def _scroll_text_windows(text: str, exit_letter: str, hint: str) -> None:  # pragma: no cover - Windows only
@@ -180,42 +381,41 @@ def ask_choice_with_navigation(
         return _handle_text_answer(input("Votre réponse (lettre) : "))
 
     layout = _pick_layout(choices, option_letters, horizontal_threshold)
+    block = _ChoiceBlock(option_letters, choices, layout)
     selected = 0
-    previous_lines = 0
-
-    while True:
-        lines = _render_choices(option_letters, choices, selected=selected, layout=layout)
-        _rewrite_block(lines, previous_lines)
-        previous_lines = len(lines)
-
-        key = _read_key()
-        if key is None:
-            return _handle_text_answer(input("Votre réponse (lettre) : "))
-
-        if key in exit_letters:
-            return None, option_letters, True
+    _rewrite_block(block.lines(selected), 0)
 
-        if key in option_letters:
-            # Keep keyboard-letter shortcuts, but move the visual highlight to
-            # the corresponding option before validating so the selected box
-            # never appears stuck on the first choice.
-            selected = option_letters.index(key)
-            lines = _render_choices(option_letters, choices, selected=selected, layout=layout)
-            _rewrite_block(lines, previous_lines)
-            return selected, option_letters, False
-        if key == "ENTER":
-            return selected, option_letters, False
+    def _move_selection(new: int) -> None:
+        nonlocal selected
+        if new != selected:
+            block.redraw(selected, new)
+            selected = new
 
-        if layout == "horizontal":
-            if key == "RIGHT":
-                selected = (selected + 1) % len(choices)
-            elif key == "LEFT":
-                selected = (selected - 1) % len(choices)
-        else:
-            if key == "DOWN":
-                selected = (selected + 1) % len(choices)
-            elif key == "UP":
-                selected = (selected - 1) % len(choices)
+    with key_session() as keys:
+        while True:
+            event = _read_key(keys)
+            if event is None:
+                return _handle_text_answer(input("Votre réponse (lettre) : "))
+            key = event.key
+
+            if key in exit_letters:
+                return None, option_letters, True
+
+            if key in option_letters:
+                # Keep keyboard-letter shortcuts, but move the visual highlight to
+                # the corresponding option before validating so the selected box
+                # never appears stuck on the first choice.
+                _move_selection(option_letters.index(key))
+                return selected, option_letters, False
+            if key == "ENTER":
+                return selected, option_letters, False
+
+            # A held arrow arrives as one event with a repeat count.
+            forward, backward = ("RIGHT", "LEFT") if layout == "horizontal" else ("DOWN", "UP")
+            if key == forward:
+                _move_selection((selected + event.repeat) % len(choices))
+            elif key == backward:
+                _move_selection((selected - event.repeat) % len(choices))
 
 
 def _pick_layout(
@@ -255,6 +455,7 @@ _BORDER_STYLES = {
 }
 
 
+@lru_cache(maxsize=256)
 def _build_box(choice_text: str, label: str, *, border: str = "single") -> _Box:
     border_chars = _BORDER_STYLES.get(border, _BORDER_STYLES["single"])
     raw_lines = choice_text.splitlines() or [""]
@@ -271,6 +472,81 @@ def _build_box(choice_text: str, label: str, *, border: str = "single") -> _Box:
     return _Box(box_lines)
 
 
+_CHOICE_HINT = "Utilise les flèches ou tape la lettre puis Entrée. Tape 'q' pour revenir au menu."
+
+
+class _ChoiceBlock:
+    """The boxes of one question, built once, and where each one is printed.
+
+    Both variants of every box (single border, and double border
+    highlighted) are prepared up front.  After the whole block has been
+    printed, :meth:`redraw` only rewrites the two boxes whose selection
+    state changed, moving the cursor up into the block and back.
+    """
+
+    def __init__(self, option_letters: Sequence[str], choices: Sequence[str], layout: str) -> None:
+        self.layout = layout
+        plain = [_build_box(str(choice), letter) for choice, letter in zip(choices, option_letters)]
+        double = [
+            _build_box(str(choice), letter, border="double")
+            for choice, letter in zip(choices, option_letters)
+        ]
+        self.origins: List[tuple[int, int]] = []  # (row in block, column)
+        if layout == "horizontal":
+            height = max(len(box.lines) for box in plain)
+            self._plain = [box.lines + [" " * box.width] * (height - len(box.lines)) for box in plain]
+            self._double = [box.lines + [" " * box.width] * (height - len(box.lines)) for box in double]
+            column = 0
+            for box in plain:
+                self.origins.append((1, column))
+                column += box.width + 2
+            self.height = 1 + height + 1
+        else:
+            self._plain = [box.lines for box in plain]
+            self._double = [box.lines for box in double]
+            row = 1
+            for box in plain:
+                self.origins.append((row, 0))
+                row += len(box.lines) + 1
+            self.height = row
+        self._double = [[f"{CYAN}{BOLD}{line}{RESET}" for line in box] for box in self._double]
+
+    def box(self, index: int, selected: bool) -> List[str]:
+        return self._double[index] if selected else self._plain[index]
+
+    def lines(self, selected: int) -> List[str]:
+        """Full block with ``selected`` highlighted (-1 for none)."""
+
+        boxes = [self.box(idx, idx == selected) for idx in range(len(self._plain))]
+        lines: List[str] = [_CHOICE_HINT]
+        if self.layout == "horizontal":
+            for row in range(len(boxes[0])):
+                lines.append("  ".join(box[row] for box in boxes))
+            lines.append("")
+        else:
+            for box in boxes:
+                lines.extend(box)
+                lines.append("")
+        return lines
+
+    def redraw(self, old: int, new: int) -> None:
+        """Move the highlight from ``old`` to ``new`` (cursor below the block)."""
+
+        if self.height >= shutil.get_terminal_size().lines:
+            # The top of the block has scrolled away: print it again.
+            _rewrite_block(self.lines(new), self.height)
+            return
+        parts: List[str] = []
+        for index in (old, new):
+            row, column = self.origins[index]
+            box = self.box(index, index == new)
+            parts.append(f"\033[{self.height - row}A")
+            parts.extend(f"\033[{column + 1}G{line}\n" for line in box)
+            parts.append(f"\033[{self.height - row - len(box)}B")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+
+
 def _render_choices(
     option_letters: Sequence[str],
     choices: Sequence[str],
@@ -278,41 +554,7 @@ def _render_choices(
     selected: int,
     layout: str,
 ) -> List[str]:
-    boxes = [
-        _build_box(
-            str(choice),
-            letter,
-            border="double" if idx == selected else "single",
-        )
-        for idx, (choice, letter) in enumerate(zip(choices, option_letters))
-    ]
-    highlight = lambda line: f"{CYAN}{BOLD}{line}{RESET}"
-    lines: List[str] = [
-        "Utilise les flèches ou tape la lettre puis Entrée. Tape 'q' pour revenir au menu."
-    ]
-
-    if layout == "horizontal":
-        max_height = max(len(box.lines) for box in boxes)
-        normalised: List[List[str]] = []
-        for idx, box in enumerate(boxes):
-            padded = box.lines + [" " * box.width] * (max_height - len(box.lines))
-            if idx == selected:
-                padded = [highlight(line) for line in padded]
-            normalised.append(padded)
-
-        for row in range(max_height):
-            row_chunks = [box[row] for box in normalised]
-            lines.append("  ".join(row_chunks))
-        lines.append("")
-    else:
-        for idx, box in enumerate(boxes):
-            content = box.lines
-            if idx == selected:
-                content = [highlight(line) for line in content]
-            lines.extend(content)
-            lines.append("")
-
-    return lines
+    return _ChoiceBlock(option_letters, choices, layout).lines(selected)
 
 
 def _rewrite_block(lines: Sequence[str], previous_lines: int) -> None:
@@ -323,37 +565,15 @@ def _rewrite_block(lines: Sequence[str], previous_lines: int) -> None:
         print(line)
 
 
-def _read_key() -> str | None:
-    if os.name == "nt" and msvcrt is not None:  # pragma: no cover - Windows
-        key = msvcrt.getwch()
-        if key in ("\r", "\n"):
-            return "ENTER"
-        if key in ("\x00", "\xe0"):
-            arrow = msvcrt.getwch()
-            return {"K": "LEFT", "M": "RIGHT", "H": "UP", "P": "DOWN"}.get(arrow)
-        return key.lower()
+def _read_key(keys: KeySession | None) -> KeyEvent | None:
+    """Next key from the shared session, with letters folded to lower case."""
 
-    if termios is None or tty is None or not sys.stdin.isatty():
+    if keys is None:
         return None
-
-    fd = sys.stdin.fileno()
-    old = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        char = sys.stdin.read(1)
-        if char in ("\r", "\n"):
-            return "ENTER"
-        if char == "\x1b":
-            seq = sys.stdin.read(2)
-            return {
-                "[A": "UP",
-                "[B": "DOWN",
-                "[C": "RIGHT",
-                "[D": "LEFT",
-            }.get(seq)
-        return char.lower()
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    event = keys.read()
+    if event is None or len(event.key) != 1:
+        return event
+    return KeyEvent(event.key.lower(), event.repeat)
 
 
 class CheckboxPrompt: